@@ -0,0 +1,117 @@
+"""Read endpoints with single-statement reads in autocommit mode against explicit transactions.
+
+Runs the use cases behind the read endpoints against the configured database, once with
+every unit of work wrapped in `BEGIN`/`COMMIT` the way reads used to run, and once with
+single-statement reads in autocommit mode. Reports the transaction control round trips
+each request needs and its mean latency, for both repository backends. The database must
+contain at least one article.
+
+Usage:
+    python -m benchmarks.autocommit [--number N]
+"""
+
+import argparse
+import asyncio
+import time
+import typing as t
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from conduit.config import db_url
+from conduit.core.entities.article import ArticleFilter
+from conduit.core.entities.unit_of_work import UnitOfWork, UnitOfWorkContext
+from conduit.core.entities.user import AuthToken
+from conduit.core.use_cases.articles.feed import FeedArticlesInput, FeedArticlesUseCase
+from conduit.core.use_cases.articles.get import GetArticleInput, GetArticleUseCase
+from conduit.core.use_cases.articles.list import ListArticlesInput, ListArticlesUseCase
+from conduit.core.use_cases.comments.get_from_article import (
+    GetCommentsFromArticleInput,
+    GetCommentsFromArticleUseCase,
+)
+from conduit.core.use_cases.profiles.get import GetProfileInput, GetProfileUseCase
+from conduit.core.use_cases.tags.popular import ListPopularTagsInput, ListPopularTagsUseCase
+from conduit.impl.asyncpg.unit_of_work import AsyncpgUnitOfWork
+from conduit.impl.unit_of_work import PostgresqlUnitOfWork
+
+Scenario = t.Callable[[UnitOfWork], t.Awaitable[object]]
+
+
+class CountingUnitOfWork(UnitOfWork):
+    """Counts the transactions started, optionally running every unit of work in one."""
+
+    def __init__(self, unit_of_work: UnitOfWork, *, transactional: bool) -> None:
+        self._unit_of_work = unit_of_work
+        self._transactional = transactional
+        self.transactions = 0
+
+    def begin(self, *, read_only: bool = False, autocommit: bool = False) -> t.AsyncContextManager[UnitOfWorkContext]:
+        autocommit = autocommit and not self._transactional
+        if not autocommit:
+            self.transactions += 1
+        return self._unit_of_work.begin(read_only=read_only, autocommit=autocommit)
+
+
+async def measure(
+    unit_of_work: UnitOfWork, scenario: Scenario, number: int, *, transactional: bool
+) -> tuple[int, float]:
+    """Transactions per request and the mean duration of a request, in seconds."""
+    counting = CountingUnitOfWork(unit_of_work, transactional=transactional)
+    for _ in range(min(number, 50)):
+        await scenario(counting)
+    counting.transactions = 0
+    t0 = time.perf_counter()
+    for _ in range(number):
+        await scenario(counting)
+    return counting.transactions // number, (time.perf_counter() - t0) / number
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=300, help="iterations per scenario")
+    args = parser.parse_args()
+
+    engine = create_async_engine(db_url())
+    asyncpg_unit_of_work = AsyncpgUnitOfWork(db_url(driver="postgresql").render_as_string(hide_password=False))
+    backends: dict[str, UnitOfWork] = {
+        "sqlalchemy": PostgresqlUnitOfWork(engine),
+        "asyncpg": asyncpg_unit_of_work,
+    }
+    async with backends["sqlalchemy"].begin(read_only=True) as uow:
+        articles = await uow.articles.get_many(ArticleFilter(), limit=1, offset=0)
+        author = await uow.users.get_by_id(articles[0].author_id) if articles else None
+    if not articles or author is None:
+        raise SystemExit("the database has no articles, create some before running the benchmark")
+    article = articles[0]
+    # Requests are made by the article's author, so that the follow and favorite lookups run.
+    token, user_id = AuthToken(""), author.id
+
+    scenarios: dict[str, Scenario] = {
+        "get article": lambda uow: GetArticleUseCase(uow).execute(
+            GetArticleInput(token=token, user_id=user_id, slug=article.slug)
+        ),
+        "list articles": lambda uow: ListArticlesUseCase(uow).execute(ListArticlesInput(token=token, user_id=user_id)),
+        "feed": lambda uow: FeedArticlesUseCase(uow).execute(FeedArticlesInput(token=token, user_id=user_id)),
+        "get profile": lambda uow: GetProfileUseCase(uow).execute(
+            GetProfileInput(token=token, user_id=user_id, username=author.username)
+        ),
+        "get comments": lambda uow: GetCommentsFromArticleUseCase(uow).execute(
+            GetCommentsFromArticleInput(token=token, user_id=user_id, article_slug=article.slug)
+        ),
+        "popular tags": lambda uow: ListPopularTagsUseCase(uow).execute(ListPopularTagsInput()),
+    }
+    print(f"{'backend':<12}{'scenario':<16}{'BEGIN/COMMIT before':>21}{'after':>7}{'ms before':>11}{'ms after':>10}")
+    for backend, unit_of_work in backends.items():
+        for name, scenario in scenarios.items():
+            transactions_before, time_before = await measure(unit_of_work, scenario, args.number, transactional=True)
+            transactions_after, time_after = await measure(unit_of_work, scenario, args.number, transactional=False)
+            print(
+                f"{backend:<12}{name:<16}{transactions_before * 2:>21}{transactions_after * 2:>7}"
+                f"{time_before * 1e3:>11.3f}{time_after * 1e3:>10.3f}"
+            )
+
+    await engine.dispose()
+    await asyncpg_unit_of_work.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
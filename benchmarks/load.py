@@ -0,0 +1,454 @@
+"""Requests per second and latencies of a running server under a realistic traffic mix.
+
+An aiohttp client, in its own process, replays a weighted mix of operations on every
+`/api/v1` route: anonymous listings, tag and author pages, the feed, article reads,
+search, favorite and follow toggles, comments, article writes, sign-ins and sign-ups.
+Concurrency is ramped up in stages, and each stage reports the latency percentiles of
+every route, named like in `create_app`, and the error rate.
+
+The server is the one at `--url`, or a `python -m conduit` worker started with the
+environment of this process when `--spawn` is given, e.g.:
+    CONDUIT_REPOSITORY_BACKEND=memory python -m benchmarks.load --spawn --concurrency 1,8,32
+    python -m benchmarks.load --url http://localhost:8080 --mix get_article=40,sign_in=0 --output load.json
+
+Usage:
+    python -m benchmarks.load [--url URL] [--spawn] [--concurrency N,N,...] [--duration SECONDS]
+        [--warmup SECONDS] [--users N] [--mix OPERATION=WEIGHT,...] [--seed N] [--output FILE]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import typing as t
+import uuid
+from dataclasses import dataclass, field
+
+import aiohttp
+from yarl import URL
+
+PASSWORD: t.Final = "load-password"
+TAGS: t.Final = [f"tag{i}" for i in range(12)]
+WORDS: t.Final = ["python", "asyncio", "postgres", "latency", "cache", "index", "profile", "queue", "socket", "worker"]
+ARTICLES_PER_USER: t.Final = 5
+FOLLOWED_PER_USER: t.Final = 4
+PERCENTILES: t.Final = (50, 90, 99)
+
+
+class RouteStats:
+    """Latencies in seconds and errors of the requests of one route."""
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.errors = 0
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the latencies."""
+        ordered = sorted(self.latencies)
+        return ordered[max(math.ceil(len(ordered) * p / 100) - 1, 0)] if ordered else 0.0
+
+
+@dataclass
+class Stats:
+    routes: dict[str, RouteStats] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def record(self, route: str, latency: float, ok: bool) -> None:
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteStats()
+        stats.latencies.append(latency)
+        if not ok:
+            stats.errors += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(len(stats.latencies) for stats in self.routes.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.routes.values())
+
+
+class Client:
+    """Sends requests and records them under the name of their route."""
+
+    def __init__(self, session: aiohttp.ClientSession, stats: Stats) -> None:
+        self._session = session
+        self.stats = stats
+
+    async def call(
+        self,
+        route: str,
+        method: str,
+        path: str,
+        *,
+        token: str | None = None,
+        expected: t.Container[int] = (200,),
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """Returns the decoded response, or `None` if the request failed."""
+        headers = {"Authorization": f"Token {token}"} if token is not None else None
+        t0 = time.perf_counter()
+        try:
+            async with self._session.request(method, path, headers=headers, **kwargs) as response:
+                body = await response.read()
+                ok = response.status in expected
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            body, ok = b"", False
+        self.stats.record(route, time.perf_counter() - t0, ok)
+        return json.loads(body) if ok and body else None
+
+
+@dataclass
+class Account:
+    username: str
+    email: str
+    token: str
+
+
+@dataclass
+class Fixture:
+    """Data created before the load, shared by all operations."""
+
+    run_id: str
+    accounts: list[Account]
+    slugs: list[str]
+    counter: t.Iterator[int] = field(default_factory=itertools.count)
+
+
+Operation = t.Callable[[Client, Fixture, random.Random], t.Awaitable[None]]
+
+
+def title(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=4)).capitalize()
+
+
+async def list_articles(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    await client.call("list_articles", "GET", "/api/v1/articles", params={"limit": 20, "offset": rng.randrange(40)})
+
+
+async def list_articles_by_tag(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    await client.call("list_articles", "GET", "/api/v1/articles", params={"tag": rng.choice(TAGS), "limit": 20})
+
+
+async def list_articles_by_author(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    author = rng.choice(fixture.accounts)
+    await client.call("list_articles", "GET", "/api/v1/articles", params={"author": author.username})
+
+
+async def list_favorite_articles(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user = rng.choice(fixture.accounts)
+    await client.call("list_articles", "GET", "/api/v1/articles", params={"favorited": user.username})
+
+
+async def feed_articles(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user = rng.choice(fixture.accounts)
+    await client.call("feed_articles", "GET", "/api/v1/articles/feed", token=user.token, params={"limit": 20})
+
+
+async def search_articles(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    query = " ".join(rng.sample(WORDS, k=rng.randint(1, 2)))
+    await client.call("search_articles", "GET", "/api/v1/articles/search", params={"q": query, "limit": 20})
+
+
+async def get_article(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    await client.call("get_article", "GET", f"/api/v1/articles/{rng.choice(fixture.slugs)}")
+
+
+async def get_comments(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    await client.call("get_comments_from_article", "GET", f"/api/v1/articles/{rng.choice(fixture.slugs)}/comments")
+
+
+async def toggle_favorite(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user, path = rng.choice(fixture.accounts), f"/api/v1/articles/{rng.choice(fixture.slugs)}/favorite"
+    await client.call("favorite_article", "POST", path, token=user.token)
+    await client.call("unfavorite_article", "DELETE", path, token=user.token)
+
+
+async def toggle_follow(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user, followed = rng.sample(fixture.accounts, k=2)
+    path = f"/api/v1/profiles/{followed.username}/follow"
+    await client.call("follow", "POST", path, token=user.token)
+    await client.call("unfollow", "DELETE", path, token=user.token)
+
+
+async def get_profile(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user, profile = rng.sample(fixture.accounts, k=2)
+    await client.call("get_profile", "GET", f"/api/v1/profiles/{profile.username}", token=user.token)
+
+
+async def comment(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user, path = rng.choice(fixture.accounts), f"/api/v1/articles/{rng.choice(fixture.slugs)}/comments"
+    data = {"comment": {"body": title(rng)}}
+    created = await client.call("add_comment_to_article", "POST", path, token=user.token, json=data, expected=(201,))
+    if created is not None:
+        await client.call("get_comments_from_article", "GET", path, token=user.token)
+        comment_id = created["comment"]["id"]
+        await client.call("delete_comment", "DELETE", f"{path}/{comment_id}", token=user.token, expected=(204,))
+
+
+async def write_article(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user = rng.choice(fixture.accounts)
+    data = {"article": {"title": title(rng), "description": title(rng), "body": title(rng), "tagList": [TAGS[0]]}}
+    created = await client.call(
+        "create_article", "POST", "/api/v1/articles", token=user.token, json=data, expected=(201,)
+    )
+    if created is not None:
+        path = f"/api/v1/articles/{created['article']['slug']}"
+        await client.call("update_article", "PUT", path, token=user.token, json={"article": {"body": title(rng)}})
+        await client.call("delete_article", "DELETE", path, token=user.token, expected=(204,))
+
+
+async def sign_in(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user = rng.choice(fixture.accounts)
+    await client.call(
+        "sign_in", "POST", "/api/v1/users/login", json={"user": {"email": user.email, "password": PASSWORD}}
+    )
+
+
+async def current_user(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    user = rng.choice(fixture.accounts)
+    await client.call("get_current_user", "GET", "/api/v1/user", token=user.token)
+    if rng.random() < 0.2:
+        await client.call(
+            "update_current_user", "PUT", "/api/v1/user", token=user.token, json={"user": {"bio": title(rng)}}
+        )
+
+
+async def sign_up(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    await create_account(client, f"load{fixture.run_id}n{next(fixture.counter)}")
+
+
+async def list_tags(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    params = {"sort": "popular", "limit": 10} if rng.random() < 0.5 else {}
+    await client.call("list_tags", "GET", "/api/v1/tags", params=params)
+
+
+async def healthcheck(client: Client, fixture: Fixture, rng: random.Random) -> None:
+    await client.call("healthcheck", "GET", "/api/v1/healthcheck")
+
+
+# Operations and their default weights: mostly anonymous reads, like the traffic of a blog.
+OPERATIONS: t.Final[dict[str, tuple[Operation, float]]] = {
+    "list_articles": (list_articles, 20),
+    "list_articles_by_tag": (list_articles_by_tag, 10),
+    "list_articles_by_author": (list_articles_by_author, 4),
+    "list_favorite_articles": (list_favorite_articles, 2),
+    "feed_articles": (feed_articles, 8),
+    "search_articles": (search_articles, 4),
+    "get_article": (get_article, 20),
+    "get_comments": (get_comments, 8),
+    "get_profile": (get_profile, 4),
+    "list_tags": (list_tags, 6),
+    "toggle_favorite": (toggle_favorite, 4),
+    "toggle_follow": (toggle_follow, 1),
+    "comment": (comment, 3),
+    "write_article": (write_article, 1),
+    "current_user": (current_user, 2),
+    "sign_in": (sign_in, 1),
+    "sign_up": (sign_up, 0.5),
+    "healthcheck": (healthcheck, 0.5),
+}
+
+
+async def create_account(client: Client, username: str) -> Account | None:
+    email = f"{username}@example.com"
+    data = {"user": {"username": username, "email": email, "password": PASSWORD}}
+    created = await client.call("sign_up", "POST", "/api/v1/users", json=data, expected=(201,))
+    return Account(username, email, created["user"]["token"]) if created is not None else None
+
+
+async def create_fixture(session: aiohttp.ClientSession, users: int, rng: random.Random) -> Fixture:
+    """Signs up users who follow each other and write tagged articles."""
+    client = Client(session, Stats())
+    run_id = uuid.uuid4().hex[:8]
+    accounts = [
+        account
+        for account in await asyncio.gather(*(create_account(client, f"load{run_id}u{i}") for i in range(users)))
+        if account is not None
+    ]
+    if len(accounts) < 2:
+        raise SystemExit("could not sign up the users of the fixture")
+
+    async def populate(index: int, account: Account) -> list[str]:
+        for k in range(1, FOLLOWED_PER_USER + 1):
+            followed = accounts[(index + k) % len(accounts)]
+            await client.call("follow", "POST", f"/api/v1/profiles/{followed.username}/follow", token=account.token)
+        slugs = []
+        for _ in range(ARTICLES_PER_USER):
+            data = {
+                "article": {
+                    "title": title(rng),
+                    "description": title(rng),
+                    "body": " ".join(rng.choices(WORDS, k=60)),
+                    "tagList": rng.sample(TAGS, k=3),
+                }
+            }
+            created = await client.call(
+                "create_article", "POST", "/api/v1/articles", token=account.token, json=data, expected=(201,)
+            )
+            if created is not None:
+                slugs.append(created["article"]["slug"])
+        return slugs
+
+    slugs = list(itertools.chain(*await asyncio.gather(*(populate(i, a) for i, a in enumerate(accounts)))))
+    if not slugs:
+        raise SystemExit("could not create the articles of the fixture")
+    return Fixture(run_id, accounts, slugs)
+
+
+async def run_stage(
+    session: aiohttp.ClientSession,
+    fixture: Fixture,
+    mix: dict[str, float],
+    concurrency: int,
+    duration: float,
+    seed: int,
+) -> Stats:
+    """Runs `concurrency` clients, each sending its next operation as soon as the previous one is done."""
+    client = Client(session, Stats())
+    operations = [OPERATIONS[name][0] for name in mix]
+    weights = list(mix.values())
+    deadline = time.perf_counter() + duration
+
+    async def worker(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            operation = rng.choices(operations, weights)[0]
+            await operation(client, fixture, rng)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(seed * 1000 + n)) for n in range(concurrency)))
+    client.stats.elapsed = time.perf_counter() - t0
+    return client.stats
+
+
+def report(concurrency: int, stats: Stats) -> dict[str, t.Any]:
+    """Prints the results of a stage and returns them for the JSON output."""
+    rps = stats.requests / stats.elapsed
+    error_rate = stats.errors / stats.requests if stats.requests else 0.0
+    print(f"\nconcurrency {concurrency}: {stats.requests} requests, {rps:.0f} req/s, {error_rate:.2%} errors")
+    print(
+        f"{'route':<28}{'requests':>10}{'errors':>8}"
+        + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES)
+        + f"{'max ms':>10}"
+    )
+    routes = {}
+    for route, route_stats in sorted(stats.routes.items()):
+        percentiles = {f"p{p}": route_stats.percentile(p) * 1000 for p in PERCENTILES}
+        maximum = max(route_stats.latencies) * 1000
+        print(
+            f"{route:<28}{len(route_stats.latencies):>10}{route_stats.errors:>8}"
+            + "".join(f"{value:>10.1f}" for value in percentiles.values())
+            + f"{maximum:>10.1f}"
+        )
+        routes[route] = {
+            "requests": len(route_stats.latencies),
+            "errors": route_stats.errors,
+            **{name: round(value, 3) for name, value in percentiles.items()},
+            "max": round(maximum, 3),
+        }
+    return {
+        "concurrency": concurrency,
+        "elapsed": round(stats.elapsed, 3),
+        "requests": stats.requests,
+        "requests_per_sec": round(rps, 1),
+        "error_rate": round(error_rate, 5),
+        "routes": routes,
+    }
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Default weights overridden by `name=weight` pairs, operations with a zero weight are dropped."""
+    mix = {name: weight for name, (_, weight) in OPERATIONS.items()}
+    for pair in filter(None, value.split(",")):
+        name, _, weight = pair.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}, expected one of {', '.join(OPERATIONS)}")
+        mix[name] = float(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+async def wait_until_up(session: aiohttp.ClientSession, server: subprocess.Popen[bytes], timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"the server exited with code {server.returncode}")
+        try:
+            async with session.get("/api/v1/healthcheck") as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.2)
+    raise SystemExit("the server did not start in time")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8080", help="base URL of the server")
+    parser.add_argument("--spawn", action="store_true", help="start a `python -m conduit` worker listening on the URL")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[1, 4, 16, 64],
+        help="concurrent clients of each stage, ramped up in this order",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of each stage")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds of unreported load before the first stage")
+    parser.add_argument("--users", type=int, default=20, help="users of the fixture, each writes a few articles")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(""), help="weights of operations, e.g. sign_in=0")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random choices")
+    parser.add_argument("--output", help="save the results to this JSON file")
+    args = parser.parse_args()
+
+    url = URL(args.url)
+    server = None
+    if args.spawn:
+        env = {**os.environ, "CONDUIT_LISTEN_PORT": str(url.port)}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "conduit"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    timeout = aiohttp.ClientTimeout(total=30)
+    connector = aiohttp.TCPConnector(limit=max(args.concurrency))
+    try:
+        async with aiohttp.ClientSession(url, connector=connector, timeout=timeout) as session:
+            if server is not None:
+                await wait_until_up(session, server, timeout=30)
+            fixture = await create_fixture(session, args.users, random.Random(args.seed))
+            print(f"{len(fixture.accounts)} users, {len(fixture.slugs)} articles, mix: {args.mix}")
+            if args.warmup > 0:
+                await run_stage(session, fixture, args.mix, args.concurrency[0], args.warmup, args.seed)
+            stages = []
+            for stage, concurrency in enumerate(args.concurrency, start=1):
+                stats = await run_stage(session, fixture, args.mix, concurrency, args.duration, args.seed + stage)
+                stages.append(report(concurrency, stats))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "url": str(url),
+                    "duration": args.duration,
+                    "mix": args.mix,
+                    "stages": stages,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
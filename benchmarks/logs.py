@@ -0,0 +1,107 @@
+"""Logging cost per request, for every logging configuration of the server.
+
+Runs the `list_articles` and `get_article` use cases on the in-memory repositories of
+`benchmarks.use_cases`, each followed by the access line of `logging_middleware`, and
+reports the time per request added by logging compared with logging disabled. Lines
+are written to /dev/null. Every configuration runs in its own process, because
+structlog caches loggers on first use.
+
+Usage:
+    python -m benchmarks.logs [--number N]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import typing as t
+
+import structlog
+from dependency_injector.providers import Object
+
+from benchmarks.use_cases import Sha256PasswordHasher, create_dataset
+from conduit.container import Dependencies, UseCases
+from conduit.core.entities.unit_of_work import DEBUG_SAMPLED_VAR, REQUEST_ID_VAR, ROUTE_VAR
+from conduit.core.use_cases.articles.get import GetArticleInput
+from conduit.core.use_cases.articles.list import ListArticlesInput
+from conduit.impl.memory.unit_of_work import MemoryUnitOfWork
+from conduit.log import configure_logging
+
+LOG = structlog.get_logger(__name__)
+
+# Mode, level and fraction of requests with debug lines, by configuration name.
+CONFIGURATIONS: t.Final = {
+    "disabled": ("fast", "critical", 0.0),
+    "verbose, debug": ("verbose", "debug", 0.0),
+    "verbose, info": ("verbose", "info", 0.0),
+    "fast, debug": ("fast", "debug", 0.0),
+    "fast, info": ("fast", "info", 0.0),
+    "fast, info, 1% debug": ("fast", "info", 0.01),
+}
+
+
+async def run(name: str, number: int) -> float:
+    """Seconds per request with the given configuration."""
+    mode, level, debug_rate = CONFIGURATIONS[name]
+    output = open("/dev/null", "w")
+    writer = configure_logging(mode, level, debug_sampling=debug_rate > 0, output=output)
+    deps = Dependencies()
+    deps.unit_of_work.override(Object(MemoryUnitOfWork()))
+    deps.password_hasher.override(Object(Sha256PasswordHasher()))
+    use_cases = UseCases(deps=deps)
+    dataset = await create_dataset(deps)
+    requests: list[tuple[str, t.Any, t.Any]] = [
+        ("list_articles", use_cases.list_articles(), ListArticlesInput(token=dataset.reader_token, user_id=None)),
+        (
+            "get_article",
+            use_cases.get_article(),
+            GetArticleInput(token=dataset.reader_token, user_id=None, slug=dataset.slug),
+        ),
+    ]
+    rng = random.Random(0)
+
+    async def request(i: int) -> None:
+        route, use_case, input = requests[i % len(requests)]
+        REQUEST_ID_VAR.set(f"{i:032x}")
+        ROUTE_VAR.set(route)
+        DEBUG_SAMPLED_VAR.set(rng.random() < debug_rate)
+        log = LOG.bind(path=f"/api/v1/{route}", method="GET", query="")
+        log.debug("handling HTTP request")
+        started = time.perf_counter()
+        await use_case.execute(input)
+        log.info("HTTP request processed", status=200, duration=round(time.perf_counter() - started, 3))
+
+    for i in range(100):
+        await request(i)
+    t0 = time.perf_counter()
+    for i in range(number):
+        await request(i)
+    if writer is not None:
+        # Lines still queued are part of the cost.
+        writer.close()
+    return (time.perf_counter() - t0) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=5000, help="requests per configuration")
+    parser.add_argument("--run", choices=CONFIGURATIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run:
+        print(json.dumps(asyncio.run(run(args.run, args.number))))
+        return
+
+    results = {}
+    for name in CONFIGURATIONS:
+        command = [sys.executable, "-W", "ignore", "-m", "benchmarks.logs", "--number", str(args.number), "--run", name]
+        results[name] = json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout)
+    print(f"{'configuration':<24}{'µs/request':>12}{'logging µs':>12}")
+    for name, seconds in results.items():
+        print(f"{name:<24}{seconds * 1e6:>12.1f}{(seconds - results['disabled']) * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Side-by-side comparison of the SQLAlchemy and asyncpg repository backends.
+
+Runs the repository calls of the read-heavy endpoints against the configured database
+and reports the mean latency of each scenario for both backends. The database must
+contain at least one article.
+
+Usage:
+    python -m benchmarks.repositories [--number N]
+"""
+
+import argparse
+import asyncio
+import time
+import typing as t
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from conduit.config import db_url
+from conduit.core.entities.article import ArticleFilter, ArticleSlug
+from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.impl.asyncpg.unit_of_work import AsyncpgUnitOfWork
+from conduit.impl.unit_of_work import PostgresqlUnitOfWork
+
+Scenario = t.Callable[[UnitOfWork], t.Awaitable[None]]
+
+
+def get_article(slug: ArticleSlug) -> Scenario:
+    async def run(unit_of_work: UnitOfWork) -> None:
+        async with unit_of_work.begin() as uow:
+            article = await uow.articles.get_by_slug(slug)
+            assert article is not None
+            await uow.users.get_by_id(article.author_id)
+            await uow.tags.get_for_article(article.id)
+            await uow.favorites.count(article.id)
+
+    return run
+
+
+async def list_articles(unit_of_work: UnitOfWork) -> None:
+    async with unit_of_work.begin() as uow:
+        articles = await uow.articles.get_many(ArticleFilter(), limit=20, offset=0)
+        await uow.articles.count(ArticleFilter())
+        article_ids = [article.id for article in articles]
+        await uow.users.get_by_ids({article.author_id for article in articles})
+        await uow.tags.get_for_articles(article_ids)
+        await uow.favorites.count_many(article_ids)
+
+
+async def list_tags(unit_of_work: UnitOfWork) -> None:
+    async with unit_of_work.begin() as uow:
+        await uow.tags.get_popular(limit=20)
+
+
+async def measure(unit_of_work: UnitOfWork, scenario: Scenario, number: int) -> float:
+    for _ in range(min(number, 50)):
+        await scenario(unit_of_work)
+    t0 = time.perf_counter()
+    for _ in range(number):
+        await scenario(unit_of_work)
+    return (time.perf_counter() - t0) / number
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=500, help="iterations per scenario")
+    args = parser.parse_args()
+
+    engine = create_async_engine(db_url())
+    asyncpg_unit_of_work = AsyncpgUnitOfWork(db_url(driver="postgresql").render_as_string(hide_password=False))
+    backends: dict[str, UnitOfWork] = {
+        "sqlalchemy": PostgresqlUnitOfWork(engine),
+        "asyncpg": asyncpg_unit_of_work,
+    }
+    async with backends["sqlalchemy"].begin() as uow:
+        articles = await uow.articles.get_many(ArticleFilter(), limit=1, offset=0)
+    if not articles:
+        raise SystemExit("the database has no articles, create some before running the benchmark")
+
+    scenarios: dict[str, Scenario] = {
+        "get article": get_article(articles[0].slug),
+        "list articles": list_articles,
+        "list tags": list_tags,
+    }
+    print(f"{'scenario':<16}{'sqlalchemy, ms':>16}{'asyncpg, ms':>14}{'speedup':>10}")
+    for name, scenario in scenarios.items():
+        sqlalchemy_time = await measure(backends["sqlalchemy"], scenario, args.number) * 1e3
+        asyncpg_time = await measure(backends["asyncpg"], scenario, args.number) * 1e3
+        print(f"{name:<16}{sqlalchemy_time:>16.3f}{asyncpg_time:>14.3f}{sqlalchemy_time / asyncpg_time:>9.2f}x")
+
+    await engine.dispose()
+    await asyncpg_unit_of_work.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,154 @@
+"""Statement construction and compile-cache overhead per request.
+
+Compares building SQLAlchemy Core statements on every call (the way repositories used to do it)
+against executing the prebuilt module-level statements of `conduit.impl`.
+
+Usage:
+    python -m benchmarks.statements [--number N]
+"""
+
+import argparse
+import timeit
+import typing as t
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql.elements import ClauseElement
+
+from conduit.core.entities.article import ArticleFilter, Tag
+from conduit.core.entities.user import Username
+from conduit.db import tables
+from conduit.impl import (
+    article_repository,
+    favorite_article_repository,
+    follower_repository,
+    tag_repository,
+    user_repository,
+)
+
+DIALECT: t.Final = create_async_engine("postgresql+asyncpg://").dialect
+IDS: t.Final = list(range(20))
+FILTER: t.Final = ArticleFilter(tag=Tag("python"), author=Username("alice"))
+
+RequestShape = t.Callable[[], list[ClauseElement]]
+
+
+def legacy_get_article() -> list[ClauseElement]:
+    return [
+        sa.select(tables.ARTICLE).where(tables.ARTICLE.c.slug == "some-slug"),
+        sa.select(tables.USER).where(tables.USER.c.id == 1),
+        sa.select(tables.TAG)
+        .join_from(tables.TAG, tables.ARTICLE_TAG, onclause=tables.TAG.c.id == tables.ARTICLE_TAG.c.tag_id)
+        .where(tables.ARTICLE_TAG.c.article_id == 1)
+        .order_by(tables.TAG.c.tag),
+        sa.select(tables.FOLLOWER.c.followed_id).where(
+            tables.FOLLOWER.c.follower_id == 2, tables.FOLLOWER.c.followed_id == 1
+        ),
+        sa.select(tables.FAVORITE_ARTICLE.c.article_id)
+        .where(tables.FAVORITE_ARTICLE.c.user_id == 2)
+        .where(tables.FAVORITE_ARTICLE.c.article_id == 1),
+        sa.select(sa.func.count(tables.FAVORITE_ARTICLE.c.user_id)).where(tables.FAVORITE_ARTICLE.c.article_id == 1),
+    ]
+
+
+def legacy_list_articles() -> list[ClauseElement]:
+    def apply_filter(stmt: sa.Select[t.Any]) -> sa.Select[t.Any]:
+        return (
+            stmt.join_from(
+                tables.ARTICLE, tables.ARTICLE_TAG, onclause=tables.ARTICLE.c.id == tables.ARTICLE_TAG.c.article_id
+            )
+            .join_from(tables.ARTICLE_TAG, tables.TAG, onclause=tables.ARTICLE_TAG.c.tag_id == tables.TAG.c.id)
+            .where(tables.TAG.c.tag == str(FILTER.tag))
+            .join_from(tables.ARTICLE, tables.USER, onclause=tables.ARTICLE.c.author_id == tables.USER.c.id)
+            .where(tables.USER.c.username == FILTER.author)
+        )
+
+    return [
+        apply_filter(sa.select(tables.ARTICLE)).limit(20).offset(0),
+        apply_filter(sa.select(sa.func.count(tables.ARTICLE.c.id))),
+        sa.select(tables.USER).where(tables.USER.c.id.in_(IDS)),
+        sa.select(tables.FOLLOWER.c.followed_id).where(
+            tables.FOLLOWER.c.follower_id == 2, tables.FOLLOWER.c.followed_id.in_(IDS)
+        ),
+        sa.select(tables.TAG, tables.ARTICLE_TAG.c.article_id)
+        .join_from(tables.TAG, tables.ARTICLE_TAG, onclause=tables.TAG.c.id == tables.ARTICLE_TAG.c.tag_id)
+        .where(tables.ARTICLE_TAG.c.article_id.in_(IDS))
+        .order_by(tables.TAG.c.tag),
+        sa.select(tables.FAVORITE_ARTICLE.c.article_id)
+        .where(tables.FAVORITE_ARTICLE.c.user_id == 2)
+        .where(tables.FAVORITE_ARTICLE.c.article_id.in_(IDS)),
+        sa.select(
+            tables.FAVORITE_ARTICLE.c.article_id,
+            sa.func.count(tables.FAVORITE_ARTICLE.c.user_id).label("count_"),
+        )
+        .where(tables.FAVORITE_ARTICLE.c.article_id.in_(IDS))
+        .group_by(tables.FAVORITE_ARTICLE.c.article_id),
+    ]
+
+
+def prebuilt_get_article() -> list[ClauseElement]:
+    return [
+        article_repository._SELECT_BY_SLUG_STMT,
+        user_repository._SELECT_BY_ID_STMT,
+        tag_repository._SELECT_FOR_ARTICLE_STMT,
+        follower_repository._IS_FOLLOWED_STMT,
+        favorite_article_repository._IS_FAVORITE_STMT,
+        favorite_article_repository._COUNT_STMT,
+    ]
+
+
+def prebuilt_list_articles() -> list[ClauseElement]:
+    key = article_repository._filter_key(FILTER)
+    article_repository._filter_params(FILTER)
+    return [
+        article_repository._SELECT_MANY_STMTS[key],
+        article_repository._COUNT_STMTS[key],
+        user_repository._SELECT_BY_IDS_STMT,
+        follower_repository._ARE_FOLLOWED_STMT,
+        tag_repository._SELECT_FOR_ARTICLES_STMT,
+        favorite_article_repository._ARE_FAVORITE_STMT,
+        favorite_article_repository._COUNT_MANY_STMT,
+    ]
+
+
+def per_request(shape: RequestShape, cache: dict[t.Any, t.Any]) -> t.Callable[[], None]:
+    """Emulates what `AsyncConnection.execute` does before hitting the network.
+
+    A statement is constructed, its cache key is generated and looked up in the compiled cache;
+    compilation only happens on a cache miss.
+    """
+
+    def run() -> None:
+        for stmt in shape():
+            cache_key = stmt._generate_cache_key()
+            assert cache_key is not None
+            key = cache_key.key
+            if key not in cache:
+                cache[key] = stmt.compile(dialect=DIALECT)
+
+    return run
+
+
+def measure(shape: RequestShape, number: int) -> float:
+    run = per_request(shape, {})
+    run()  # warm up the compiled cache
+    return min(timeit.repeat(run, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="requests per timing round")
+    args = parser.parse_args()
+    cases = [
+        ("GET /articles/{slug}", legacy_get_article, prebuilt_get_article),
+        ("GET /articles", legacy_list_articles, prebuilt_list_articles),
+    ]
+    print(f"{'request':<24}{'before, us':>12}{'after, us':>12}{'speedup':>10}")
+    for name, legacy, prebuilt in cases:
+        before = measure(legacy, args.number) * 1e6
+        after = measure(prebuilt, args.number) * 1e6
+        print(f"{name:<24}{before:>12.1f}{after:>12.1f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
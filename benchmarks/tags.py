@@ -0,0 +1,138 @@
+"""Tagging an article with 20 tags: three round trips against one statement.
+
+The legacy scenario upserts the tags, reads their ids back and links them in three
+statements, the way `PostgresqlTagRepository.create` used to. The others run the current
+single-statement `create` of both backends. Every iteration creates a fresh article inside
+a transaction that is rolled back afterwards, half of the tags are new and half already
+exist. Needs a database with at least one user.
+
+Usage:
+    python -m benchmarks.tags [--number N]
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import itertools
+import time
+import typing as t
+
+import asyncpg
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from conduit.config import db_url
+from conduit.core.entities.article import ArticleId, Tag
+from conduit.db import tables
+from conduit.impl.asyncpg.tag_repository import AsyncpgTagRepository
+from conduit.impl.tag_repository import PostgresqlTagRepository
+
+TAGS_PER_ARTICLE: t.Final = 20
+EXISTING_TAGS: t.Final = [Tag(f"benchmark-{n}") for n in range(TAGS_PER_ARTICLE // 2)]
+
+# Creates the article and the tags that must already exist.
+_SETUP_SQL: t.Final = """
+    WITH existing_tag AS (
+        INSERT INTO tag (tag, created_at) SELECT unnest(CAST({tags} AS text[])), now() ON CONFLICT DO NOTHING
+    )
+    INSERT INTO article (author_id, slug, title, description, body, created_at)
+    VALUES ({author_id}, {slug}, '', '', '', now())
+    RETURNING id
+"""
+_ASYNCPG_SETUP_SQL: t.Final = _SETUP_SQL.format(author_id="$1", slug="$2", tags="$3")
+_SQLALCHEMY_SETUP_STMT: t.Final = sa.text(_SETUP_SQL.format(author_id=":author_id", slug=":slug", tags=":tags"))
+
+
+async def legacy_create(connection: AsyncConnection, article_id: ArticleId, tags: list[Tag]) -> None:
+    now = dt.datetime.utcnow()
+    await connection.execute(
+        insert(tables.TAG).on_conflict_do_nothing(), [{"created_at": now, "tag": str(tag)} for tag in tags]
+    )
+    result = await connection.execute(
+        sa.select(tables.TAG.c.id).where(tables.TAG.c.tag.in_([str(tag) for tag in tags]))
+    )
+    await connection.execute(
+        insert(tables.ARTICLE_TAG).on_conflict_do_nothing(),
+        [{"article_id": article_id, "tag_id": tag_id, "created_at": now} for tag_id in result.scalars()],
+    )
+
+
+class Runner:
+    def __init__(self, engine_url: sa.URL, connection: asyncpg.Connection, author_id: int) -> None:
+        self._engine = create_async_engine(engine_url)
+        self._connection = connection
+        self._author_id = author_id
+        self._counter = itertools.count()
+
+    async def measure(self, backend: str, number: int) -> float:
+        """Mean duration of tagging one article, in seconds."""
+        total = 0.0
+        for _ in range(number):
+            n = next(self._counter)
+            tags = [*EXISTING_TAGS, *(Tag(f"benchmark-{n}-{i}") for i in range(len(EXISTING_TAGS)))]
+            if backend == "asyncpg":
+                total += await self._run_asyncpg(f"benchmark-{n}", tags)
+            else:
+                total += await self._run_sqlalchemy(backend == "legacy", f"benchmark-{n}", tags)
+        return total / number
+
+    async def _run_asyncpg(self, slug: str, tags: list[Tag]) -> float:
+        transaction = self._connection.transaction()
+        await transaction.start()
+        try:
+            article_id = await self._connection.fetchval(
+                _ASYNCPG_SETUP_SQL, self._author_id, slug, [str(tag) for tag in EXISTING_TAGS]
+            )
+            t0 = time.perf_counter()
+            await AsyncpgTagRepository(self._connection).create(article_id, tags)
+            return time.perf_counter() - t0
+        finally:
+            await transaction.rollback()
+
+    async def _run_sqlalchemy(self, legacy: bool, slug: str, tags: list[Tag]) -> float:
+        async with self._engine.connect() as connection:
+            try:
+                result = await connection.execute(
+                    _SQLALCHEMY_SETUP_STMT,
+                    {"author_id": self._author_id, "slug": slug, "tags": [str(tag) for tag in EXISTING_TAGS]},
+                )
+                article_id = ArticleId(result.scalar_one())
+                t0 = time.perf_counter()
+                if legacy:
+                    await legacy_create(connection, article_id, tags)
+                else:
+                    await PostgresqlTagRepository(connection).create(article_id, tags)
+                return time.perf_counter() - t0
+            finally:
+                await connection.rollback()
+
+    async def close(self) -> None:
+        await self._engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=300, help="iterations per scenario")
+    args = parser.parse_args()
+
+    connection = await asyncpg.connect(db_url(driver="postgresql").render_as_string(hide_password=False))
+    author_id = await connection.fetchval('SELECT id FROM "user" ORDER BY id LIMIT 1')
+    if author_id is None:
+        raise SystemExit("the database has no users, create one before running the benchmark")
+
+    runner = Runner(db_url(), connection, author_id)
+    print(f"{'scenario':<24}{'ms per article':>16}")
+    for name, backend in [
+        ("legacy, 3 round trips", "legacy"),
+        ("sqlalchemy, 1 statement", "sqlalchemy"),
+        ("asyncpg, 1 statement", "asyncpg"),
+    ]:
+        await runner.measure(backend, min(args.number, 20))
+        print(f"{name:<24}{await runner.measure(backend, args.number) * 1e3:>16.3f}")
+    await runner.close()
+    await connection.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
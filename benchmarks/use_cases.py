@@ -0,0 +1,305 @@
+"""Orchestration overhead of every use case, apart from Postgres.
+
+Runs each use case of `UseCases` against the in-memory repositories of
+`conduit.impl.memory`, seeded with a small dataset, and reports calls per second and
+the peak memory traced during one call. Passwords are hashed with SHA-256 rather than
+Argon2 and log lines below warnings are dropped, so that neither dominates the results.
+
+Results can be saved as JSON and compared against a stored baseline:
+    python -m benchmarks.use_cases --output baseline.json
+    python -m benchmarks.use_cases --baseline baseline.json --max-slowdown 0.2
+
+Usage:
+    python -m benchmarks.use_cases [--number N] [--output FILE] [--baseline FILE] [--max-slowdown RATIO]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+import typing as t
+
+import structlog
+from dependency_injector.providers import Object
+
+from conduit.container import Dependencies, UseCases
+from conduit.core.entities.article import ArticleSlug, CreateArticleInput, Tag
+from conduit.core.entities.comment import CreateCommentInput
+from conduit.core.entities.user import (
+    AuthToken,
+    CreateUserInput,
+    Email,
+    PasswordHash,
+    PasswordHasher,
+    RawPassword,
+    User,
+    Username,
+)
+from conduit.core.use_cases.articles.create import CreateArticleInput as CreateArticleUseCaseInput
+from conduit.core.use_cases.articles.delete import DeleteArticleInput
+from conduit.core.use_cases.articles.favorite import FavoriteArticleInput
+from conduit.core.use_cases.articles.feed import FeedArticlesInput
+from conduit.core.use_cases.articles.get import GetArticleInput
+from conduit.core.use_cases.articles.list import ListArticlesInput
+from conduit.core.use_cases.articles.search import SearchArticlesInput
+from conduit.core.use_cases.articles.unfavorite import UnfavoriteArticleInput
+from conduit.core.use_cases.articles.update import UpdateArticleInput
+from conduit.core.use_cases.comments.add_to_article import AddCommentToArticleInput
+from conduit.core.use_cases.comments.delete import DeleteCommentInput
+from conduit.core.use_cases.comments.get_from_article import GetCommentsFromArticleInput
+from conduit.core.use_cases.data_loader import data_loader_scope
+from conduit.core.use_cases.profiles.follow import FollowInput
+from conduit.core.use_cases.profiles.get import GetProfileInput
+from conduit.core.use_cases.profiles.unfollow import UnfollowInput
+from conduit.core.use_cases.tags.count import CountTagArticlesInput
+from conduit.core.use_cases.tags.list import ListTagsInput
+from conduit.core.use_cases.tags.popular import ListPopularTagsInput
+from conduit.core.use_cases.users.get_current import GetCurrentUserInput
+from conduit.core.use_cases.users.sign_in import SignInInput
+from conduit.core.use_cases.users.sign_up import SignUpInput
+from conduit.core.use_cases.users.update_current import UpdateCurrentUserInput
+from conduit.impl.memory.unit_of_work import MemoryUnitOfWork
+
+USERS: t.Final = 100
+ARTICLES: t.Final = 500
+TAGS: t.Final = [Tag(f"tag{i}") for i in range(20)]
+PASSWORD: t.Final = RawPassword("password")
+
+# Inputs of `number` calls of a use case, prepared before the calls are timed.
+Prepare = t.Callable[["Dataset", int], t.Awaitable[list[t.Any]]]
+
+
+class Sha256PasswordHasher(PasswordHasher):
+    async def hash_password(self, password: RawPassword) -> PasswordHash:
+        return PasswordHash(hashlib.sha256(password.encode()).hexdigest())
+
+    async def verify(self, password: RawPassword, hash: PasswordHash) -> bool:
+        return hashlib.sha256(password.encode()).hexdigest() == hash
+
+
+class Dataset(t.NamedTuple):
+    unit_of_work: MemoryUnitOfWork
+    # The reader follows the author and has favorited the article.
+    reader: User
+    reader_token: AuthToken
+    author: User
+    author_token: AuthToken
+    slug: ArticleSlug
+
+
+async def create_dataset(deps: Dependencies) -> Dataset:
+    unit_of_work = deps.unit_of_work()
+    password = await deps.password_hasher().hash_password(PASSWORD)
+    async with unit_of_work.begin() as uow:
+        users = [
+            await uow.users.create(CreateUserInput(Username(f"user{i}"), Email(f"user{i}@example.com"), password))
+            for i in range(USERS)
+        ]
+        for i, user in enumerate(users):
+            for k in range(1, 11):
+                await uow.followers.follow(follower_id=user.id, followed_id=users[(i + k * 7) % USERS].id)
+        articles = []
+        for i in range(ARTICLES):
+            article = await uow.articles.create(
+                CreateArticleInput(users[i % USERS].id, f"Article {i} about python", "description", "body " * 50)
+            )
+            await uow.tags.create(article.id, [TAGS[(i * k) % len(TAGS)] for k in range(1, 4)])
+            articles.append(article)
+        for i, article in enumerate(articles):
+            for k in range(4):
+                await uow.favorites.add_by_slug(users[(i + k * 13) % USERS].id, article.slug)
+        article = articles[-1]
+        reader, author = users[0], users[article.author_id - 1]
+        await uow.followers.follow(follower_id=reader.id, followed_id=author.id)
+        await uow.favorites.add_by_slug(reader.id, article.slug)
+        for i in range(20):
+            await uow.comments.create(CreateCommentInput(users[i].id, article.id, f"comment {i}"))
+    token_generator = deps.auth_token_generator()
+    return Dataset(
+        unit_of_work,
+        reader,
+        await token_generator.generate_token(reader),
+        author,
+        await token_generator.generate_token(author),
+        article.slug,
+    )
+
+
+async def prepare_sign_up(dataset: Dataset, number: int) -> list[t.Any]:
+    suffix = time.monotonic_ns()
+    return [
+        SignUpInput(Username(f"new{suffix}-{i}"), Email(f"new{suffix}-{i}@example.com"), PASSWORD)
+        for i in range(number)
+    ]
+
+
+async def prepare_delete_article(dataset: Dataset, number: int) -> list[t.Any]:
+    async with dataset.unit_of_work.begin() as uow:
+        articles = [
+            await uow.articles.create(CreateArticleInput(dataset.author.id, "To delete", "description", "body"))
+            for _ in range(number)
+        ]
+        for article in articles:
+            await uow.tags.create(article.id, TAGS[:3])
+    return [DeleteArticleInput(token=dataset.author_token, user_id=None, slug=article.slug) for article in articles]
+
+
+async def prepare_delete_comment(dataset: Dataset, number: int) -> list[t.Any]:
+    async with dataset.unit_of_work.begin() as uow:
+        article = await uow.articles.get_by_slug(dataset.slug)
+        assert article is not None
+        comments = [
+            await uow.comments.create(CreateCommentInput(dataset.reader.id, article.id, "to delete"))
+            for _ in range(number)
+        ]
+    return [
+        DeleteCommentInput(token=dataset.reader_token, user_id=None, article_slug=dataset.slug, comment_id=comment.id)
+        for comment in comments
+    ]
+
+
+def repeat(make_input: t.Callable[[Dataset], t.Any]) -> Prepare:
+    """The same input for every call."""
+
+    async def prepare(dataset: Dataset, number: int) -> list[t.Any]:
+        return [make_input(dataset)] * number
+
+    return prepare
+
+
+SCENARIOS: t.Final[dict[str, Prepare]] = {
+    # Users
+    "sign_up": prepare_sign_up,
+    "sign_in": repeat(lambda d: SignInInput(d.reader.email, PASSWORD)),
+    "get_current_user": repeat(lambda d: GetCurrentUserInput(token=d.reader_token, user_id=None)),
+    "update_current_user": repeat(lambda d: UpdateCurrentUserInput(token=d.reader_token, user_id=None, bio="bio")),
+    # Profiles
+    "get_profile": repeat(lambda d: GetProfileInput(token=d.reader_token, user_id=None, username=d.author.username)),
+    "follow": repeat(lambda d: FollowInput(token=d.reader_token, user_id=None, username=d.author.username)),
+    "unfollow": repeat(lambda d: UnfollowInput(token=d.author_token, user_id=None, username=d.reader.username)),
+    # Articles
+    "create_article": repeat(
+        lambda d: CreateArticleUseCaseInput(
+            token=d.author_token,
+            user_id=None,
+            title="New article",
+            description="description",
+            body="body",
+            tags=TAGS[:3],
+        )
+    ),
+    "list_articles": repeat(lambda d: ListArticlesInput(token=d.reader_token, user_id=None)),
+    "feed_articles": repeat(lambda d: FeedArticlesInput(token=d.reader_token, user_id=None)),
+    "search_articles": repeat(lambda d: SearchArticlesInput(token=d.reader_token, user_id=None, query="python")),
+    "get_article": repeat(lambda d: GetArticleInput(token=d.reader_token, user_id=None, slug=d.slug)),
+    "update_article": repeat(
+        lambda d: UpdateArticleInput(token=d.author_token, user_id=None, slug=d.slug, body="updated body")
+    ),
+    "delete_article": prepare_delete_article,
+    "favorite_article": repeat(lambda d: FavoriteArticleInput(token=d.reader_token, user_id=None, slug=d.slug)),
+    "unfavorite_article": repeat(lambda d: UnfavoriteArticleInput(token=d.author_token, user_id=None, slug=d.slug)),
+    # Comments
+    "add_comment_to_article": repeat(
+        lambda d: AddCommentToArticleInput(token=d.reader_token, user_id=None, article_slug=d.slug, body="comment")
+    ),
+    "get_comments_from_article": repeat(
+        lambda d: GetCommentsFromArticleInput(token=d.reader_token, user_id=None, article_slug=d.slug)
+    ),
+    "delete_comment": prepare_delete_comment,
+    # Tags
+    "list_tags": repeat(lambda d: ListTagsInput()),
+    "list_popular_tags": repeat(lambda d: ListPopularTagsInput()),
+    "count_tag_articles": repeat(lambda d: CountTagArticlesInput()),
+}
+
+
+# Calls before the timed ones, and after them with memory tracing, which would slow the timed ones down.
+WARM_UP_CALLS: t.Final = 50
+TRACED_CALLS: t.Final = 100
+
+
+async def call(use_case: t.Any, input: t.Any) -> None:
+    # Like `data_loader_middleware` does for a request.
+    with data_loader_scope():
+        await use_case.execute(input)
+
+
+async def measure(use_case: t.Any, timed: list[t.Any], traced: list[t.Any]) -> tuple[float, float]:
+    """Calls per second over `timed`, and the peak memory traced during one call of `traced` in KiB."""
+    t0 = time.perf_counter()
+    for input in timed:
+        await call(use_case, input)
+    ops_per_sec = len(timed) / (time.perf_counter() - t0)
+    tracemalloc.start()
+    peaks = []
+    for input in traced:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        await call(use_case, input)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    return ops_per_sec, sum(peaks) / len(peaks) / 1024
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="calls per use case")
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results saved in this JSON file")
+    parser.add_argument(
+        "--max-slowdown", type=float, help="fail if a use case is slower than the baseline by more than this ratio"
+    )
+    parser.add_argument("use_cases", nargs="*", help="use cases to run, all by default")
+    args = parser.parse_args()
+    if args.number < 1:
+        parser.error("--number must be at least 1")
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    deps = Dependencies()
+    deps.unit_of_work.override(Object(MemoryUnitOfWork()))
+    deps.password_hasher.override(Object(Sha256PasswordHasher()))
+    use_cases = UseCases(deps=deps)
+    dataset = await create_dataset(deps)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        if zero := [name for name, result in baseline.items() if result["ops_per_sec"] <= 0]:
+            parser.error(f"the baseline has no calls per second for {', '.join(zero)}")
+    names = args.use_cases or list(SCENARIOS)
+
+    results: dict[str, dict[str, float]] = {}
+    slower = []
+    print(f"{'use case':<28}{'ops/s':>10}{'peak KiB':>10}{'vs baseline':>13}")
+    for name in names:
+        use_case = getattr(use_cases, name)()
+        inputs = await SCENARIOS[name](dataset, WARM_UP_CALLS + args.number + TRACED_CALLS)
+        # Warm-up calls, they also make sure the input is valid.
+        for input in inputs[:WARM_UP_CALLS]:
+            await call(use_case, input)
+        timed = inputs[WARM_UP_CALLS : WARM_UP_CALLS + args.number]
+        ops_per_sec, peak_kib = await measure(use_case, timed, inputs[WARM_UP_CALLS + args.number :])
+        results[name] = {"ops_per_sec": round(ops_per_sec, 1), "peak_kib": round(peak_kib, 2)}
+        change = ""
+        if name in baseline:
+            ratio = ops_per_sec / baseline[name]["ops_per_sec"]
+            change = f"{ratio - 1:+.1%}"
+            if args.max_slowdown is not None and ratio < 1 - args.max_slowdown:
+                slower.append(name)
+        print(f"{name:<28}{ops_per_sec:>10.0f}{peak_kib:>10.1f}{change:>13}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": platform.python_version(), "number": args.number, "results": results}, file, indent=2)
+    if slower:
+        print(f"\nslower than the baseline: {', '.join(slower)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
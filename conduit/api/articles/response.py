@@ -5,6 +5,8 @@ __all__ = [
     "ArticleSchema",
     "MultipleArticlesResponseModel",
     "MultipleArticlesResponseSchema",
+    "SearchArticlesResponseModel",
+    "SearchArticlesResponseSchema",
     "article_not_found",
 ]
 
@@ -106,5 +108,27 @@ class MultipleArticlesResponseSchema(Schema):
     count = fields.Integer(required=True, data_key="articlesCount")
 
 
+@dataclass(frozen=True)
+class SearchArticlesResponseModel:
+    articles: list[ArticleModel]
+    next_cursor: str | None
+
+    @classmethod
+    def new(cls, articles: list[ArticleWithExtra], next_cursor: str | None) -> "SearchArticlesResponseModel":
+        return SearchArticlesResponseModel(
+            articles=[ArticleModel.new(article) for article in articles],
+            next_cursor=next_cursor,
+        )
+
+    def response(self) -> web.Response:
+        return web.json_response(_SEARCH_ARTICLES_RESPONSE_SCHEMA.dump(self))
+
+
+class SearchArticlesResponseSchema(Schema):
+    articles = fields.List(fields.Nested(ArticleSchema()), required=True)
+    next_cursor = fields.String(required=True, allow_none=True, data_key="nextCursor")
+
+
 _ARTICLE_RESPONSE_SCHEMA = ArticleResponseSchema()
 _MULTIPLE_ARTICLES_RESPONSE_SCHEMA = MultipleArticlesResponseSchema()
+_SEARCH_ARTICLES_RESPONSE_SCHEMA = SearchArticlesResponseSchema()
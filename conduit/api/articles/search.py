@@ -0,0 +1,69 @@
+__all__ = [
+    "search_articles_endpoint",
+]
+
+import math
+import typing as t
+from dataclasses import replace
+from http import HTTPStatus
+
+from aiohttp import web
+from aiohttp_apispec import docs, headers_schema, querystring_schema, response_schema
+from marshmallow import Schema, ValidationError, fields, post_load, validate
+
+from conduit.api.articles.response import SearchArticlesResponseModel, SearchArticlesResponseSchema
+from conduit.api.auth import OptionalAuthHeaderSchema
+from conduit.api.base import Endpoint
+from conduit.core.entities.article import ArticleId, ArticleSearchCursor, Tag
+from conduit.core.use_cases import UseCase
+from conduit.core.use_cases.articles.search import SearchArticlesInput, SearchArticlesResult
+
+
+class SearchArticlesQueryParamsSchema(Schema):
+    query = fields.String(required=True, validate=validate.Length(min=1, max=256), data_key="q")
+    tag = fields.String(required=False, validate=validate.Length(max=256))
+    author = fields.String(required=False, validate=validate.Length(max=128))
+    limit = fields.Integer(required=False, validate=validate.Range(min=1, max=100))
+    cursor = fields.String(required=False, validate=validate.Length(max=64))
+
+    @post_load
+    def to_input(self, data: dict[str, t.Any], **_: t.Any) -> SearchArticlesInput:
+        if "tag" in data:
+            data["tag"] = Tag(data["tag"])
+        if "cursor" in data:
+            data["cursor"] = decode_cursor(data["cursor"])
+        return SearchArticlesInput(**data, token=None, user_id=None)
+
+
+def encode_cursor(cursor: ArticleSearchCursor | None) -> str | None:
+    if cursor is None:
+        return None
+    # `repr` round-trips a float exactly, the next page starts right after this rank.
+    return f"{cursor.rank!r}:{cursor.id}"
+
+
+def decode_cursor(value: str) -> ArticleSearchCursor:
+    try:
+        rank, id = value.split(":")
+        cursor = ArticleSearchCursor(float(rank), ArticleId(int(id)))
+    except ValueError:
+        raise ValidationError("invalid cursor", field_name="cursor") from None
+    if not math.isfinite(cursor.rank):
+        raise ValidationError("invalid cursor", field_name="cursor")
+    return cursor
+
+
+def search_articles_endpoint(use_case: UseCase[SearchArticlesInput, SearchArticlesResult]) -> Endpoint:
+    @docs(tags=["articles"], summary="Search articles by their title, description and body.")
+    @headers_schema(OptionalAuthHeaderSchema, put_into="auth_token")
+    @querystring_schema(SearchArticlesQueryParamsSchema, put_into="input")
+    @response_schema(SearchArticlesResponseSchema, code=HTTPStatus.OK)
+    async def handler(request: web.Request) -> web.Response:
+        input = request["input"]
+        assert isinstance(input, SearchArticlesInput)
+        input = replace(input, token=request["auth_token"])
+        result = await use_case.execute(input)
+        response_model = SearchArticlesResponseModel.new(result.articles, encode_cursor(result.next_cursor))
+        return response_model.response()
+
+    return handler
@@ -6,4 +6,4 @@ import typing as t
 
 from aiohttp import web
 
-Endpoint = t.Callable[[web.Request], t.Awaitable[web.Response]]
+Endpoint = t.Callable[[web.Request], t.Awaitable[web.StreamResponse]]
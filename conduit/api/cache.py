@@ -0,0 +1,127 @@
+__all__ = [
+    "StaleWhileRevalidateCache",
+]
+
+import asyncio
+import contextvars
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import structlog
+
+from conduit.core.entities.errors import DeadlineExceededError
+from conduit.core.entities.unit_of_work import remaining_time
+
+LOG = structlog.get_logger(__name__)
+
+K = t.TypeVar("K", bound=t.Hashable)
+V = t.TypeVar("V")
+
+
+@dataclass(frozen=True)
+class _Entry(t.Generic[V]):
+    value: V
+    loaded_at: float
+
+
+class StaleWhileRevalidateCache(t.Generic[K, V]):
+    """In-process cache serving values while they are refreshed in the background.
+
+    A value is fresh for `ttl` seconds. For `stale` more seconds it is still served, and the
+    first request seeing it stale refreshes it in the background. Older values are loaded
+    again before being served. Concurrent loads of a key share a single call of `load`, which
+    runs in a context of its own: it neither has the deadline of the request that started it
+    nor is accounted to it.
+
+    The state is kept per process: `invalidate` does not reach other workers, whose values
+    stay stale for at most `ttl + stale` seconds. `hits`, `stale_hits` and `misses` count the
+    requests served fresh, served stale and loaded.
+
+    Args:
+        ttl: For how many seconds a value is fresh. `0` disables the cache.
+        stale: For how many seconds after that a value is served while being refreshed.
+        max_size: How many keys are kept, the least recently used ones are evicted.
+        clock: Monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self, ttl: float, stale: float, max_size: int = 128, clock: t.Callable[[], float] = time.monotonic
+    ) -> None:
+        self._ttl = ttl
+        self._stale = stale
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._loads: dict[K, asyncio.Task[V]] = {}
+        # Bumped by `invalidate`: loads started before it do not store their result.
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    async def get(self, key: K, load: t.Callable[[], t.Awaitable[V]]) -> V:
+        if not self.enabled:
+            self.misses += 1
+            return await load()
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.loaded_at
+            if age < self._ttl + self._stale:
+                self._entries.move_to_end(key)
+                if age >= self._ttl:
+                    self.stale_hits += 1
+                    self._start_load(key, load)
+                else:
+                    self.hits += 1
+                return entry.value
+        self.misses += 1
+        deadline = asyncio.timeout(remaining_time())
+        try:
+            async with deadline:
+                # A request giving up waiting must not cancel the load other requests wait for.
+                return await asyncio.shield(self._start_load(key, load))
+        except TimeoutError:
+            if deadline.expired():
+                raise DeadlineExceededError() from None
+            raise
+
+    def invalidate(self) -> None:
+        """Drops every value, the next request for a key loads it again."""
+        self._entries.clear()
+        self._loads.clear()
+        self._generation += 1
+
+    def _start_load(self, key: K, load: t.Callable[[], t.Awaitable[V]]) -> asyncio.Task[V]:
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, load, self._generation), context=contextvars.Context())
+            task.add_done_callback(_log_failure)
+            self._loads[key] = task
+        return task
+
+    async def _load(self, key: K, load: t.Callable[[], t.Awaitable[V]], generation: int) -> V:
+        loaded_at = self._clock()
+        try:
+            value = await load()
+        finally:
+            if self._loads.get(key) is asyncio.current_task():
+                del self._loads[key]
+        if generation == self._generation:
+            self._entries[key] = _Entry(value, loaded_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return value
+
+
+def _log_failure(task: asyncio.Task[t.Any]) -> None:
+    # Retrieving the exception also keeps asyncio from reporting a background refresh that
+    # nobody has awaited.
+    if not task.cancelled() and (error := task.exception()) is not None:
+        LOG.warning("loading a cached value failed", exc_info=error)
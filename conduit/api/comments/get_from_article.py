@@ -2,31 +2,47 @@ __all__ = [
     "get_comments_from_article_endpoint",
 ]
 
+import typing as t
+from dataclasses import replace
 from http import HTTPStatus
 
 from aiohttp import web
-from aiohttp_apispec import docs, headers_schema, response_schema
+from aiohttp_apispec import docs, headers_schema, querystring_schema, response_schema
+from marshmallow import Schema, fields, post_load, validate
 
 from conduit.api.auth import OptionalAuthHeaderSchema
 from conduit.api.base import Endpoint
 from conduit.api.comments.response import MultipleCommentsResponseModel, MultipleCommentsResponseSchema
 from conduit.core.entities.article import ArticleSlug
+from conduit.core.entities.comment import CommentId
 from conduit.core.use_cases import UseCase
 from conduit.core.use_cases.comments.get_from_article import GetCommentsFromArticleInput, GetCommentsFromArticleResult
 
 
+class GetCommentsQueryParamsSchema(Schema):
+    limit = fields.Integer(required=False, validate=validate.Range(min=1, max=100))
+    cursor = fields.Integer(required=False, validate=validate.Range(min=1))
+
+    @post_load
+    def to_input(self, data: dict[str, t.Any], **_: t.Any) -> GetCommentsFromArticleInput:
+        if "cursor" in data:
+            data["cursor"] = CommentId(data["cursor"])
+        return GetCommentsFromArticleInput(**data, token=None, user_id=None, article_slug=ArticleSlug(""))
+
+
 def get_comments_from_article_endpoint(
     use_case: UseCase[GetCommentsFromArticleInput, GetCommentsFromArticleResult],
 ) -> Endpoint:
     @docs(tags=["comments"], summary="Get comments from an article.")
     @headers_schema(OptionalAuthHeaderSchema, put_into="auth_token")
+    @querystring_schema(GetCommentsQueryParamsSchema, put_into="input")
     @response_schema(MultipleCommentsResponseSchema, code=HTTPStatus.OK)
     async def handler(request: web.Request) -> web.Response:
-        auth_token = request["auth_token"]
-        article_slug = ArticleSlug(request.match_info["slug"])
-        input = GetCommentsFromArticleInput(token=auth_token, user_id=None, article_slug=article_slug)
+        input = request["input"]
+        assert isinstance(input, GetCommentsFromArticleInput)
+        input = replace(input, token=request["auth_token"], article_slug=ArticleSlug(request.match_info["slug"]))
         result = await use_case.execute(input)
-        response_model = MultipleCommentsResponseModel.new(result.comments)
+        response_model = MultipleCommentsResponseModel.new(result.comments, result.count, result.next_cursor)
         return response_model.response()
 
     return handler
@@ -73,11 +73,17 @@ class CommentResponseSchema(Schema):
 @dataclass(frozen=True)
 class MultipleCommentsResponseModel:
     comments: list[CommentModel]
+    count: int
+    next_cursor: int | None
 
     @classmethod
-    def new(cls, comments: list[CommentWithExtra]) -> "MultipleCommentsResponseModel":
+    def new(
+        cls, comments: list[CommentWithExtra], count: int, next_cursor: int | None
+    ) -> "MultipleCommentsResponseModel":
         return MultipleCommentsResponseModel(
             comments=[CommentModel.new(comment) for comment in comments],
+            count=count,
+            next_cursor=next_cursor,
         )
 
     def response(self) -> web.Response:
@@ -86,6 +92,8 @@ class MultipleCommentsResponseModel:
 
 class MultipleCommentsResponseSchema(Schema):
     comments = fields.List(fields.Nested(CommentSchema()), required=True)
+    count = fields.Integer(required=True, data_key="commentsCount")
+    next_cursor = fields.Integer(required=True, allow_none=True, data_key="nextCursor")
 
 
 _COMMENT_RESPONSE_SCHEMA = CommentResponseSchema()
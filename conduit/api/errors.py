@@ -10,6 +10,7 @@ from aiohttp import web
 from conduit.core.entities.errors import (
     ArticleDoesNotExistError,
     ConduitError,
+    DeadlineExceededError,
     EmailAlreadyExistsError,
     InvalidCredentialsError,
     PermissionDeniedError,
@@ -68,5 +69,11 @@ class HttpErrorVisitor(Visitor[tuple[dict[str, t.Any], HTTPStatus]]):
     ) -> tuple[dict[str, t.Any], HTTPStatus]:
         return {"error": "article not found"}, HTTPStatus.NOT_FOUND
 
+    def visit_deadline_exceeded(
+        self,
+        error: DeadlineExceededError,
+    ) -> tuple[dict[str, t.Any], HTTPStatus]:
+        return {"error": "request took too long"}, HTTPStatus.SERVICE_UNAVAILABLE
+
 
 _HTTP_ERROR_VISITOR = HttpErrorVisitor()
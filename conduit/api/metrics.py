@@ -0,0 +1,180 @@
+__all__ = [
+    "TimedUseCase",
+    "loop_lag_probe",
+    "metrics_endpoint",
+    "metrics_middleware",
+    "slow_callback_detector",
+]
+
+import asyncio
+import contextvars
+import time
+import typing as t
+from contextlib import suppress
+
+import structlog
+from aiohttp import web
+from aiohttp.typedefs import Middleware
+
+from conduit.api.base import Endpoint
+from conduit.core.entities.unit_of_work import REQUEST_ID_VAR, ROUTE_VAR
+from conduit.core.use_cases import UseCase
+from conduit.metrics import Family, Histogram, Registry
+
+LOG = structlog.get_logger(__name__)
+
+T = t.TypeVar("T")
+R = t.TypeVar("R")
+
+# Event-loop lag is far below request latencies, when nothing blocks the loop.
+LOOP_LAG_BUCKETS: t.Final = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+_CONTENT_TYPE: t.Final = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def metrics_middleware(registry: Registry) -> Middleware:
+    """Records the latency and the status of every request, labelled by the route name."""
+    durations = registry.histogram(
+        "conduit_http_request_duration_seconds", "Latency of HTTP requests.", label_names=("route",)
+    )
+    responses = registry.counter("conduit_http_responses_total", "HTTP responses.", label_names=("route", "status"))
+
+    @web.middleware
+    async def middleware(
+        request: web.Request,
+        handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        route = request.match_info.route.name or "unmatched"
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await handler(request)
+            status = response.status
+            return response
+        except web.HTTPException as error:
+            status = error.status
+            raise
+        finally:
+            durations.labels(route).observe(time.perf_counter() - started)
+            responses.labels(route, status).inc()
+
+    return middleware
+
+
+def metrics_endpoint(registry: Registry) -> Endpoint:
+    async def handler(_: web.Request) -> web.Response:
+        return web.Response(body=registry.render().encode(), headers={"Content-Type": _CONTENT_TYPE})
+
+    return handler
+
+
+class TimedUseCase(UseCase[T, R]):
+    """Records the duration of every execution of a use case."""
+
+    def __init__(self, use_case: UseCase[T, R], histogram: Histogram) -> None:
+        self._use_case = use_case
+        self._histogram = histogram
+
+    async def execute(self, input: T, /) -> R:
+        started = time.perf_counter()
+        try:
+            return await self._use_case.execute(input)
+        finally:
+            self._histogram.observe(time.perf_counter() - started)
+
+
+def loop_lag_probe(registry: Registry, interval: float = 0.5) -> t.Callable[[web.Application], t.AsyncIterator[None]]:
+    """Cleanup context measuring how late the event loop wakes up a task sleeping for `interval`.
+
+    A late wake-up means that a callback has held the loop, delaying every request meanwhile.
+    """
+    lags = registry.histogram(
+        "conduit_event_loop_lag_seconds", "Delay of scheduled callbacks.", buckets=LOOP_LAG_BUCKETS
+    )
+
+    async def probe(_: web.Application) -> t.AsyncIterator[None]:
+        task = asyncio.create_task(_measure_loop_lag(lags, interval))
+        yield
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    return probe
+
+
+async def _measure_loop_lag(lags: Family[Histogram], interval: float) -> None:
+    histogram = lags.labels()
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        histogram.observe(max(time.perf_counter() - started - interval, 0.0))
+
+
+def slow_callback_detector(
+    registry: Registry, threshold: float
+) -> t.Callable[[web.Application], t.AsyncIterator[None]]:
+    """Cleanup context timing every callback run by the event loop, and reporting the ones over `threshold`.
+
+    A slow callback is logged with the request id and the route of the request it ran for,
+    and its duration is recorded by route. Timing a callback costs two clock reads.
+
+    Callbacks are timed by wrapping `asyncio.Handle._run`, a private method of the standard
+    event loop. On other loops, e.g. uvloop, or if `Handle` has changed, the detector logs
+    that it is inactive and does nothing.
+    """
+    durations = registry.histogram(
+        "conduit_event_loop_slow_callback_duration_seconds",
+        "Duration of callbacks holding the event loop longer than the threshold.",
+        label_names=("route",),
+        buckets=LOOP_LAG_BUCKETS,
+    )
+
+    async def detector(_: web.Application) -> t.AsyncIterator[None]:
+        reason = _unsupported_loop_reason(asyncio.get_running_loop())
+        if reason is not None:
+            LOG.warning("slow event loop callback detector is inactive", reason=reason)
+            yield
+            return
+        run = asyncio.Handle._run
+
+        def timed_run(handle: asyncio.Handle) -> None:
+            started = time.perf_counter()
+            run(handle)
+            duration = time.perf_counter() - started
+            if duration >= threshold:
+                _report_slow_callback(handle, duration, durations)
+
+        asyncio.Handle._run = timed_run  # type: ignore[method-assign, assignment]
+        yield
+        asyncio.Handle._run = run  # type: ignore[method-assign]
+
+    return detector
+
+
+def _unsupported_loop_reason(loop: asyncio.AbstractEventLoop) -> str | None:
+    """Why the callbacks of `loop` can not be timed through `asyncio.Handle`, `None` if they can."""
+    if not isinstance(loop, asyncio.BaseEventLoop):
+        return f"{type(loop).__module__}.{type(loop).__qualname__} does not run asyncio.Handle callbacks"
+    if not callable(getattr(asyncio.Handle, "_run", None)):
+        return "asyncio.Handle has no _run method"
+    handle = asyncio.Handle(lambda: None, (), loop)
+    missing = [name for name in ("_callback", "_context") if not hasattr(handle, name)]
+    if missing:
+        return f"asyncio.Handle has no {', '.join(missing)} attributes"
+    return None
+
+
+def _report_slow_callback(handle: asyncio.Handle, duration: float, durations: Family[Histogram]) -> None:
+    # The callback ran in the context of its handle, which carries the variables of the request.
+    context: contextvars.Context = handle._context  # type: ignore[attr-defined]
+    callback = handle._callback  # type: ignore[attr-defined]
+    route = context.get(ROUTE_VAR, "none")
+    durations.labels(route).observe(duration)
+    task = getattr(callback, "__self__", None)
+    coro = task.get_coro() if isinstance(task, asyncio.Task) else None
+    LOG.warning(
+        "slow event loop callback",
+        duration=round(duration, 4),
+        callback=getattr(coro, "__qualname__", None) or repr(callback),
+        route=route,
+        request_id=context.get(REQUEST_ID_VAR, None),
+    )
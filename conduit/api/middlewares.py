@@ -1,10 +1,12 @@
 __all__ = [
-    "REQUEST_ID_VAR",
+    "data_loader_middleware",
+    "deadline_middleware",
+    "debug_sampling_middleware",
     "logging_middleware",
     "request_id_middleware",
 ]
 
-import contextvars
+import random
 import time
 import typing as t
 import uuid
@@ -12,9 +14,18 @@ from http import HTTPStatus
 
 import structlog
 from aiohttp import web
+from aiohttp.typedefs import Middleware
+
+from conduit.core.entities.unit_of_work import (
+    DEADLINE_VAR,
+    DEBUG_SAMPLED_VAR,
+    REQUEST_ID_VAR,
+    ROUTE_VAR,
+    collect_query_stats,
+)
+from conduit.core.use_cases.data_loader import data_loader_scope
 
 LOG = structlog.get_logger(__name__)
-REQUEST_ID_VAR: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
 
 
 @web.middleware
@@ -23,28 +34,86 @@ async def request_id_middleware(
     handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
 ) -> web.StreamResponse:
     REQUEST_ID_VAR.set(uuid.uuid4().hex)
+    ROUTE_VAR.set(request.match_info.route.name or "unmatched")
     return await handler(request)
 
 
+@web.middleware
+async def data_loader_middleware(
+    request: web.Request,
+    handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+) -> web.StreamResponse:
+    """Shares data loaders across the request, so that the lookups of the use cases are batched and deduplicated."""
+    with data_loader_scope():
+        return await handler(request)
+
+
+def deadline_middleware(default: float, per_route: t.Mapping[str, float]) -> Middleware:
+    """Gives every request a latency budget, the deadline is stored in `DEADLINE_VAR`.
+
+    Args:
+        default: Budget of a request, in seconds. `0` means no deadline.
+        per_route: Budgets overriding the default, keyed by route name.
+    """
+
+    @web.middleware
+    async def middleware(
+        request: web.Request,
+        handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        budget = per_route.get(request.match_info.route.name or "", default)
+        # Set on every request, a keep-alive connection would carry over the previous one.
+        DEADLINE_VAR.set(time.monotonic() + budget if budget > 0 else None)
+        return await handler(request)
+
+    return middleware
+
+
+def debug_sampling_middleware(rates: t.Mapping[str, float]) -> Middleware:
+    """Picks the requests whose debug lines are logged, the flag is stored in `DEBUG_SAMPLED_VAR`.
+
+    Args:
+        rates: Fraction of requests sampled, from 0 to 1, keyed by route name. Other routes are not sampled.
+    """
+
+    @web.middleware
+    async def middleware(
+        request: web.Request,
+        handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        rate = rates.get(request.match_info.route.name or "", 0.0)
+        # Set on every request, a keep-alive connection would carry over the previous one.
+        DEBUG_SAMPLED_VAR.set(rate > 0 and random.random() < rate)
+        return await handler(request)
+
+    return middleware
+
+
 @web.middleware
 async def logging_middleware(
     request: web.Request,
     handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
 ) -> web.StreamResponse:
     log = LOG.bind(path=request.path, method=request.method, query=request.query_string)
-    log.info("handling HTTP request")
+    log.debug("handling HTTP request")
     t0 = time.perf_counter()
-    try:
-        response = await handler(request)
-    except web.HTTPError as error:
-        response = error
-    except Exception:
-        log.exception("unexpected error")
-        response = web.json_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-    finally:
-        log.info(
-            "HTTP request processed",
-            status=response.status,
-            duration=round(time.perf_counter() - t0, 3),
-        )
+    with collect_query_stats() as stats:
+        try:
+            response = await handler(request)
+        except web.HTTPError as error:
+            response = error
+        except Exception:
+            log.exception("unexpected error")
+            response = web.json_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+        finally:
+            log.info(
+                "HTTP request processed",
+                status=response.status,
+                duration=round(time.perf_counter() - t0, 3),
+                db_transactions=stats.transactions,
+                db_statements=stats.statements,
+                db_duration=round(stats.duration, 3),
+                db_pool_wait=round(stats.pool_wait, 3),
+                db_rows=stats.rows,
+            )
     return response
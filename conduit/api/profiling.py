@@ -0,0 +1,218 @@
+__all__ = [
+    "PROFILE_HEADER",
+    "ProfileStore",
+    "get_profile_file_endpoint",
+    "list_profiles_endpoint",
+    "list_slow_queries_endpoint",
+    "profiling_middleware",
+    "sign_profile_token",
+]
+
+import asyncio
+import collections
+import cProfile
+import hashlib
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+import typing as t
+from http import HTTPStatus
+from pathlib import Path
+
+import structlog
+from aiohttp import web
+from aiohttp.typedefs import Middleware
+
+from conduit.api.base import Endpoint
+from conduit.core.entities.unit_of_work import REQUEST_ID_VAR
+from conduit.slow_queries import SlowQueryLog
+
+LOG = structlog.get_logger(__name__)
+
+PROFILE_HEADER: t.Final = "X-Profile"
+PROFILE_ID_HEADER: t.Final = "X-Profile-Id"
+# Output formats of a profile, by file extension.
+_KINDS: t.Final = {"pstats": "application/octet-stream", "collapsed": "text/plain; charset=utf-8"}
+_ID_RE: t.Final = re.compile(r"\d+-\w+-[0-9a-f]+")
+# Interval between two samples of the stack of the event loop thread, in seconds.
+_SAMPLE_INTERVAL: t.Final = 0.001
+
+
+def sign_profile_token(secret: str, expires: int) -> str:
+    """Token for the `X-Profile` header, valid until the `expires` Unix time."""
+    signature = hmac.new(secret.encode(), str(expires).encode(), hashlib.sha256).hexdigest()
+    return f"{expires}:{signature}"
+
+
+def _is_valid_token(secret: str | None, token: str | None) -> bool:
+    if not secret or not token:
+        return False
+    expires, _, _ = token.partition(":")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(sign_profile_token(secret, int(expires)), token)
+
+
+class ProfileStore:
+    """Bounded ring of profiles on disk, the oldest ones are deleted past `capacity`.
+
+    Every profile is saved as a `pstats` file, loadable with `pstats.Stats`, and as
+    collapsed stacks (`frame;frame;frame count` lines) for flame graph tools.
+    """
+
+    def __init__(self, directory: str, capacity: int) -> None:
+        self._directory = Path(directory)
+        self._capacity = capacity
+
+    def ids(self) -> list[str]:
+        """Ids of the stored profiles, the newest first."""
+        if not self._directory.is_dir():
+            return []
+        ids = {path.stem for path in self._directory.iterdir() if _ID_RE.fullmatch(path.stem)}
+        return sorted(ids, key=lambda id: int(id.partition("-")[0]), reverse=True)
+
+    def path(self, id: str, kind: str) -> Path | None:
+        if not _ID_RE.fullmatch(id) or kind not in _KINDS:
+            return None
+        path = self._directory / f"{id}.{kind}"
+        return path if path.is_file() else None
+
+    def save(self, id: str, profiler: cProfile.Profile, stacks: t.Mapping[str, int]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(self._directory / f"{id}.pstats")
+        with open(self._directory / f"{id}.collapsed", "w") as file:
+            file.writelines(f"{stack} {count}\n" for stack, count in stacks.items())
+        for old in self.ids()[self._capacity :]:
+            for kind in _KINDS:
+                (self._directory / f"{old}.{kind}").unlink(missing_ok=True)
+
+
+class _StackSampler(threading.Thread):
+    """Counts the stacks of a thread, sampled at a fixed interval."""
+
+    def __init__(self, thread_id: int) -> None:
+        super().__init__(name="profile-sampler", daemon=True)
+        self._thread_id = thread_id
+        self._stopped = threading.Event()
+        self.stacks: collections.Counter[str] = collections.Counter()
+
+    def run(self) -> None:
+        while not self._stopped.wait(_SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def profiling_middleware(
+    store: ProfileStore, secret: str | None, sample_rate: float, skipped_routes: t.Collection[str] = ()
+) -> Middleware:
+    """Profiles requests with a valid `X-Profile` token, and a `sample_rate` fraction of the others.
+
+    The profile covers everything the event loop thread runs while the request is handled,
+    including other requests handled concurrently. One request is profiled at a time, the
+    id of the profile is returned in the `X-Profile-Id` header.
+
+    Args:
+        store: Where profiles are saved.
+        secret: Key signing the `X-Profile` tokens, see `sign_profile_token`. `None` disables them.
+        sample_rate: Fraction of requests profiled without a token, from 0 to 1.
+        skipped_routes: Names of routes never profiled, e.g. the ones serving profiles.
+    """
+    profiling = False
+
+    @web.middleware
+    async def middleware(
+        request: web.Request,
+        handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        nonlocal profiling
+        route = request.match_info.route.name or "unmatched"
+        if (
+            profiling
+            or route in skipped_routes
+            or not (
+                (sample_rate > 0 and random.random() < sample_rate)
+                or _is_valid_token(secret, request.headers.get(PROFILE_HEADER))
+            )
+        ):
+            return await handler(request)
+        id = f"{time.time_ns()}-{route}-{REQUEST_ID_VAR.get(None) or '0'}"
+        profiling = True
+        sampler = _StackSampler(threading.get_ident())
+        profiler = cProfile.Profile()
+        sampler.start()
+        profiler.enable()
+        try:
+            response = await handler(request)
+        finally:
+            profiler.disable()
+            sampler.stop()
+            profiling = False
+            await asyncio.get_running_loop().run_in_executor(None, store.save, id, profiler, sampler.stacks)
+            LOG.info("request profiled", profile_id=id)
+        if not response.prepared:
+            response.headers[PROFILE_ID_HEADER] = id
+        return response
+
+    return middleware
+
+
+def list_profiles_endpoint(store: ProfileStore, secret: str | None) -> Endpoint:
+    async def handler(request: web.Request) -> web.Response:
+        if not _is_valid_token(secret, request.headers.get(PROFILE_HEADER)):
+            return web.json_response({"error": "forbidden"}, status=HTTPStatus.FORBIDDEN)
+        ids = await asyncio.get_running_loop().run_in_executor(None, store.ids)
+        files = request.app.router["profile_file"]
+        profiles = []
+        for id in ids:
+            created, route, request_id = id.split("-")
+            profiles.append(
+                {
+                    "id": id,
+                    "route": route,
+                    "request_id": request_id,
+                    "created_at": int(created) / 1e9,
+                    "files": [str(files.url_for(id=id, kind=kind)) for kind in _KINDS],
+                }
+            )
+        return web.json_response({"profiles": profiles})
+
+    return handler
+
+
+def get_profile_file_endpoint(store: ProfileStore, secret: str | None) -> Endpoint:
+    async def handler(request: web.Request) -> web.StreamResponse:
+        if not _is_valid_token(secret, request.headers.get(PROFILE_HEADER)):
+            return web.json_response({"error": "forbidden"}, status=HTTPStatus.FORBIDDEN)
+        kind = request.match_info["kind"]
+        path = store.path(request.match_info["id"], kind)
+        if path is None:
+            return web.json_response({"error": "profile not found"}, status=HTTPStatus.NOT_FOUND)
+        return web.FileResponse(path, headers={"Content-Type": _KINDS[kind]})
+
+    return handler
+
+
+def list_slow_queries_endpoint(slow_queries: SlowQueryLog | None, secret: str | None) -> Endpoint:
+    """Slow statements with their plans, behind the same tokens as the profiles."""
+
+    async def handler(request: web.Request) -> web.Response:
+        if not _is_valid_token(secret, request.headers.get(PROFILE_HEADER)):
+            return web.json_response({"error": "forbidden"}, status=HTTPStatus.FORBIDDEN)
+        queries = slow_queries.queries() if slow_queries is not None else []
+        return web.json_response({"queries": [query.to_dict() for query in queries]})
+
+    return handler
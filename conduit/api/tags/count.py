@@ -0,0 +1,46 @@
+__all__ = [
+    "tag_article_counter",
+]
+
+import asyncio
+import typing as t
+from contextlib import suppress
+
+import structlog
+from aiohttp import web
+
+from conduit.core.use_cases import UseCase
+from conduit.core.use_cases.tags.count import CountTagArticlesInput, CountTagArticlesResult
+
+LOG = structlog.get_logger(__name__)
+
+
+def tag_article_counter(
+    use_case: UseCase[CountTagArticlesInput, CountTagArticlesResult], interval: float
+) -> t.Callable[[web.Application], t.AsyncIterator[None]]:
+    """Cleanup context bringing the article counts of tags up to date every `interval` seconds.
+
+    Popular tags are ordered by these counts, they lag behind new and deleted articles until then.
+    """
+
+    async def counter(_: web.Application) -> t.AsyncIterator[None]:
+        task = asyncio.create_task(_count_periodically(use_case, interval))
+        yield
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    return counter
+
+
+async def _count_periodically(
+    use_case: UseCase[CountTagArticlesInput, CountTagArticlesResult], interval: float
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            result = await use_case.execute(CountTagArticlesInput())
+        except Exception:
+            LOG.warning("counting articles of tags failed", exc_info=True)
+        else:
+            LOG.debug("counted articles of tags", tags=result.tags)
@@ -2,17 +2,21 @@ __all__ = [
     "list_tags_endpoint",
 ]
 
-from dataclasses import dataclass
+import json
+import typing as t
+from dataclasses import dataclass, replace
 from http import HTTPStatus
 
 from aiohttp import web
-from aiohttp_apispec import docs, response_schema
-from marshmallow import Schema, fields
+from aiohttp_apispec import docs, querystring_schema, response_schema
+from marshmallow import Schema, fields, post_load, validate
 
 from conduit.api.base import Endpoint
+from conduit.api.cache import StaleWhileRevalidateCache
 from conduit.core.entities.article import Tag
 from conduit.core.use_cases import UseCase
 from conduit.core.use_cases.tags.list import ListTagsInput, ListTagsResult
+from conduit.core.use_cases.tags.popular import ListPopularTagsInput, ListPopularTagsResult
 
 
 @dataclass(frozen=True)
@@ -26,18 +30,79 @@ class TagsResponseModel:
     def response(self) -> web.Response:
         return web.json_response(TagsResponseSchema().dump(self))
 
+    def body(self) -> bytes:
+        return json.dumps(TagsResponseSchema().dump(self)).encode()
+
 
 class TagsResponseSchema(Schema):
     tags = fields.List(fields.String, required=True)
 
 
-def list_tags_endpoint(use_case: UseCase[ListTagsInput, ListTagsResult]) -> Endpoint:
-    @docs(tags=["tags"], summary="List all tags.")
-    @response_schema(TagsResponseSchema, code=HTTPStatus.OK)
-    async def handler(_: web.Request) -> web.Response:
-        input = ListTagsInput()
+class ListTagsQueryParamsSchema(Schema):
+    sort = fields.String(required=False, validate=validate.OneOf(["popular"]))
+    limit = fields.Integer(required=False, validate=validate.Range(min=1, max=1000))
+
+    @post_load
+    def to_input(self, data: dict[str, t.Any], **_: t.Any) -> ListTagsInput | ListPopularTagsInput:
+        if data.pop("sort", None) == "popular":
+            return ListPopularTagsInput(**data)
+        return ListTagsInput(**data)
+
+
+async def stream_tags(
+    request: web.Request, use_case: UseCase[ListTagsInput, ListTagsResult], input: ListTagsInput
+) -> web.StreamResponse:
+    """Writes the tags listed by `use_case` as a `TagsResponseSchema` document, a page at a time.
+
+    The response starts with the first page, so a use case failing before that gets an error response.
+    """
+    response = web.StreamResponse(headers={"Content-Type": "application/json; charset=utf-8"})
+
+    async def write_page(page: list[Tag]) -> None:
+        if response.prepared:
+            await response.write(b", ")
+        else:
+            await response.prepare(request)
+            await response.write(b'{"tags": [')
+        # A page is never empty, the brackets of its JSON array are dropped.
+        await response.write(json.dumps([str(tag) for tag in page])[1:-1].encode())
+
+    await use_case.execute(replace(input, write_page=write_page))
+    if not response.prepared:
+        await response.prepare(request)
+        await response.write(b'{"tags": [')
+    await response.write(b"]}")
+    await response.write_eof()
+    return response
+
+
+def list_tags_endpoint(
+    use_case: UseCase[ListTagsInput, ListTagsResult],
+    popular_use_case: UseCase[ListPopularTagsInput, ListPopularTagsResult],
+    cache: StaleWhileRevalidateCache[ListTagsInput | ListPopularTagsInput, bytes],
+) -> Endpoint:
+    async def render(input: ListTagsInput | ListPopularTagsInput) -> bytes:
+        if isinstance(input, ListPopularTagsInput):
+            popular_result = await popular_use_case.execute(input)
+            return TagsResponseModel.new(popular_result.tags).body()
         result = await use_case.execute(input)
-        response_model = TagsResponseModel.new(result.tags)
-        return response_model.response()
+        return TagsResponseModel.new(result.tags).body()
+
+    @docs(
+        tags=["tags"],
+        summary="List tags, by name or the most popular first.",
+        description="Without `sort` every tag is listed, or only the first `limit` ones. "
+        "With `sort=popular` the `limit` tags of the most articles are listed, 20 by default.",
+    )
+    @querystring_schema(ListTagsQueryParamsSchema, put_into="input")
+    @response_schema(TagsResponseSchema, code=HTTPStatus.OK)
+    async def handler(request: web.Request) -> web.StreamResponse:
+        input = request["input"]
+        assert isinstance(input, (ListTagsInput, ListPopularTagsInput))
+        if isinstance(input, ListTagsInput) and input.limit is None and not cache.enabled:
+            # Without the cache, every request would materialize the whole list, it is streamed instead.
+            return await stream_tags(request, use_case, input)
+        body = await cache.get(input, lambda: render(input))
+        return web.Response(body=body, content_type="application/json")
 
     return handler
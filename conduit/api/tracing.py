@@ -0,0 +1,49 @@
+__all__ = [
+    "TracedUseCase",
+    "tracing_middleware",
+]
+
+import typing as t
+
+from aiohttp import web
+from aiohttp.typedefs import Middleware
+
+from conduit.core.entities.unit_of_work import REQUEST_ID_VAR
+from conduit.core.use_cases import UseCase
+from conduit.tracing import Tracer
+
+T = t.TypeVar("T")
+R = t.TypeVar("R")
+
+
+def tracing_middleware(tracer: Tracer) -> Middleware:
+    """Traces every request in a root span, the id of the trace is the id of the request."""
+
+    @web.middleware
+    async def middleware(
+        request: web.Request,
+        handler: t.Callable[[web.Request], t.Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        route = request.match_info.route.name or "unmatched"
+        request_id = REQUEST_ID_VAR.get(None)
+        with tracer.span(
+            f"{request.method} {route}", trace_id=request_id, request_id=request_id, path=request.path
+        ) as span:
+            response = await handler(request)
+            span.attributes["status"] = response.status
+            return response
+
+    return middleware
+
+
+class TracedUseCase(UseCase[T, R]):
+    """Traces every execution of a use case."""
+
+    def __init__(self, use_case: UseCase[T, R], tracer: Tracer, name: str) -> None:
+        self._use_case = use_case
+        self._tracer = tracer
+        self._name = f"use_case {name}"
+
+    async def execute(self, input: T, /) -> R:
+        with self._tracer.span(self._name):
+            return await self._use_case.execute(input)
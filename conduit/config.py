@@ -1,5 +1,6 @@
 __all__ = [
     "db_url",
+    "replica_db_url",
     "settings",
 ]
 
@@ -17,6 +18,32 @@ settings = Dynaconf(
         Validator("POSTGRES_PORT", required=True, cast=int),
         Validator("SECRET_KEY", required=True),
         Validator("LISTEN_PORT", required=True, cast=int, default="8080"),
+        Validator("REPOSITORY_BACKEND", default="sqlalchemy", is_in=["sqlalchemy", "asyncpg", "memory"]),
+        Validator("POSTGRES_REPLICA_HOST", default=None),
+        Validator("POSTGRES_REPLICA_PORT", default=None),
+        Validator("READ_YOUR_WRITES_SECONDS", cast=float, default=5.0),
+        Validator("REQUEST_DEADLINE_SECONDS", cast=float, default=10.0),
+        Validator("ROUTE_DEADLINE_SECONDS", is_type_of=dict, default={}),
+        Validator("TAGS_CACHE_SECONDS", cast=float, default=30.0),
+        Validator("TAGS_CACHE_STALE_SECONDS", cast=float, default=300.0),
+        Validator("TAG_COUNT_SECONDS", cast=float, default=5.0),
+        Validator("ARTICLE_CACHE_SECONDS", cast=float, default=5.0),
+        Validator("ARTICLE_CACHE_NEGATIVE_SECONDS", cast=float, default=2.0),
+        Validator("ARTICLE_CACHE_MAX_BYTES", cast=int, default=32 * 1024 * 1024),
+        Validator("LOOP_SLOW_CALLBACK_SECONDS", cast=float, default=0.05),
+        Validator("SLOW_QUERY_SECONDS", cast=float, default=0.1),
+        Validator("SLOW_QUERY_CAPACITY", cast=int, default=100),
+        Validator("SLOW_QUERY_LOG_PARAMETERS", cast=bool, default=False),
+        Validator("LOG_MODE", default="verbose", is_in=["verbose", "fast"]),
+        Validator("LOG_LEVEL", default="info", is_in=["debug", "info", "warning", "error", "critical"]),
+        Validator("LOG_DEBUG_SAMPLE_RATES", is_type_of=dict, default={}),
+        Validator("TRACING_EXPORTER", default="none", is_in=["none", "file", "otlp"]),
+        Validator("TRACING_FILE", default="/tmp/conduit-spans.jsonl"),
+        Validator("TRACING_OTLP_ENDPOINT", default="http://localhost:4318"),
+        Validator("PROFILE_SECRET", default=None),
+        Validator("PROFILE_SAMPLE_RATE", cast=float, default=0.0),
+        Validator("PROFILE_DIRECTORY", default="/tmp/conduit-profiles"),
+        Validator("PROFILE_CAPACITY", cast=int, default=50),
     ],
 )
 settings.validators.validate_all()
@@ -31,3 +58,14 @@ def db_url(driver: str = "postgresql+asyncpg") -> URL:
         host=settings.POSTGRES_HOST,
         port=settings.POSTGRES_PORT,
     )
+
+
+def replica_db_url(driver: str = "postgresql+asyncpg") -> URL | None:
+    """Read replica URL, or `None` if no replica is configured.
+
+    The replica shares credentials and database name with the primary, only the host and the port differ.
+    """
+    if settings.POSTGRES_REPLICA_HOST is None:
+        return None
+    port = settings.POSTGRES_REPLICA_PORT if settings.POSTGRES_REPLICA_PORT is not None else settings.POSTGRES_PORT
+    return db_url(driver).set(host=settings.POSTGRES_REPLICA_HOST, port=int(port))
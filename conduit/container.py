@@ -4,11 +4,14 @@ __all__ = [
     "create_app",
 ]
 
+import asyncio
+
 from aiohttp import web
 from aiohttp_apispec import setup_aiohttp_apispec, validation_middleware
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import DependenciesContainer, Provider, Singleton
-from sqlalchemy.ext.asyncio import create_async_engine
+from dependency_injector.providers import DependenciesContainer, Object, Provider, Selector, Singleton
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from conduit.api.articles.create import create_article_endpoint
 from conduit.api.articles.delete import delete_article_endpoint
@@ -16,25 +19,50 @@ from conduit.api.articles.favorite import favorite_article_endpoint
 from conduit.api.articles.feed import feed_articles_endpoint
 from conduit.api.articles.get import get_article_endpoint
 from conduit.api.articles.list import list_articles_endpoint
+from conduit.api.articles.search import search_articles_endpoint
 from conduit.api.articles.unfavorite import unfavorite_article_endpoint
 from conduit.api.articles.update import update_article_endpoint
+from conduit.api.cache import StaleWhileRevalidateCache
 from conduit.api.comments.add_to_article import add_comment_to_article_endpoint
 from conduit.api.comments.delete import delete_comment_endpoint
 from conduit.api.comments.get_from_article import get_comments_from_article_endpoint
 from conduit.api.errors import domain_error_handling_middleware
 from conduit.api.healthcheck import healthcheck
-from conduit.api.middlewares import logging_middleware, request_id_middleware
+from conduit.api.metrics import (
+    TimedUseCase,
+    loop_lag_probe,
+    metrics_endpoint,
+    metrics_middleware,
+    slow_callback_detector,
+)
+from conduit.api.middlewares import (
+    data_loader_middleware,
+    deadline_middleware,
+    debug_sampling_middleware,
+    logging_middleware,
+    request_id_middleware,
+)
 from conduit.api.profiles.follow import follow_endpoint
 from conduit.api.profiles.get import get_profile_endpoint
 from conduit.api.profiles.unfollow import unfollow_endpoint
+from conduit.api.profiling import (
+    ProfileStore,
+    get_profile_file_endpoint,
+    list_profiles_endpoint,
+    list_slow_queries_endpoint,
+    profiling_middleware,
+)
+from conduit.api.tags.count import tag_article_counter
 from conduit.api.tags.list import list_tags_endpoint
+from conduit.api.tracing import TracedUseCase, tracing_middleware
 from conduit.api.users import (
     get_current_user_endpoint,
     sign_in_endpoint,
     sign_up_endpoint,
     update_current_user_endpoint,
 )
-from conduit.config import db_url, settings
+from conduit.config import db_url, replica_db_url, settings
+from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.use_cases import UseCase
 from conduit.core.use_cases.articles.create import CreateArticleInput, CreateArticleResult, CreateArticleUseCase
 from conduit.core.use_cases.articles.delete import DeleteArticleInput, DeleteArticleResult, DeleteArticleUseCase
@@ -42,6 +70,7 @@ from conduit.core.use_cases.articles.favorite import FavoriteArticleInput, Favor
 from conduit.core.use_cases.articles.feed import FeedArticlesInput, FeedArticlesResult, FeedArticlesUseCase
 from conduit.core.use_cases.articles.get import GetArticleInput, GetArticleResult, GetArticleUseCase
 from conduit.core.use_cases.articles.list import ListArticlesInput, ListArticlesResult, ListArticlesUseCase
+from conduit.core.use_cases.articles.search import SearchArticlesInput, SearchArticlesResult, SearchArticlesUseCase
 from conduit.core.use_cases.articles.unfavorite import (
     UnfavoriteArticleInput,
     UnfavoriteArticleResult,
@@ -63,7 +92,17 @@ from conduit.core.use_cases.comments.get_from_article import (
 from conduit.core.use_cases.profiles.follow import FollowInput, FollowResult, FollowUseCase
 from conduit.core.use_cases.profiles.get import GetProfileInput, GetProfileResult, GetProfileUseCase
 from conduit.core.use_cases.profiles.unfollow import UnfollowInput, UnfollowResult, UnfollowUseCase
+from conduit.core.use_cases.tags.count import (
+    CountTagArticlesInput,
+    CountTagArticlesResult,
+    CountTagArticlesUseCase,
+)
 from conduit.core.use_cases.tags.list import ListTagsInput, ListTagsResult, ListTagsUseCase
+from conduit.core.use_cases.tags.popular import (
+    ListPopularTagsInput,
+    ListPopularTagsResult,
+    ListPopularTagsUseCase,
+)
 from conduit.core.use_cases.users.get_current import GetCurrentUserInput, GetCurrentUserResult, GetCurrentUserUseCase
 from conduit.core.use_cases.users.sign_in import SignInInput, SignInResult, SignInUseCase
 from conduit.core.use_cases.users.sign_up import SignUpInput, SignUpResult, SignUpUseCase
@@ -72,64 +111,148 @@ from conduit.core.use_cases.users.update_current import (
     UpdateCurrentUserResult,
     UpdateCurrentUserUseCase,
 )
+from conduit.impl.article_cache import InProcessArticleCache
+from conduit.impl.asyncpg.unit_of_work import AsyncpgUnitOfWork
 from conduit.impl.auth_token_generator import JwtAuthTokenGenerator
+from conduit.impl.memory.unit_of_work import MemoryUnitOfWork
 from conduit.impl.password_hasher import Argon2idPasswordHasher
-from conduit.impl.unit_of_work import PostgresqlUnitOfWork
+from conduit.impl.read_your_writes import ReadYourWrites
+from conduit.impl.tracing import TracedUnitOfWork
+from conduit.impl.unit_of_work import PoolStats, PostgresqlUnitOfWork
+from conduit.metrics import Registry, Samples
+from conduit.slow_queries import SlowQueryLog
+from conduit.tracing import FileExporter, OtlpExporter, Tracer
 
 
 def create_app() -> web.Application:
-    use_cases = UseCases(deps=Dependencies())
+    deps = Dependencies()
+    use_cases = UseCases(deps=deps)
     use_cases.check_dependencies()
+    registry = deps.metrics()
+    # Closed on cleanup, the traced wrapper below does not own its pools.
+    unit_of_work = deps.unit_of_work()
+    tracer: Tracer | None = deps.tracer()
+    if tracer is not None:
+        deps.unit_of_work.override(Object(TracedUnitOfWork(deps.unit_of_work(), tracer)))
+    _instrument_use_cases(use_cases, registry, tracer)
+    _register_collectors(registry, deps)
 
     app = web.Application()
     app.add_routes(
         [
             # Users
-            web.post("/api/v1/users", sign_up_endpoint(use_cases.sign_up())),
-            web.post("/api/v1/users/login", sign_in_endpoint(use_cases.sign_in())),
-            web.get("/api/v1/user", get_current_user_endpoint(use_cases.get_current_user())),
-            web.put("/api/v1/user", update_current_user_endpoint(use_cases.update_current_user())),
+            web.post("/api/v1/users", sign_up_endpoint(use_cases.sign_up()), name="sign_up"),
+            web.post("/api/v1/users/login", sign_in_endpoint(use_cases.sign_in()), name="sign_in"),
+            web.get("/api/v1/user", get_current_user_endpoint(use_cases.get_current_user()), name="get_current_user"),
+            web.put(
+                "/api/v1/user",
+                update_current_user_endpoint(use_cases.update_current_user()),
+                name="update_current_user",
+            ),
             # Profiles
-            web.get("/api/v1/profiles/{username}", get_profile_endpoint(use_cases.get_profile())),
-            web.post("/api/v1/profiles/{username}/follow", follow_endpoint(use_cases.follow())),
-            web.delete("/api/v1/profiles/{username}/follow", unfollow_endpoint(use_cases.unfollow())),
+            web.get("/api/v1/profiles/{username}", get_profile_endpoint(use_cases.get_profile()), name="get_profile"),
+            web.post("/api/v1/profiles/{username}/follow", follow_endpoint(use_cases.follow()), name="follow"),
+            web.delete("/api/v1/profiles/{username}/follow", unfollow_endpoint(use_cases.unfollow()), name="unfollow"),
             # Articles
-            web.post("/api/v1/articles", create_article_endpoint(use_cases.create_article())),
-            web.get("/api/v1/articles", list_articles_endpoint(use_cases.list_articles())),
-            web.get("/api/v1/articles/feed", feed_articles_endpoint(use_cases.feed_articles())),
-            web.get("/api/v1/articles/{slug}", get_article_endpoint(use_cases.get_article())),
-            web.put("/api/v1/articles/{slug}", update_article_endpoint(use_cases.update_article())),
-            web.delete("/api/v1/articles/{slug}", delete_article_endpoint(use_cases.delete_article())),
-            web.post("/api/v1/articles/{slug}/favorite", favorite_article_endpoint(use_cases.favorite_article())),
-            web.delete("/api/v1/articles/{slug}/favorite", unfavorite_article_endpoint(use_cases.unfavorite_article())),
+            web.post("/api/v1/articles", create_article_endpoint(use_cases.create_article()), name="create_article"),
+            web.get("/api/v1/articles", list_articles_endpoint(use_cases.list_articles()), name="list_articles"),
+            web.get("/api/v1/articles/feed", feed_articles_endpoint(use_cases.feed_articles()), name="feed_articles"),
+            web.get(
+                "/api/v1/articles/search", search_articles_endpoint(use_cases.search_articles()), name="search_articles"
+            ),
+            web.get("/api/v1/articles/{slug}", get_article_endpoint(use_cases.get_article()), name="get_article"),
+            web.put(
+                "/api/v1/articles/{slug}", update_article_endpoint(use_cases.update_article()), name="update_article"
+            ),
+            web.delete(
+                "/api/v1/articles/{slug}", delete_article_endpoint(use_cases.delete_article()), name="delete_article"
+            ),
+            web.post(
+                "/api/v1/articles/{slug}/favorite",
+                favorite_article_endpoint(use_cases.favorite_article()),
+                name="favorite_article",
+            ),
+            web.delete(
+                "/api/v1/articles/{slug}/favorite",
+                unfavorite_article_endpoint(use_cases.unfavorite_article()),
+                name="unfavorite_article",
+            ),
             # Comments
             web.post(
                 "/api/v1/articles/{slug}/comments",
                 add_comment_to_article_endpoint(use_cases.add_comment_to_article()),
+                name="add_comment_to_article",
             ),
             web.get(
                 "/api/v1/articles/{slug}/comments",
                 get_comments_from_article_endpoint(use_cases.get_comments_from_article()),
+                name="get_comments_from_article",
             ),
             web.delete(
                 r"/api/v1/articles/{slug}/comments/{comment_id:\d+}",
                 delete_comment_endpoint(use_cases.delete_comment()),
+                name="delete_comment",
             ),
             # Tags
-            web.get("/api/v1/tags", list_tags_endpoint(use_cases.list_tags())),
+            web.get(
+                "/api/v1/tags",
+                list_tags_endpoint(use_cases.list_tags(), use_cases.list_popular_tags(), deps.tags_cache()),
+                name="list_tags",
+            ),
             # Healthcheck
-            web.get("/api/v1/healthcheck", healthcheck),
+            web.get("/api/v1/healthcheck", healthcheck, name="healthcheck"),
+            # Metrics
+            web.get("/metrics", metrics_endpoint(registry), name="metrics"),
+            # Profiles
+            web.get(
+                "/debug/profiles",
+                list_profiles_endpoint(deps.profile_store(), settings.PROFILE_SECRET),
+                name="list_profiles",
+            ),
+            web.get(
+                r"/debug/profiles/{id:\d+-\w+-[0-9a-f]+}.{kind:pstats|collapsed}",
+                get_profile_file_endpoint(deps.profile_store(), settings.PROFILE_SECRET),
+                name="profile_file",
+            ),
+            web.get(
+                "/debug/slow-queries",
+                list_slow_queries_endpoint(deps.slow_queries(), settings.PROFILE_SECRET),
+                name="list_slow_queries",
+            ),
         ]
     )
     app.middlewares.extend(
         [
             request_id_middleware,
+            debug_sampling_middleware(settings.LOG_DEBUG_SAMPLE_RATES),
+            *([tracing_middleware(tracer)] if tracer is not None else []),
+            metrics_middleware(registry),
             logging_middleware,
+            profiling_middleware(
+                deps.profile_store(),
+                settings.PROFILE_SECRET,
+                settings.PROFILE_SAMPLE_RATE,
+                skipped_routes={"metrics", "list_profiles", "profile_file", "list_slow_queries"},
+            ),
+            deadline_middleware(settings.REQUEST_DEADLINE_SECONDS, settings.ROUTE_DEADLINE_SECONDS),
+            data_loader_middleware,
             validation_middleware,
             domain_error_handling_middleware,
         ]
     )
 
+    app.on_cleanup.append(lambda _: _close_pools(deps, unit_of_work))
+    app.cleanup_ctx.append(loop_lag_probe(registry))
+    if settings.TAG_COUNT_SECONDS > 0:
+        app.cleanup_ctx.append(tag_article_counter(use_cases.count_tag_articles(), settings.TAG_COUNT_SECONDS))
+    if tracer is not None:
+        app.on_cleanup.append(lambda _: asyncio.to_thread(tracer.exporter.close))
+    if settings.LOOP_SLOW_CALLBACK_SECONDS > 0:
+        app.cleanup_ctx.append(slow_callback_detector(registry, settings.LOOP_SLOW_CALLBACK_SECONDS))
+    slow_queries: SlowQueryLog | None = deps.slow_queries()
+    if slow_queries is not None:
+        app.on_cleanup.append(lambda _: slow_queries.close())
+
     setup_aiohttp_apispec(
         app=app,
         title="Conduit API",
@@ -140,12 +263,154 @@ def create_app() -> web.Application:
     return app
 
 
+def _dsn(url: URL | None) -> str | None:
+    return url.render_as_string(hide_password=False) if url is not None else None
+
+
+async def _close_pools(deps: "Dependencies", unit_of_work: UnitOfWork) -> None:
+    """Closes the connections of the database pools of the unit of work."""
+    if isinstance(unit_of_work, AsyncpgUnitOfWork):
+        await unit_of_work.close()
+    elif isinstance(unit_of_work, PostgresqlUnitOfWork):
+        await deps.db().dispose()
+        replica_db: AsyncEngine | None = deps.replica_db()
+        if replica_db is not None:
+            await replica_db.dispose()
+
+
+def _instrument_use_cases(use_cases: "UseCases", registry: Registry, tracer: Tracer | None) -> None:
+    """Makes every use case record its durations, labelled by its name in `UseCases`, and trace its executions."""
+    durations = registry.histogram(
+        "conduit_use_case_duration_seconds", "Duration of use case executions.", label_names=("use_case",)
+    )
+    for name, provider in use_cases.providers.items():
+        if isinstance(provider, Singleton):
+            use_case = provider()
+            if tracer is not None:
+                use_case = TracedUseCase(use_case, tracer, name)
+            provider.override(Object(TimedUseCase(use_case, durations.labels(name))))
+
+
+def _register_collectors(registry: Registry, deps: "Dependencies") -> None:
+    """Registers the metrics read from dependencies when scraped."""
+    unit_of_work = deps.unit_of_work()
+    password_hasher = deps.password_hasher()
+    tags_cache = deps.tags_cache()
+    article_cache = deps.article_cache()
+    slow_queries: SlowQueryLog | None = deps.slow_queries()
+
+    def pool_connections() -> Samples:
+        stats: list[PoolStats] = unit_of_work.pool_stats()
+        for pool, in_use, idle in stats:
+            yield (pool, "in_use"), in_use
+            yield (pool, "idle"), idle
+
+    registry.callback(
+        "conduit_db_pool_connections",
+        "Connections of the database pools.",
+        "gauge",
+        pool_connections,
+        label_names=("pool", "state"),
+    )
+    registry.callback(
+        "conduit_password_hasher_pending",
+        "Password hashes and verifications queued or running in the executor.",
+        "gauge",
+        lambda: [((), password_hasher.pending)],
+    )
+    registry.callback(
+        "conduit_cache_requests_total",
+        "Requests of in-process caches by result: served fresh, served stale or loaded.",
+        "counter",
+        lambda: [
+            (("tags", "hit"), tags_cache.hits),
+            (("tags", "stale"), tags_cache.stale_hits),
+            (("tags", "miss"), tags_cache.misses),
+            (("articles", "hit"), article_cache.hits),
+            (("articles", "negative_hit"), article_cache.negative_hits),
+            (("articles", "miss"), article_cache.misses),
+        ],
+        label_names=("cache", "result"),
+    )
+    registry.callback(
+        "conduit_cache_evictions_total",
+        "Entries evicted from in-process caches to stay within their size.",
+        "counter",
+        lambda: [(("articles",), article_cache.evictions)],
+        label_names=("cache",),
+    )
+    registry.callback(
+        "conduit_cache_bytes",
+        "Estimated memory of the entries of in-process caches.",
+        "gauge",
+        lambda: [(("articles",), article_cache.bytes)],
+        label_names=("cache",),
+    )
+    if slow_queries is not None:
+        registry.callback(
+            "conduit_db_slow_statements_total",
+            "Statements slower than the threshold of the slow query log.",
+            "counter",
+            lambda: [((), slow_queries.recorded)],
+        )
+
+
 class Dependencies(DeclarativeContainer):
     """Application's dependencies."""
 
     db = Singleton(create_async_engine, db_url())
-    unit_of_work = Singleton(PostgresqlUnitOfWork, db)
+    replica_db = Object(None) if replica_db_url() is None else Singleton(create_async_engine, replica_db_url())
+    read_your_writes = Singleton(ReadYourWrites, window=settings.READ_YOUR_WRITES_SECONDS)
+    tags_cache: Singleton[StaleWhileRevalidateCache[ListTagsInput | ListPopularTagsInput, bytes]] = Singleton(
+        StaleWhileRevalidateCache,
+        ttl=settings.TAGS_CACHE_SECONDS,
+        stale=settings.TAGS_CACHE_STALE_SECONDS,
+    )
+    article_cache = Singleton(
+        InProcessArticleCache,
+        ttl=settings.ARTICLE_CACHE_SECONDS,
+        negative_ttl=settings.ARTICLE_CACHE_NEGATIVE_SECONDS,
+        max_bytes=settings.ARTICLE_CACHE_MAX_BYTES,
+    )
+    slow_queries = (
+        Object(None)
+        if settings.SLOW_QUERY_SECONDS <= 0
+        else Singleton(
+            SlowQueryLog,
+            threshold=settings.SLOW_QUERY_SECONDS,
+            capacity=settings.SLOW_QUERY_CAPACITY,
+            log_parameters=settings.SLOW_QUERY_LOG_PARAMETERS,
+        )
+    )
+    unit_of_work = Selector(
+        Object(settings.REPOSITORY_BACKEND),
+        sqlalchemy=Singleton(
+            PostgresqlUnitOfWork,
+            db,
+            replica_engine=replica_db,
+            read_your_writes=read_your_writes,
+            on_tags_created=tags_cache.provided.invalidate,
+            slow_queries=slow_queries,
+        ),
+        asyncpg=Singleton(
+            AsyncpgUnitOfWork,
+            dsn=_dsn(db_url(driver="postgresql")),
+            replica_dsn=_dsn(replica_db_url(driver="postgresql")),
+            read_your_writes=read_your_writes,
+            on_tags_created=tags_cache.provided.invalidate,
+            slow_queries=slow_queries,
+        ),
+        memory=Singleton(MemoryUnitOfWork, on_tags_created=tags_cache.provided.invalidate),
+    )
     password_hasher = Singleton(Argon2idPasswordHasher)
+    profile_store = Singleton(ProfileStore, directory=settings.PROFILE_DIRECTORY, capacity=settings.PROFILE_CAPACITY)
+    metrics = Singleton(Registry)
+    tracer = Selector(
+        Object(settings.TRACING_EXPORTER),
+        none=Object(None),
+        file=Singleton(Tracer, Singleton(FileExporter, settings.TRACING_FILE)),
+        otlp=Singleton(Tracer, Singleton(OtlpExporter, settings.TRACING_OTLP_ENDPOINT)),
+    )
     auth_token_generator = Singleton(JwtAuthTokenGenerator, secret_key=settings.SECRET_KEY)
 
 
@@ -203,7 +468,7 @@ class UseCases(DeclarativeContainer):
     create_article: Provider[UseCase[CreateArticleInput, CreateArticleResult]] = Singleton(
         WithAuthentication,
         auth_token_generator=deps.auth_token_generator,
-        use_case=Singleton(CreateArticleUseCase, unit_of_work=deps.unit_of_work),
+        use_case=Singleton(CreateArticleUseCase, unit_of_work=deps.unit_of_work, article_cache=deps.article_cache),
     )
     list_articles: Provider[UseCase[ListArticlesInput, ListArticlesResult]] = Singleton(
         WithAuthentication,
@@ -215,20 +480,25 @@ class UseCases(DeclarativeContainer):
         auth_token_generator=deps.auth_token_generator,
         use_case=Singleton(FeedArticlesUseCase, unit_of_work=deps.unit_of_work),
     )
+    search_articles: Provider[UseCase[SearchArticlesInput, SearchArticlesResult]] = Singleton(
+        WithAuthentication,
+        auth_token_generator=deps.auth_token_generator,
+        use_case=Singleton(SearchArticlesUseCase, unit_of_work=deps.unit_of_work),
+    )
     get_article: Provider[UseCase[GetArticleInput, GetArticleResult]] = Singleton(
         WithAuthentication,
         auth_token_generator=deps.auth_token_generator,
-        use_case=Singleton(GetArticleUseCase, unit_of_work=deps.unit_of_work),
+        use_case=Singleton(GetArticleUseCase, unit_of_work=deps.unit_of_work, article_cache=deps.article_cache),
     )
     update_article: Provider[UseCase[UpdateArticleInput, UpdateArticleResult]] = Singleton(
         WithAuthentication,
         auth_token_generator=deps.auth_token_generator,
-        use_case=Singleton(UpdateArticleUseCase, unit_of_work=deps.unit_of_work),
+        use_case=Singleton(UpdateArticleUseCase, unit_of_work=deps.unit_of_work, article_cache=deps.article_cache),
     )
     delete_article: Provider[UseCase[DeleteArticleInput, DeleteArticleResult]] = Singleton(
         WithAuthentication,
         auth_token_generator=deps.auth_token_generator,
-        use_case=Singleton(DeleteArticleUseCase, unit_of_work=deps.unit_of_work),
+        use_case=Singleton(DeleteArticleUseCase, unit_of_work=deps.unit_of_work, article_cache=deps.article_cache),
     )
     favorite_article: Provider[UseCase[FavoriteArticleInput, FavoriteArticleResult]] = Singleton(
         WithAuthentication,
@@ -250,7 +520,9 @@ class UseCases(DeclarativeContainer):
     get_comments_from_article: Provider[UseCase[GetCommentsFromArticleInput, GetCommentsFromArticleResult]] = Singleton(
         WithAuthentication,
         auth_token_generator=deps.auth_token_generator,
-        use_case=Singleton(GetCommentsFromArticleUseCase, unit_of_work=deps.unit_of_work),
+        use_case=Singleton(
+            GetCommentsFromArticleUseCase, unit_of_work=deps.unit_of_work, article_cache=deps.article_cache
+        ),
     )
     delete_comment: Provider[UseCase[DeleteCommentInput, DeleteCommentResult]] = Singleton(
         WithAuthentication,
@@ -263,3 +535,11 @@ class UseCases(DeclarativeContainer):
         ListTagsUseCase,
         unit_of_work=deps.unit_of_work,
     )
+    list_popular_tags: Provider[UseCase[ListPopularTagsInput, ListPopularTagsResult]] = Singleton(
+        ListPopularTagsUseCase,
+        unit_of_work=deps.unit_of_work,
+    )
+    count_tag_articles: Provider[UseCase[CountTagArticlesInput, CountTagArticlesResult]] = Singleton(
+        CountTagArticlesUseCase,
+        unit_of_work=deps.unit_of_work,
+    )
@@ -1,8 +1,10 @@
 __all__ = [
     "Article",
+    "ArticleCache",
     "ArticleFilter",
     "ArticleId",
     "ArticleRepository",
+    "ArticleSearchCursor",
     "ArticleSlug",
     "ArticleWithExtra",
     "CreateArticleInput",
@@ -71,6 +73,16 @@ class ArticleFilter:
     author: Username | None = None
     favorite_of: Username | None = None
     feed_of: UserId | None = None
+    # Full-text search query in web search syntax: words, "quoted phrases", `or` and `-excluded`.
+    query: str | None = None
+
+
+@dataclass(frozen=True)
+class ArticleSearchCursor:
+    """Position in search results: rank and id of the last article of a page."""
+
+    rank: float
+    id: ArticleId
 
 
 @dataclass(frozen=True)
@@ -99,6 +111,21 @@ class ArticleRepository(t.Protocol):
     async def count(self, filter: ArticleFilter) -> int:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    async def search(
+        self,
+        filter: ArticleFilter,
+        *,
+        limit: int,
+        after: ArticleSearchCursor | None,
+    ) -> list[tuple[Article, float]]:
+        """Finds articles matching `filter.query`, best matches first.
+
+        Returns:
+            Articles together with their rank.
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     async def get_by_slug(self, slug: ArticleSlug) -> Article | None:
         raise NotImplementedError()
@@ -109,25 +136,40 @@ class ArticleRepository(t.Protocol):
 
     @abc.abstractmethod
     async def delete(self, id: ArticleId) -> ArticleId | None:
+        """Deletes the article, and uncounts it from the article count of its tags by the next `count_articles`."""
+        raise NotImplementedError()
+
+
+class ArticleCache(t.Protocol):
+    """Articles by slug, including the slugs of no article."""
+
+    @abc.abstractmethod
+    async def get(self, slug: ArticleSlug, load: t.Callable[[], t.Awaitable[Article | None]]) -> Article | None:
+        """Returns the cached article with `slug`, calls `load` when there is none."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def invalidate(self, *slugs: ArticleSlug) -> None:
+        """Drops `slugs`, once a change of their articles is committed."""
         raise NotImplementedError()
 
 
 class FavoriteRepository(t.Protocol):
     @abc.abstractmethod
-    async def add(self, user_id: UserId, article_id: ArticleId) -> int:
-        """Adds `article_id` to the favorites of `user_id`.
+    async def add_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        """Adds the article with `slug` to the favorites of `user_id`.
 
         Returns:
-            The total number of users who have added `article_id` to their favorites.
+            The article as seen by `user_id` after the change, or `None` if the article does not exist.
         """
         raise NotImplementedError()
 
     @abc.abstractmethod
-    async def remove(self, user_id: UserId, article_id: ArticleId) -> int:
-        """Removes `article_id` from the favorites of `user_id`.
+    async def remove_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        """Removes the article with `slug` from the favorites of `user_id`.
 
         Returns:
-            The total number of users who have added `article_id` to their favorites.
+            The article as seen by `user_id` after the change, or `None` if the article does not exist.
         """
         raise NotImplementedError()
 
@@ -152,10 +194,31 @@ class FavoriteRepository(t.Protocol):
 class TagRepository(t.Protocol):
     @abc.abstractmethod
     async def create(self, article_id: ArticleId, tags: t.Collection[Tag]) -> None:
+        """Tags the article, counting it towards the tags it did not have by the next `count_articles`."""
         raise NotImplementedError()
 
     @abc.abstractmethod
-    async def get_all(self) -> list[Tag]:
+    async def create_many(self, tags: t.Mapping[ArticleId, t.Collection[Tag]]) -> None:
+        """Tags many articles at once, e.g. during an import."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_many(self, *, after: Tag | None, limit: int) -> list[Tag]:
+        """Returns up to `limit` tags ordered by name, starting right after `after`."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_popular(self, *, limit: int) -> list[Tag]:
+        """Returns the `limit` tags of the most articles, most popular first."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def count_articles(self) -> int:
+        """Adds the articles tagged and untagged since the last call to the article count of their tags.
+
+        Returns:
+            The number of tags whose count has been updated.
+        """
         raise NotImplementedError()
 
     @abc.abstractmethod
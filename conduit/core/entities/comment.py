@@ -47,7 +47,15 @@ class CreateCommentInput:
 
 @dataclass(frozen=True)
 class CommentFilter:
+    """Selects comments, ordered by id.
+
+    Attributes:
+        article_id: Only comments of this article.
+        after: Keyset cursor, only comments with a greater id.
+    """
+
     article_id: ArticleId | None = None
+    after: CommentId | None = None
 
 
 class CommentRepository(t.Protocol):
@@ -56,7 +64,12 @@ class CommentRepository(t.Protocol):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    async def get_many(self, filter: CommentFilter) -> list[Comment]:
+    async def get_many(self, filter: CommentFilter, *, limit: int | None) -> list[Comment]:
+        """Comments selected by `filter`, at most `limit` of them, all of them for `None`."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def count(self, filter: CommentFilter) -> int:
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -1,6 +1,7 @@
 __all__ = [
     "ArticleDoesNotExistError",
     "ConduitError",
+    "DeadlineExceededError",
     "EmailAlreadyExistsError",
     "InvalidCredentialsError",
     "PermissionDeniedError",
@@ -51,6 +52,11 @@ class ArticleDoesNotExistError(ConduitError):
         return visitor.visit_article_does_not_exist(self)
 
 
+class DeadlineExceededError(ConduitError):
+    def accept(self, visitor: "Visitor[T_co]") -> T_co:
+        return visitor.visit_deadline_exceeded(self)
+
+
 class Visitor(t.Protocol[T_co]):
     @abc.abstractmethod
     def visit_username_already_exists(self, error: UsernameAlreadyExistsError) -> T_co:
@@ -75,3 +81,7 @@ class Visitor(t.Protocol[T_co]):
     @abc.abstractmethod
     def visit_article_does_not_exist(self, error: ArticleDoesNotExistError) -> T_co:
         raise NotImplementedError()
+
+    @abc.abstractmethod
+    def visit_deadline_exceeded(self, error: DeadlineExceededError) -> T_co:
+        raise NotImplementedError()
@@ -1,9 +1,21 @@
 __all__ = [
+    "DEADLINE_VAR",
+    "DEBUG_SAMPLED_VAR",
+    "QUERY_STATS_VAR",
+    "REQUEST_ID_VAR",
+    "ROUTE_VAR",
+    "QueryStats",
     "UnitOfWork",
     "UnitOfWorkContext",
+    "collect_query_stats",
+    "remaining_time",
 ]
 import abc
+import contextvars
+import time
 import typing as t
+from contextlib import contextmanager
+from dataclasses import dataclass
 
 from conduit.core.entities.article import ArticleRepository, FavoriteRepository, TagRepository
 from conduit.core.entities.comment import CommentRepository
@@ -11,6 +23,57 @@ from conduit.core.entities.user import FollowerRepository, UserRepository
 
 T = t.TypeVar("T")
 
+# `time.monotonic()` by which the current request must be answered, `None` if it has no deadline.
+DEADLINE_VAR: contextvars.ContextVar[float | None] = contextvars.ContextVar("deadline", default=None)
+# Id of the current request, set by `request_id_middleware` and carried to its logs, spans and slow statements.
+REQUEST_ID_VAR: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+# Name of the route of the current request, like the `route` label of the metrics.
+ROUTE_VAR: contextvars.ContextVar[str] = contextvars.ContextVar("route")
+# Debug lines of the current request are logged, see `debug_sampling_middleware`.
+DEBUG_SAMPLED_VAR: contextvars.ContextVar[bool] = contextvars.ContextVar("debug_sampled", default=False)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the deadline of the current request, `None` if it has no deadline."""
+    deadline = DEADLINE_VAR.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@dataclass
+class QueryStats:
+    """Database work done on behalf of the current request, filled in by units of work.
+
+    Mutable, so that recording a statement does not allocate.
+    """
+
+    # Units of work run in a transaction, rather than in autocommit mode.
+    transactions: int = 0
+    # Statements sent to the database, transaction control included.
+    statements: int = 0
+    # Seconds spent waiting for statements to complete.
+    duration: float = 0.0
+    # Seconds spent waiting for a connection from the pool.
+    pool_wait: float = 0.0
+    # Rows returned or affected by the statements.
+    rows: int = 0
+
+
+# Statistics of the current request, `None` if nobody collects them.
+QUERY_STATS_VAR: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def collect_query_stats() -> t.Iterator[QueryStats]:
+    """Collects the database work done inside the block, e.g. to assert how many statements it takes."""
+    stats = QueryStats()
+    token = QUERY_STATS_VAR.set(stats)
+    try:
+        yield stats
+    finally:
+        QUERY_STATS_VAR.reset(token)
+
 
 class UnitOfWorkContext(t.Protocol):
     @property
@@ -48,5 +111,22 @@ class UnitOfWork(t.Protocol):
     """Abstraction over the idea of atomic operations."""
 
     @abc.abstractmethod
-    def begin(self) -> t.AsyncContextManager[UnitOfWorkContext]:
+    def begin(self, *, read_only: bool = False, autocommit: bool = False) -> t.AsyncContextManager[UnitOfWorkContext]:
+        """Starts a unit of work.
+
+        Statements of the unit of work are cancelled once the deadline of the current
+        request (see `DEADLINE_VAR`) passes. They are accounted in `QUERY_STATS_VAR`.
+        Once a unit of work that writes has ended, values loaded by the data loaders of the
+        current request are loaded again when requested (see `clear_loaders`).
+
+        Args:
+            read_only: The unit of work only reads data. An implementation may serve it from a
+                read replica, so it can lag slightly behind the latest writes.
+            autocommit: The unit of work runs a single read statement, so it does not need a
+                transaction and an implementation may skip `BEGIN` and `COMMIT`. Only allowed
+                together with `read_only`.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before or while the unit of work runs.
+        """
         raise NotImplementedError()
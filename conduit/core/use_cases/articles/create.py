@@ -11,6 +11,7 @@ import structlog
 
 from conduit.core.entities.article import (
     Article,
+    ArticleCache,
     ArticleWithExtra,
     CreateArticleInput as RepositoryCreateArticleInput,
     Tag,
@@ -41,8 +42,9 @@ class CreateArticleResult:
 
 
 class CreateArticleUseCase(UseCase[CreateArticleInput, CreateArticleResult]):
-    def __init__(self, unit_of_work: UnitOfWork) -> None:
+    def __init__(self, unit_of_work: UnitOfWork, article_cache: ArticleCache | None = None) -> None:
         self._unit_of_work = unit_of_work
+        self._article_cache = article_cache
 
     async def execute(self, input: CreateArticleInput, /) -> CreateArticleResult:
         """Create a new article.
@@ -62,7 +64,7 @@ class CreateArticleUseCase(UseCase[CreateArticleInput, CreateArticleResult]):
         )
 
     async def _get_author(self, user_id: UserId) -> User:
-        async with self._unit_of_work.begin() as uow:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
             author = await uow.users.get_by_id(user_id)
         if author is None:
             LOG.info("could not find user by id", user_id=user_id)
@@ -80,5 +82,8 @@ class CreateArticleUseCase(UseCase[CreateArticleInput, CreateArticleResult]):
                 ),
             )
             await uow.tags.create(article.id, input.tags)
+        if self._article_cache is not None:
+            # The slug may be cached as the slug of no article.
+            self._article_cache.invalidate(article.slug)
         LOG.info("article has been created", id=article.id, slug=article.slug, tags=input.tags)
         return article
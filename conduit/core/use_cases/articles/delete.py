@@ -9,7 +9,7 @@ from dataclasses import dataclass, replace
 
 import structlog
 
-from conduit.core.entities.article import ArticleId, ArticleSlug
+from conduit.core.entities.article import ArticleCache, ArticleId, ArticleSlug
 from conduit.core.entities.errors import PermissionDeniedError
 from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.entities.user import UserId
@@ -34,8 +34,9 @@ class DeleteArticleResult:
 
 
 class DeleteArticleUseCase(UseCase[DeleteArticleInput, DeleteArticleResult]):
-    def __init__(self, unit_of_work: UnitOfWork) -> None:
+    def __init__(self, unit_of_work: UnitOfWork, article_cache: ArticleCache | None = None) -> None:
         self._unit_of_work = unit_of_work
+        self._article_cache = article_cache
 
     async def execute(self, input: DeleteArticleInput, /) -> DeleteArticleResult:
         """Delete an existing article.
@@ -45,6 +46,7 @@ class DeleteArticleUseCase(UseCase[DeleteArticleInput, DeleteArticleResult]):
             PermissionDeniedError: If user is not allowed to delete the article.
         """
         user_id = input.ensure_authenticated()
+        # Not through the cache, a cached article may have been renamed or deleted by another worker.
         article = await get_article(self._unit_of_work, input.slug)
         if article is None:
             return DeleteArticleResult(None)
@@ -52,6 +54,8 @@ class DeleteArticleUseCase(UseCase[DeleteArticleInput, DeleteArticleResult]):
             LOG.info("user is not allowed to delete the article", user_id=user_id, author_id=article.author_id)
             raise PermissionDeniedError()
         deleted_article_id = await self._delete_article(article.id)
+        if self._article_cache is not None:
+            self._article_cache.invalidate(article.slug)
         return DeleteArticleResult(deleted_article_id)
 
     async def _delete_article(self, article_id: ArticleId) -> ArticleId | None:
@@ -4,6 +4,7 @@ __all__ = [
     "FeedArticlesUseCase",
 ]
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, replace
 
@@ -58,14 +59,18 @@ class FeedArticlesUseCase(UseCase[FeedArticlesInput, FeedArticlesResult]):
         """
         user_id = input.ensure_authenticated()
         filter = ArticleFilter(feed_of=user_id)
-        articles = await get_articles(self._unit_of_work, filter, limit=input.limit, offset=input.offset)
-        article_count = await get_article_count(self._unit_of_work, filter)
+        articles, article_count = await asyncio.gather(
+            get_articles(self._unit_of_work, filter, limit=input.limit, offset=input.offset),
+            get_article_count(self._unit_of_work, filter),
+        )
         article_ids = [article.id for article in articles]
         author_ids = {article.author_id for article in articles}
-        authors = await get_users(self._unit_of_work, author_ids)
-        tags = await get_tags_for_articles(self._unit_of_work, article_ids)
-        articles_favorite = await are_favorite(self._unit_of_work, article_ids, of=user_id)
-        favorite_count = await get_favorite_count_for_articles(self._unit_of_work, article_ids)
+        authors, tags, articles_favorite, favorite_count = await asyncio.gather(
+            get_users(self._unit_of_work, author_ids),
+            get_tags_for_articles(self._unit_of_work, article_ids),
+            are_favorite(self._unit_of_work, article_ids, of=user_id),
+            get_favorite_count_for_articles(self._unit_of_work, article_ids),
+        )
         return FeedArticlesResult(
             articles=self._prepare_articles(
                 articles,
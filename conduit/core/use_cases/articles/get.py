@@ -4,10 +4,11 @@ __all__ = [
     "GetArticleUseCase",
 ]
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, replace
 
-from conduit.core.entities.article import ArticleSlug, ArticleWithExtra
+from conduit.core.entities.article import ArticleCache, ArticleSlug, ArticleWithExtra
 from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.entities.user import UserId
 from conduit.core.use_cases import UseCase
@@ -35,19 +36,23 @@ class GetArticleResult:
 
 
 class GetArticleUseCase(UseCase[GetArticleInput, GetArticleResult]):
-    def __init__(self, unit_of_work: UnitOfWork) -> None:
+    def __init__(self, unit_of_work: UnitOfWork, article_cache: ArticleCache | None = None) -> None:
         self._unit_of_work = unit_of_work
+        self._article_cache = article_cache
 
     async def execute(self, input: GetArticleInput, /) -> GetArticleResult:
         user_id = input.user_id
-        article = await get_article(self._unit_of_work, input.slug)
+        article = await get_article(self._unit_of_work, input.slug, self._article_cache)
         if article is None:
             return GetArticleResult(None)
-        author = await get_author(self._unit_of_work, article.author_id)
-        tags = await get_tags_for_article(self._unit_of_work, article.id)
-        followed = await is_user_followed(self._unit_of_work, author.id, by=user_id)
-        favorite = await is_favorite(self._unit_of_work, article.id, of=user_id)
-        favorite_count = await get_favorite_count_for_article(self._unit_of_work, article.id)
+        # Independent lookups: their round trips overlap, and keys requested together share a batch.
+        author, tags, followed, favorite, favorite_count = await asyncio.gather(
+            get_author(self._unit_of_work, article.author_id),
+            get_tags_for_article(self._unit_of_work, article.id),
+            is_user_followed(self._unit_of_work, article.author_id, by=user_id),
+            is_favorite(self._unit_of_work, article.id, of=user_id),
+            get_favorite_count_for_article(self._unit_of_work, article.id),
+        )
         return GetArticleResult(
             ArticleWithExtra(
                 v=article,
@@ -4,6 +4,7 @@ __all__ = [
     "ListArticlesUseCase",
 ]
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, replace
 
@@ -63,15 +64,19 @@ class ListArticlesUseCase(UseCase[ListArticlesInput, ListArticlesResult]):
     async def execute(self, input: ListArticlesInput, /) -> ListArticlesResult:
         user_id = input.user_id
         filter = input.to_filter()
-        articles = await get_articles(self._unit_of_work, filter, limit=input.limit, offset=input.offset)
-        article_count = await get_article_count(self._unit_of_work, filter)
+        articles, article_count = await asyncio.gather(
+            get_articles(self._unit_of_work, filter, limit=input.limit, offset=input.offset),
+            get_article_count(self._unit_of_work, filter),
+        )
         article_ids = [article.id for article in articles]
         author_ids = {article.author_id for article in articles}
-        authors = await get_users(self._unit_of_work, author_ids)
-        authors_followed = await are_users_followed(self._unit_of_work, author_ids, by=user_id)
-        tags = await get_tags_for_articles(self._unit_of_work, article_ids)
-        articles_favorite = await are_favorite(self._unit_of_work, article_ids, of=user_id)
-        favorite_count = await get_favorite_count_for_articles(self._unit_of_work, article_ids)
+        authors, authors_followed, tags, articles_favorite, favorite_count = await asyncio.gather(
+            get_users(self._unit_of_work, author_ids),
+            are_users_followed(self._unit_of_work, author_ids, by=user_id),
+            get_tags_for_articles(self._unit_of_work, article_ids),
+            are_favorite(self._unit_of_work, article_ids, of=user_id),
+            get_favorite_count_for_articles(self._unit_of_work, article_ids),
+        )
         return ListArticlesResult(
             self._prepare_articles(
                 articles,
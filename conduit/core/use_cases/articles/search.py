@@ -0,0 +1,109 @@
+__all__ = [
+    "SearchArticlesInput",
+    "SearchArticlesResult",
+    "SearchArticlesUseCase",
+]
+
+import asyncio
+import typing as t
+from dataclasses import dataclass, replace
+
+import structlog
+
+from conduit.core.entities.article import Article, ArticleFilter, ArticleId, ArticleSearchCursor, ArticleWithExtra, Tag
+from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.core.entities.user import User, UserId, Username
+from conduit.core.use_cases import UseCase
+from conduit.core.use_cases.articles.common import (
+    are_favorite,
+    get_favorite_count_for_articles,
+    get_tags_for_articles,
+)
+from conduit.core.use_cases.auth import WithOptionalAuthenticationInput
+from conduit.core.use_cases.common import are_users_followed, get_users
+
+LOG = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchArticlesInput(WithOptionalAuthenticationInput):
+    query: str
+    tag: Tag | None = None
+    author: Username | None = None
+    limit: int = 20
+    cursor: ArticleSearchCursor | None = None
+
+    def __post_init__(self) -> None:
+        # Ensure preconditions
+        assert 0 <= self.limit <= 100
+
+    def with_user_id(self, id: UserId) -> t.Self:
+        return replace(self, user_id=id)
+
+    def to_filter(self) -> ArticleFilter:
+        return ArticleFilter(tag=self.tag, author=self.author, query=self.query)
+
+
+@dataclass(frozen=True)
+class SearchArticlesResult:
+    articles: t.List[ArticleWithExtra]
+    next_cursor: ArticleSearchCursor | None
+
+
+class SearchArticlesUseCase(UseCase[SearchArticlesInput, SearchArticlesResult]):
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, input: SearchArticlesInput, /) -> SearchArticlesResult:
+        user_id = input.user_id
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
+            # One extra article tells whether there is a next page.
+            hits = await uow.articles.search(input.to_filter(), limit=input.limit + 1, after=input.cursor)
+        LOG.info("found articles", input=input, article_ids=[article.id for article, _ in hits])
+        next_cursor = None
+        if len(hits) > input.limit:
+            hits = hits[: input.limit]
+            if hits:
+                last_article, last_rank = hits[-1]
+                next_cursor = ArticleSearchCursor(last_rank, last_article.id)
+        articles = [article for article, _ in hits]
+        article_ids = [article.id for article in articles]
+        author_ids = {article.author_id for article in articles}
+        authors, authors_followed, tags, articles_favorite, favorite_count = await asyncio.gather(
+            get_users(self._unit_of_work, author_ids),
+            are_users_followed(self._unit_of_work, author_ids, by=user_id),
+            get_tags_for_articles(self._unit_of_work, article_ids),
+            are_favorite(self._unit_of_work, article_ids, of=user_id),
+            get_favorite_count_for_articles(self._unit_of_work, article_ids),
+        )
+        return SearchArticlesResult(
+            self._prepare_articles(articles, authors, authors_followed, tags, articles_favorite, favorite_count),
+            next_cursor,
+        )
+
+    def _prepare_articles(
+        self,
+        articles: t.Sequence[Article],
+        authors: t.Mapping[UserId, User],
+        authors_followed: t.Mapping[UserId, bool],
+        tags: t.Mapping[ArticleId, list[Tag]],
+        articles_favorite: t.Mapping[ArticleId, bool],
+        favorite_count: t.Mapping[ArticleId, int],
+    ) -> list[ArticleWithExtra]:
+        result = []
+        for article in articles:
+            author = authors.get(article.author_id)
+            if author is None:
+                LOG.error("author of an article not found", article_id=article.id, author_id=article.author_id)
+                continue
+            result.append(
+                ArticleWithExtra(
+                    v=article,
+                    author=author,
+                    tags=tags.get(article.id, []),
+                    is_author_followed=authors_followed.get(author.id, False),
+                    is_article_favorite=articles_favorite.get(article.id, False),
+                    favorite_of_user_count=favorite_count.get(article.id, 0),
+                )
+            )
+        return result
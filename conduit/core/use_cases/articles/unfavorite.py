@@ -9,13 +9,11 @@ from dataclasses import dataclass, replace
 
 import structlog
 
-from conduit.core.entities.article import ArticleId, ArticleSlug, ArticleWithExtra
+from conduit.core.entities.article import ArticleSlug, ArticleWithExtra
 from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.entities.user import UserId
 from conduit.core.use_cases import UseCase
-from conduit.core.use_cases.articles.common import get_author, get_tags_for_article
 from conduit.core.use_cases.auth import WithAuthenticationInput
-from conduit.core.use_cases.common import get_article, is_user_followed
 
 LOG = structlog.get_logger(__name__)
 
@@ -44,31 +42,15 @@ class UnfavoriteArticleUseCase(UseCase[UnfavoriteArticleInput, UnfavoriteArticle
             UserIsNotAuthenticatedError: If user is not authenticated.
         """
         user_id = input.ensure_authenticated()
-        article = await get_article(self._unit_of_work, input.slug)
+        async with self._unit_of_work.begin() as uow:
+            article = await uow.favorites.remove_by_slug(user_id, input.slug)
         if article is None:
+            LOG.info("could not find article by slug", slug=input.slug)
             return UnfavoriteArticleResult(None)
-        author = await get_author(self._unit_of_work, article.author_id)
-        tags = await get_tags_for_article(self._unit_of_work, article.id)
-        followed = await is_user_followed(self._unit_of_work, author.id, by=user_id)
-        favorite_of_user_count = await self._remove_from_favorites(user_id, article.id)
-        return UnfavoriteArticleResult(
-            ArticleWithExtra(
-                v=article,
-                author=author,
-                tags=tags,
-                is_author_followed=followed,
-                is_article_favorite=False,
-                favorite_of_user_count=favorite_of_user_count,
-            )
-        )
-
-    async def _remove_from_favorites(self, user_id: UserId, article_id: ArticleId) -> int:
-        async with self._unit_of_work.begin() as uow:
-            favorite_of_user_count = await uow.favorites.remove(user_id, article_id)
         LOG.info(
             "article has been removed from favorites",
             user_id=user_id,
-            article_id=article_id,
-            favorite_of_user_count=favorite_of_user_count,
+            article_id=article.v.id,
+            favorite_of_user_count=article.favorite_of_user_count,
         )
-        return favorite_of_user_count
+        return UnfavoriteArticleResult(article)
@@ -4,6 +4,7 @@ __all__ = [
     "UpdateArticleUseCase",
 ]
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, replace
 
@@ -11,6 +12,7 @@ import structlog
 
 from conduit.core.entities.article import (
     Article,
+    ArticleCache,
     ArticleId,
     ArticleSlug,
     ArticleWithExtra,
@@ -50,8 +52,9 @@ class UpdateArticleResult:
 
 
 class UpdateArticleUseCase(UseCase[UpdateArticleInput, UpdateArticleResult]):
-    def __init__(self, unit_of_work: UnitOfWork) -> None:
+    def __init__(self, unit_of_work: UnitOfWork, article_cache: ArticleCache | None = None) -> None:
         self._unit_of_work = unit_of_work
+        self._article_cache = article_cache
 
     async def execute(self, input: UpdateArticleInput, /) -> UpdateArticleResult:
         """Update an existing article.
@@ -61,18 +64,26 @@ class UpdateArticleUseCase(UseCase[UpdateArticleInput, UpdateArticleResult]):
             PermissionDeniedError: If user is not allowed to update the article.
         """
         user_id = input.ensure_authenticated()
+        # Not through the cache, a cached article may have been renamed or deleted by another worker.
         article = await get_article(self._unit_of_work, input.slug)
         if article is None:
             return UpdateArticleResult(None)
         if article.author_id != user_id:
             LOG.info("user is not allowed to update article", input=input)
             raise PermissionDeniedError()
-        author = await get_author(self._unit_of_work, article.author_id)
-        tags = await get_tags_for_article(self._unit_of_work, article.id)
-        author_followed = await is_user_followed(self._unit_of_work, author.id, by=user_id)
-        favorite = await is_favorite(self._unit_of_work, article.id, of=user_id)
-        favorite_count = await get_favorite_count_for_article(self._unit_of_work, article.id)
+        author, tags, author_followed, favorite, favorite_count = await asyncio.gather(
+            get_author(self._unit_of_work, article.author_id),
+            get_tags_for_article(self._unit_of_work, article.id),
+            is_user_followed(self._unit_of_work, article.author_id, by=user_id),
+            is_favorite(self._unit_of_work, article.id, of=user_id),
+            get_favorite_count_for_article(self._unit_of_work, article.id),
+        )
         updated_article = await self._update_article(article.id, input)
+        if self._article_cache is not None:
+            # A new title changes the slug, which may be cached as the slug of no article.
+            self._article_cache.invalidate(
+                article.slug, *([updated_article.slug] if updated_article is not None else [])
+            )
         if updated_article is None:
             return UpdateArticleResult(None)
         return UpdateArticleResult(
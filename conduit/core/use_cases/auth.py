@@ -1,9 +1,11 @@
 __all__ = [
+    "AUTHENTICATED_USER_ID_VAR",
     "WithAuthentication",
     "WithAuthenticationInput",
     "WithOptionalAuthenticationInput",
 ]
 
+import contextvars
 import typing as t
 from dataclasses import dataclass
 
@@ -15,6 +17,10 @@ from conduit.core.use_cases import UseCase
 
 LOG = structlog.get_logger(__name__)
 
+AUTHENTICATED_USER_ID_VAR: contextvars.ContextVar[UserId | None] = contextvars.ContextVar(
+    "authenticated_user_id", default=None
+)
+
 
 T = t.TypeVar("T", bound="Input")
 R = t.TypeVar("R")
@@ -57,6 +63,8 @@ class WithAuthentication(UseCase[T, R]):
 
     async def execute(self, input: T, /) -> R:
         user_id = await self._auth_token_generator.get_user_id(input.token) if input.token is not None else None
+        # Set on every call: keep-alive requests share the task, and so the context.
+        AUTHENTICATED_USER_ID_VAR.set(user_id)
         if user_id is not None:
             input = input.with_user_id(user_id)
             LOG.info("user authenticated", user_id=user_id)
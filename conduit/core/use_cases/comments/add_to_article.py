@@ -4,6 +4,7 @@ __all__ = [
     "AddCommentToArticleUseCase",
 ]
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, replace
 
@@ -47,9 +48,11 @@ class AddCommentToArticleUseCase(UseCase[AddCommentToArticleInput, AddCommentToA
             ArticleDoesNotExistError: If article does not exist.
         """
         user_id = input.ensure_authenticated()
-        author = await self._get_author(user_id)
-        is_author_followed = await is_user_followed(self._unit_of_work, author.id, by=author.id)
-        article = await get_article(self._unit_of_work, input.article_slug)
+        author, is_author_followed, article = await asyncio.gather(
+            self._get_author(user_id),
+            is_user_followed(self._unit_of_work, user_id, by=user_id),
+            get_article(self._unit_of_work, input.article_slug),
+        )
         if article is None:
             raise ArticleDoesNotExistError()
         async with self._unit_of_work.begin() as uow:
@@ -63,7 +66,7 @@ class AddCommentToArticleUseCase(UseCase[AddCommentToArticleInput, AddCommentToA
         return AddCommentToArticleResult(CommentWithExtra(comment, author, is_author_followed))
 
     async def _get_author(self, user_id: UserId) -> User:
-        async with self._unit_of_work.begin() as uow:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
             author = await uow.users.get_by_id(user_id)
         if author is None:
             LOG.info("could not find user by id", user_id=user_id)
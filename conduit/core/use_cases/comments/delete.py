@@ -51,7 +51,7 @@ class DeleteCommentUseCase(UseCase[DeleteCommentInput, DeleteCommentResult]):
         article = await get_article(self._unit_of_work, input.article_slug)
         if article is None:
             return DeleteCommentResult(None)
-        async with self._unit_of_work.begin() as uow:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
             comment = await uow.comments.get_by_id(input.comment_id)
         if comment is None:
             log.info("could not delete comment, comment not found")
@@ -4,13 +4,14 @@ __all__ = [
     "GetCommentsFromArticleUseCase",
 ]
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, replace
 
 import structlog
 
-from conduit.core.entities.article import ArticleSlug
-from conduit.core.entities.comment import Comment, CommentFilter, CommentWithExtra
+from conduit.core.entities.article import ArticleCache, ArticleSlug
+from conduit.core.entities.comment import Comment, CommentFilter, CommentId, CommentWithExtra
 from conduit.core.entities.errors import ArticleDoesNotExistError
 from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.entities.user import User, UserId
@@ -24,6 +25,13 @@ LOG = structlog.get_logger(__name__)
 @dataclass(frozen=True)
 class GetCommentsFromArticleInput(WithOptionalAuthenticationInput):
     article_slug: ArticleSlug
+    # `None` for all the comments.
+    limit: int | None = None
+    cursor: CommentId | None = None
+
+    def __post_init__(self) -> None:
+        # Ensure preconditions
+        assert self.limit is None or 1 <= self.limit <= 100
 
     def with_user_id(self, id: UserId) -> t.Self:
         return replace(self, user_id=id)
@@ -32,11 +40,14 @@ class GetCommentsFromArticleInput(WithOptionalAuthenticationInput):
 @dataclass(frozen=True)
 class GetCommentsFromArticleResult:
     comments: t.List[CommentWithExtra]
+    count: int
+    next_cursor: CommentId | None
 
 
 class GetCommentsFromArticleUseCase(UseCase[GetCommentsFromArticleInput, GetCommentsFromArticleResult]):
-    def __init__(self, unit_of_work: UnitOfWork) -> None:
+    def __init__(self, unit_of_work: UnitOfWork, article_cache: ArticleCache | None = None) -> None:
         self._unit_of_work = unit_of_work
+        self._article_cache = article_cache
 
     async def execute(self, input: GetCommentsFromArticleInput, /) -> GetCommentsFromArticleResult:
         """Get article's comments.
@@ -45,16 +56,32 @@ class GetCommentsFromArticleUseCase(UseCase[GetCommentsFromArticleInput, GetComm
             ArticleDoesNotExistError: If article does not exist.
         """
         user_id = input.user_id
-        article = await get_article(self._unit_of_work, input.article_slug)
+        article = await get_article(self._unit_of_work, input.article_slug, self._article_cache)
         if article is None:
             raise ArticleDoesNotExistError()
-        async with self._unit_of_work.begin() as uow:
-            comments = await uow.comments.get_many(CommentFilter(article.id))
+        async with self._unit_of_work.begin(read_only=True) as uow:
+            # One extra comment tells whether there is a next page.
+            limit = input.limit + 1 if input.limit is not None else None
+            comments = await uow.comments.get_many(CommentFilter(article.id, after=input.cursor), limit=limit)
+            if input.limit is None and input.cursor is None:
+                count = len(comments)
+            else:
+                count = await uow.comments.count(CommentFilter(article.id))
         LOG.info("got comments from the article", input=input)
+        next_cursor = None
+        if input.limit is not None and len(comments) > input.limit:
+            comments = comments[: input.limit]
+            next_cursor = comments[-1].id if comments else None
         author_ids = {comment.author_id for comment in comments}
-        authors = await get_users(self._unit_of_work, author_ids)
-        followed = await are_users_followed(self._unit_of_work, author_ids, by=user_id)
-        return GetCommentsFromArticleResult(self._prepare_comments(comments, authors, followed))
+        authors, followed = await asyncio.gather(
+            get_users(self._unit_of_work, author_ids),
+            are_users_followed(self._unit_of_work, author_ids, by=user_id),
+        )
+        return GetCommentsFromArticleResult(
+            self._prepare_comments(comments, authors, followed),
+            count=count,
+            next_cursor=next_cursor,
+        )
 
     def _prepare_comments(
         self,
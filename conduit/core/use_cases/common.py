@@ -9,38 +9,42 @@ import typing as t
 
 import structlog
 
-from conduit.core.entities.article import Article, ArticleSlug
+from conduit.core.entities.article import Article, ArticleCache, ArticleSlug
 from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.entities.user import User, UserId
+from conduit.core.use_cases.data_loader import DataLoader, get_loader
 
 LOG = structlog.get_logger(__name__)
 
 
-async def get_article(unit_of_work: UnitOfWork, slug: ArticleSlug) -> Article | None:
+async def get_article(unit_of_work: UnitOfWork, slug: ArticleSlug, cache: ArticleCache | None = None) -> Article | None:
     log = LOG.bind(slug=slug)
-    async with unit_of_work.begin() as uow:
-        article = await uow.articles.get_by_slug(slug)
+
+    async def load() -> Article | None:
+        async with unit_of_work.begin(read_only=True, autocommit=True) as uow:
+            return await uow.articles.get_by_slug(slug)
+
+    article = await (cache.get(slug, load) if cache is not None else load())
     if article is None:
-        log.info("article not found")
+        log.debug("article not found")
         return None
-    log.info("got article", article_id=article.id)
+    log.debug("got article", article_id=article.id)
     return article
 
 
 async def get_users(unit_of_work: UnitOfWork, ids: t.Collection[UserId]) -> t.Mapping[UserId, User]:
-    async with unit_of_work.begin() as uow:
-        users = await uow.users.get_by_ids(ids)
-    LOG.info("got users", ids=ids, user_ids=list(users))
+    loaded = await _users_loader(unit_of_work).load_many(ids)
+    users = {id: user for id, user in loaded.items() if user is not None}
+    LOG.debug("got users", ids=ids, user_ids=list(users))
     return users
 
 
 async def is_user_followed(unit_of_work: UnitOfWork, id: UserId, *, by: UserId | None) -> bool:
     if by is None:
-        LOG.info("user is not authenticated, not followed")
+        LOG.debug("user is not authenticated, not followed")
         return False
-    async with unit_of_work.begin() as uow:
-        is_followed = await uow.followers.is_followed(id, by=by)
-    LOG.info("got following status", id=id, by=by, is_followed=is_followed)
+    is_followed = await _followed_loader(unit_of_work, by).load(id)
+    LOG.debug("got following status", id=id, by=by, is_followed=is_followed)
     return is_followed
 
 
@@ -50,9 +54,24 @@ async def are_users_followed(
     by: UserId | None,
 ) -> t.Mapping[UserId, bool]:
     if by is None:
-        LOG.info("user is not authenticated, not followed")
+        LOG.debug("user is not authenticated, not followed")
         return {}
-    async with unit_of_work.begin() as uow:
-        are_followed = await uow.followers.are_followed(user_ids, by)
-    LOG.info("got following status", user_ids=user_ids, by=by, are_followed=are_followed)
+    are_followed = await _followed_loader(unit_of_work, by).load_many(user_ids)
+    LOG.debug("got following status", user_ids=user_ids, by=by, are_followed=are_followed)
     return are_followed
+
+
+def _users_loader(unit_of_work: UnitOfWork) -> DataLoader[UserId, User | None]:
+    async def batch(ids: list[UserId]) -> t.Mapping[UserId, User]:
+        async with unit_of_work.begin(read_only=True, autocommit=True) as uow:
+            return await uow.users.get_by_ids(ids)
+
+    return get_loader(("users", unit_of_work), batch, None)
+
+
+def _followed_loader(unit_of_work: UnitOfWork, by: UserId) -> DataLoader[UserId, bool]:
+    async def batch(ids: list[UserId]) -> t.Mapping[UserId, bool]:
+        async with unit_of_work.begin(read_only=True, autocommit=True) as uow:
+            return await uow.followers.are_followed(ids, by)
+
+    return get_loader(("followed", unit_of_work, by), batch, False)
@@ -0,0 +1,137 @@
+__all__ = [
+    "LOADERS_VAR",
+    "DataLoader",
+    "clear_loaders",
+    "data_loader_scope",
+    "get_loader",
+]
+
+import asyncio
+import contextvars
+import typing as t
+from contextlib import contextmanager
+
+K = t.TypeVar("K", bound=t.Hashable)
+V = t.TypeVar("V")
+
+
+class DataLoader(t.Generic[K, V]):
+    """Loads values by key in batches, each key at most once.
+
+    The keys requested during one iteration of the event loop, by any task, are loaded together
+    by a single call of `batch`. The call runs in a task of its own, started once the other tasks
+    ready in the same iteration have run, so a task giving up waiting does not fail the batch for
+    the others. Values are kept for the life of the loader, which `clear_loaders` ends after a write.
+
+    Args:
+        batch: Loads the values of keys. Keys without a value may be missing from its result.
+        default: Value of the keys missing from the result of `batch`.
+    """
+
+    def __init__(self, batch: t.Callable[[list[K]], t.Awaitable[t.Mapping[K, V]]], default: V) -> None:
+        self._batch = batch
+        self._default = default
+        self._values: dict[K, V] = {}
+        # Batch loading each key being loaded.
+        self._loading: dict[K, asyncio.Task[dict[K, V]]] = {}
+        # Batch still collecting keys, and its keys.
+        self._next: asyncio.Task[dict[K, V]] | None = None
+        self._next_keys: list[K] = []
+
+    async def load(self, key: K) -> V:
+        if key in self._values:
+            return self._values[key]
+        return (await self._wait([key]))[key]
+
+    async def load_many(self, keys: t.Iterable[K]) -> dict[K, V]:
+        keys = list(keys)
+        values = self._values
+        missing = [key for key in dict.fromkeys(keys) if key not in values]
+        if not missing:
+            return {key: values[key] for key in keys}
+        loaded = await self._wait(missing)
+        return {key: loaded[key] if key in loaded else values[key] for key in keys}
+
+    async def _wait(self, keys: list[K]) -> dict[K, V]:
+        """Values of distinct keys that are not loaded yet."""
+        loading = self._loading
+        batches = {loading[key] for key in keys if key in loading} if loading else set()
+        if batches:
+            keys = [key for key in keys if key not in loading]
+        if keys:
+            if self._next is None:
+                self._next_keys = []
+                self._next = asyncio.create_task(self._run(self._next_keys))
+                self._next.add_done_callback(_retrieve_exception)
+            batches.add(self._next)
+            loading.update(dict.fromkeys(keys, self._next))
+            self._next_keys.extend(keys)
+        # A task giving up waiting must not cancel the batches other tasks wait for.
+        if len(batches) == 1:
+            return await asyncio.shield(batches.pop())
+        loaded: dict[K, V] = {}
+        for values in await asyncio.shield(asyncio.gather(*batches)):
+            loaded.update(values)
+        return loaded
+
+    async def _run(self, keys: list[K]) -> dict[K, V]:
+        # The tasks ready in the iteration of the event loop that created this one have added their keys.
+        self._next = None
+        try:
+            values = await self._batch(keys)
+        finally:
+            # Requested again after a failure, the keys are loaded again.
+            for key in keys:
+                del self._loading[key]
+        loaded = {key: values.get(key, self._default) for key in keys}
+        self._values.update(loaded)
+        return loaded
+
+
+def _retrieve_exception(task: asyncio.Task[t.Any]) -> None:
+    # The waiters get the exception, this keeps asyncio from reporting it when they have all
+    # given up waiting.
+    if not task.cancelled():
+        task.exception()
+
+
+# Loaders shared by the current request, by key, `None` outside of `data_loader_scope`.
+LOADERS_VAR: contextvars.ContextVar[dict[t.Hashable, DataLoader[t.Any, t.Any]] | None] = contextvars.ContextVar(
+    "loaders", default=None
+)
+
+
+@contextmanager
+def data_loader_scope() -> t.Iterator[None]:
+    """Shares the loaders returned by `get_loader` inside the block, e.g. during a request."""
+    token = LOADERS_VAR.set({})
+    try:
+        yield
+    finally:
+        LOADERS_VAR.reset(token)
+
+
+def clear_loaders() -> None:
+    """Drops the loaders of the current scope, called by units of work that have written.
+
+    Keys requested afterwards are loaded again, rather than getting values from before the write.
+    """
+    loaders = LOADERS_VAR.get()
+    if loaders is not None:
+        loaders.clear()
+
+
+def get_loader(
+    key: t.Hashable, batch: t.Callable[[list[K]], t.Awaitable[t.Mapping[K, V]]], default: V
+) -> DataLoader[K, V]:
+    """Loader of the current scope for `key`, created from `batch` and `default` on the first call.
+
+    Outside of a scope every call returns a new loader, which only batches the keys of one call.
+    """
+    loaders = LOADERS_VAR.get()
+    if loaders is None:
+        return DataLoader(batch, default)
+    loader: DataLoader[K, V] | None = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = DataLoader(batch, default)
+    return loader
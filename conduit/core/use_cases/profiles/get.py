@@ -37,14 +37,14 @@ class GetProfileUseCase(UseCase[GetProfileInput, GetProfileResult]):
 
     async def execute(self, input: GetProfileInput, /) -> GetProfileResult:
         log = LOG.bind(input=input)
-        async with self._unit_of_work.begin() as uow:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
             user = await uow.users.get_by_username(input.username)
         if user is None:
             log.info("user not found")
             return GetProfileResult(None, False)
         if input.user_id is not None:
             log.info("user is authenticated, check if profile is followed")
-            async with self._unit_of_work.begin() as uow:
+            async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
                 is_followed = await uow.followers.is_followed(user.id, by=input.user_id)
         else:
             log.info("user is not authenticated, profile is not followed")
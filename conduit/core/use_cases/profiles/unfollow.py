@@ -42,7 +42,7 @@ class UnfollowUseCase(UseCase[UnfollowInput, UnfollowResult]):
         """
         log = LOG.bind(input=input)
         user_id = input.ensure_authenticated()
-        async with self._unit_of_work.begin() as uow:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
             unfollowed_user = await uow.users.get_by_username(input.username)
         if unfollowed_user is None:
             log.info("could not unfollow user, user not found")
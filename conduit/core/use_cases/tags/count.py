@@ -0,0 +1,33 @@
+__all__ = [
+    "CountTagArticlesInput",
+    "CountTagArticlesResult",
+    "CountTagArticlesUseCase",
+]
+
+from dataclasses import dataclass
+
+from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.core.use_cases import UseCase
+
+
+@dataclass(frozen=True)
+class CountTagArticlesInput:
+    pass
+
+
+@dataclass(frozen=True)
+class CountTagArticlesResult:
+    # Number of tags whose article count has changed.
+    tags: int
+
+
+class CountTagArticlesUseCase(UseCase[CountTagArticlesInput, CountTagArticlesResult]):
+    """Brings the article counts of tags, which popular tags are ordered by, up to date."""
+
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, input: CountTagArticlesInput, /) -> CountTagArticlesResult:
+        async with self._unit_of_work.begin() as uow:
+            tags = await uow.tags.count_articles()
+        return CountTagArticlesResult(tags)
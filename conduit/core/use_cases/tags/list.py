@@ -4,20 +4,32 @@ __all__ = [
     "ListTagsUseCase",
 ]
 
-from dataclasses import dataclass
+import typing as t
+from dataclasses import dataclass, field
 
 from conduit.core.entities.article import Tag
 from conduit.core.entities.unit_of_work import UnitOfWork
 from conduit.core.use_cases import UseCase
 
+# Tags read per round trip while the list is written.
+PAGE_SIZE: t.Final = 1000
+
 
 @dataclass(frozen=True)
 class ListTagsInput:
-    pass
+    limit: int | None = None
+    # Receives the tags a page at a time, the next page is read once it returns. Without it
+    # the tags are returned in the result.
+    write_page: t.Callable[[list[Tag]], t.Awaitable[None]] | None = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Ensure preconditions
+        assert self.limit is None or self.limit >= 0
 
 
 @dataclass(frozen=True)
 class ListTagsResult:
+    # Tags ordered by name, empty if they were given to `write_page`.
     tags: list[Tag]
 
 
@@ -26,6 +38,22 @@ class ListTagsUseCase(UseCase[ListTagsInput, ListTagsResult]):
         self._unit_of_work = unit_of_work
 
     async def execute(self, input: ListTagsInput, /) -> ListTagsResult:
-        async with self._unit_of_work.begin() as uow:
-            tags = await uow.tags.get_all()
+        tags: list[Tag] = []
+        limit = input.limit
+        after = None
+        # Every page is read in a unit of work of its own, so that no connection is held
+        # while the previous page is written to a slow client.
+        while limit is None or limit > 0:
+            page_size = PAGE_SIZE if limit is None else min(limit, PAGE_SIZE)
+            async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
+                page = await uow.tags.get_many(after=after, limit=page_size)
+            if page and input.write_page is not None:
+                await input.write_page(page)
+            elif page:
+                tags.extend(page)
+            if len(page) < page_size:
+                break
+            after = page[-1]
+            if limit is not None:
+                limit -= len(page)
         return ListTagsResult(tags)
@@ -0,0 +1,35 @@
+__all__ = [
+    "ListPopularTagsInput",
+    "ListPopularTagsResult",
+    "ListPopularTagsUseCase",
+]
+
+from dataclasses import dataclass
+
+from conduit.core.entities.article import Tag
+from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.core.use_cases import UseCase
+
+
+@dataclass(frozen=True)
+class ListPopularTagsInput:
+    limit: int = 20
+
+    def __post_init__(self) -> None:
+        # Ensure preconditions
+        assert 0 <= self.limit <= 1000
+
+
+@dataclass(frozen=True)
+class ListPopularTagsResult:
+    tags: list[Tag]
+
+
+class ListPopularTagsUseCase(UseCase[ListPopularTagsInput, ListPopularTagsResult]):
+    def __init__(self, unit_of_work: UnitOfWork) -> None:
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, input: ListPopularTagsInput, /) -> ListPopularTagsResult:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
+            tags = await uow.tags.get_popular(limit=input.limit)
+        return ListPopularTagsResult(tags)
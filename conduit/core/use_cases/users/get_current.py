@@ -40,7 +40,7 @@ class GetCurrentUserUseCase(UseCase[GetCurrentUserInput, GetCurrentUserResult]):
             UserIsNotAuthenticatedError: If user is not authenticated.
         """
         user_id = input.ensure_authenticated()
-        async with self._unit_of_work.begin() as uow:
+        async with self._unit_of_work.begin(read_only=True, autocommit=True) as uow:
             user = await uow.users.get_by_id(user_id)
         if user is None:
             LOG.warning("authenticated user not found", user_id=input.user_id)
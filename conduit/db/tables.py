@@ -1,5 +1,6 @@
 __all__ = [
     "ARTICLE",
+    "ARTICLE_COLUMNS",
     "ARTICLE_TAG",
     "COMMENT",
     "FAVORITE_ARTICLE",
@@ -10,6 +11,7 @@ __all__ = [
 ]
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
 
 METADATA = sa.MetaData()
 
@@ -32,7 +34,7 @@ FOLLOWER = sa.Table(
     "follower",
     METADATA,
     sa.Column("follower_id", sa.BigInteger, sa.ForeignKey(USER.c.id), nullable=False),
-    sa.Column("followed_id", sa.BigInteger, sa.ForeignKey(USER.c.id), nullable=False),
+    sa.Column("followed_id", sa.BigInteger, sa.ForeignKey(USER.c.id), nullable=False, index=True),
     sa.Column("created_at", sa.DateTime, nullable=False),
     sa.PrimaryKeyConstraint("follower_id", "followed_id"),
 )
@@ -49,8 +51,24 @@ ARTICLE = sa.Table(
     sa.Column("body", sa.Text, nullable=False),
     sa.Column("created_at", sa.DateTime, nullable=False),
     sa.Column("updated_at", sa.DateTime, nullable=True),
+    sa.Column(
+        "search_vector",
+        TSVECTOR,
+        sa.Computed(
+            "setweight(to_tsvector('english', title), 'A') || "
+            "setweight(to_tsvector('english', description), 'B') || "
+            "setweight(to_tsvector('english', body), 'C')",
+            persisted=True,
+        ),
+        nullable=False,
+    ),
+    sa.Index("ix_article_created_at_id", "created_at", "id"),
+    sa.Index("ix_article_search_vector", "search_vector", postgresql_using="gin"),
 )
 
+# Columns of an article, without the search vector that is only used in conditions.
+ARTICLE_COLUMNS = tuple(column for column in ARTICLE.c if column.key != "search_vector")
+
 
 TAG = sa.Table(
     "tag",
@@ -58,6 +76,9 @@ TAG = sa.Table(
     sa.Column("id", sa.BigInteger, primary_key=True),
     sa.Column("tag", sa.Text, nullable=False, unique=True),
     sa.Column("created_at", sa.DateTime, nullable=False),
+    # Number of articles with the tag, as of the last time `TAG_ARTICLE_COUNT_DELTA` was folded into it.
+    sa.Column("article_count", sa.BigInteger, nullable=False, server_default="0"),
+    sa.Index("ix_tag_article_count_id", "article_count", "id"),
 )
 
 
@@ -71,6 +92,16 @@ ARTICLE_TAG = sa.Table(
 )
 
 
+# Changes of `tag.article_count` not folded into it yet, appended by the statements that tag and
+# delete articles. Appending locks no tag row, so popular tags do not serialize their writers.
+TAG_ARTICLE_COUNT_DELTA = sa.Table(
+    "tag_article_count_delta",
+    METADATA,
+    sa.Column("tag_id", sa.BigInteger, nullable=False),
+    sa.Column("delta", sa.BigInteger, nullable=False),
+)
+
+
 FAVORITE_ARTICLE = sa.Table(
     "favorite_article",
     METADATA,
@@ -86,8 +117,9 @@ COMMENT = sa.Table(
     METADATA,
     sa.Column("id", sa.BigInteger, primary_key=True),
     sa.Column("author_id", sa.BigInteger, sa.ForeignKey(USER.c.id), nullable=False),
-    sa.Column("article_id", sa.BigInteger, sa.ForeignKey(ARTICLE.c.id, ondelete="CASCADE"), nullable=False, index=True),
+    sa.Column("article_id", sa.BigInteger, sa.ForeignKey(ARTICLE.c.id, ondelete="CASCADE"), nullable=False),
     sa.Column("created_at", sa.DateTime, nullable=False),
     sa.Column("updated_at", sa.DateTime, nullable=True),
     sa.Column("body", sa.Text, nullable=False),
+    sa.Index("ix_comment_article_id_id", "article_id", "id"),
 )
@@ -0,0 +1,138 @@
+__all__ = [
+    "InProcessArticleCache",
+]
+
+import asyncio
+import sys
+import time
+import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from conduit.core.entities.article import Article, ArticleCache, ArticleSlug
+
+# Estimated size of an entry besides its strings: the entry, the article, its datetimes and
+# the slots of both in the dict, in bytes.
+_ENTRY_OVERHEAD: t.Final = 400
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    # `None` for a slug of no article.
+    article: Article | None
+    expires_at: float
+    size: int
+
+
+class InProcessArticleCache(ArticleCache):
+    """LRU cache of articles by slug in the memory of the process, bounded in bytes.
+
+    Slugs of no article are cached too, for `negative_ttl` seconds, so that repeated requests
+    for missing articles do not reach the database. Concurrent loads of a slug share a single
+    call of `load`.
+
+    `invalidate` does not reach other workers, which may serve a changed or deleted article
+    for at most `ttl` seconds. `hits`, `negative_hits`, `misses` and `evictions` count the
+    requests served an article, served "not found", loaded, and the entries evicted to stay
+    within `max_bytes`.
+
+    Args:
+        ttl: For how many seconds an article is served from the cache. `0` disables the cache.
+        negative_ttl: For how many seconds a slug of no article is. `0` disables negative caching.
+        max_bytes: Estimated memory of the entries, the least recently used ones are evicted past it.
+        clock: Monotonic clock, in seconds.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        negative_ttl: float,
+        max_bytes: int = 32 * 1024 * 1024,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[ArticleSlug, _Entry] = OrderedDict()
+        self._loads: dict[ArticleSlug, asyncio.Task[Article | None]] = {}
+        # Bumped by `invalidate`: loads started before it do not store their result.
+        self._generation = 0
+        self.bytes = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, slug: ArticleSlug, load: t.Callable[[], t.Awaitable[Article | None]]) -> Article | None:
+        if self._ttl <= 0:
+            self.misses += 1
+            return await load()
+        entry = self._entries.get(slug)
+        if entry is not None:
+            if self._clock() < entry.expires_at:
+                self._entries.move_to_end(slug)
+                if entry.article is None:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+                return entry.article
+            self._remove(slug)
+        self.misses += 1
+        task = self._loads.get(slug)
+        if task is None:
+            task = self._loads[slug] = asyncio.create_task(self._load(slug, load, self._generation))
+            task.add_done_callback(_retrieve_exception)
+        # A request giving up waiting must not cancel the load other requests wait for.
+        return await asyncio.shield(task)
+
+    def invalidate(self, *slugs: ArticleSlug) -> None:
+        for slug in slugs:
+            self._remove(slug)
+            self._loads.pop(slug, None)
+        self._generation += 1
+
+    async def _load(
+        self, slug: ArticleSlug, load: t.Callable[[], t.Awaitable[Article | None]], generation: int
+    ) -> Article | None:
+        try:
+            article = await load()
+        finally:
+            if self._loads.get(slug) is asyncio.current_task():
+                del self._loads[slug]
+        ttl = self._ttl if article is not None else self._negative_ttl
+        if generation == self._generation and ttl > 0:
+            self._remove(slug)
+            entry = self._entries[slug] = _Entry(article, self._clock() + ttl, _size(slug, article))
+            self.bytes += entry.size
+            while self.bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return article
+
+    def _remove(self, slug: ArticleSlug) -> None:
+        entry = self._entries.pop(slug, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+
+def _size(slug: ArticleSlug, article: Article | None) -> int:
+    if article is None:
+        return _ENTRY_OVERHEAD + sys.getsizeof(slug)
+    return (
+        _ENTRY_OVERHEAD
+        + sys.getsizeof(article.slug)
+        + sys.getsizeof(article.title)
+        + sys.getsizeof(article.description)
+        + sys.getsizeof(article.body)
+    )
+
+
+def _retrieve_exception(task: asyncio.Task[t.Any]) -> None:
+    # The waiters get the exception, this keeps asyncio from reporting it when they have all
+    # given up waiting.
+    if not task.cancelled():
+        task.exception()
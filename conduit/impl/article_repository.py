@@ -1,8 +1,10 @@
 __all__ = [
     "PostgresqlArticleRepository",
+    "make_slug",
 ]
 
 import datetime as dt
+import itertools
 import typing as t
 from secrets import token_urlsafe
 
@@ -15,6 +17,7 @@ from conduit.core.entities.article import (
     ArticleFilter,
     ArticleId,
     ArticleRepository,
+    ArticleSearchCursor,
     ArticleSlug,
     CreateArticleInput,
     UpdateArticleInput,
@@ -30,38 +33,48 @@ class PostgresqlArticleRepository(ArticleRepository):
         self._now = now
 
     async def create(self, input: CreateArticleInput) -> Article:
-        stmt = (
-            sa.insert(tables.ARTICLE)
-            .values(
-                author_id=input.author_id,
-                slug=self._slugify(input.title),
-                title=input.title,
-                description=input.description,
-                body=input.body,
-                created_at=self._now(),
-            )
-            .returning(tables.ARTICLE)
+        result = await self._connection.execute(
+            _INSERT_STMT,
+            {
+                "author_id": input.author_id,
+                "slug": make_slug(input.title),
+                "title": input.title,
+                "description": input.description,
+                "body": input.body,
+                "created_at": self._now(),
+            },
         )
-        result = await self._connection.execute(stmt)
         return self._decode_article(result.one())
 
     async def get_many(self, filter: ArticleFilter, *, limit: int, offset: int) -> list[Article]:
-        stmt = sa.select(tables.ARTICLE)
-        stmt = self._apply_filter(stmt, filter)
-        stmt = stmt.limit(limit).offset(offset)
-        result = await self._connection.execute(stmt)
+        stmt = _SELECT_MANY_STMTS[_filter_key(filter)]
+        result = await self._connection.execute(stmt, {**_filter_params(filter), "limit": limit, "offset": offset})
         rows = result.all()
         return [self._decode_article(row) for row in rows]
 
     async def count(self, filter: ArticleFilter) -> int:
-        stmt = sa.select(sa.func.count(tables.ARTICLE.c.id))
-        stmt = self._apply_filter(stmt, filter)
-        result = await self._connection.execute(stmt)
-        return result.scalar_one()
+        stmt = _COUNT_STMTS[_filter_key(filter)]
+        result = await self._connection.execute(stmt, _filter_params(filter))
+        count = result.scalar_one()
+        assert isinstance(count, int)
+        return count
+
+    async def search(
+        self,
+        filter: ArticleFilter,
+        *,
+        limit: int,
+        after: ArticleSearchCursor | None,
+    ) -> list[tuple[Article, float]]:
+        assert filter.query is not None
+        stmt = _SEARCH_STMTS[_filter_key(filter)]
+        result = await self._connection.execute(
+            stmt, {**_filter_params(filter), **_search_cursor_params(after), "limit": limit}
+        )
+        return [(self._decode_article(row), row.rank) for row in result.all()]
 
     async def get_by_slug(self, slug: ArticleSlug) -> Article | None:
-        stmt = sa.select(tables.ARTICLE).where(tables.ARTICLE.c.slug == slug)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_BY_SLUG_STMT, {"slug": slug})
         row = result.one_or_none()
         if row is None:
             return None
@@ -72,10 +85,10 @@ class PostgresqlArticleRepository(ArticleRepository):
             sa.update(tables.ARTICLE)
             .where(tables.ARTICLE.c.id == id)
             .values(updated_at=self._now())
-            .returning(tables.ARTICLE)
+            .returning(*tables.ARTICLE_COLUMNS)
         )
         if input.title is not NotSet.NOT_SET:
-            stmt = stmt.values(title=input.title, slug=self._slugify(input.title))
+            stmt = stmt.values(title=input.title, slug=make_slug(input.title))
         if input.description is not NotSet.NOT_SET:
             stmt = stmt.values(description=input.description)
         if input.body is not NotSet.NOT_SET:
@@ -87,18 +100,12 @@ class PostgresqlArticleRepository(ArticleRepository):
         return self._decode_article(row)
 
     async def delete(self, id: ArticleId) -> ArticleId | None:
-        stmt = sa.delete(tables.ARTICLE).where(tables.ARTICLE.c.id == id).returning(tables.ARTICLE.c.id)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_DELETE_STMT, {"article_id": id})
         scalar = result.scalar_one_or_none()
         if scalar is None:
             return None
         return ArticleId(scalar)
 
-    def _slugify(self, title: str) -> ArticleSlug:
-        slug = slugify(title, max_length=32, lowercase=False)
-        token = token_urlsafe(8)
-        return ArticleSlug(f"{slug}-{token}")
-
     def _decode_article(self, db_row: t.Any) -> Article:
         return Article(
             id=ArticleId(db_row.id),
@@ -111,37 +118,141 @@ class PostgresqlArticleRepository(ArticleRepository):
             updated_at=db_row.updated_at,
         )
 
-    def _apply_filter(self, stmt: sa.Select[t.Any], filter: ArticleFilter) -> sa.Select[t.Any]:
-        if filter.tag is not None:
-            stmt = (
-                stmt.join_from(
-                    tables.ARTICLE, tables.ARTICLE_TAG, onclause=tables.ARTICLE.c.id == tables.ARTICLE_TAG.c.article_id
-                )
-                .join_from(tables.ARTICLE_TAG, tables.TAG, onclause=tables.ARTICLE_TAG.c.tag_id == tables.TAG.c.id)
-                .where(tables.TAG.c.tag == str(filter.tag))
-            )
-        if filter.author is not None:
-            stmt = stmt.join_from(
-                tables.ARTICLE, tables.USER, onclause=tables.ARTICLE.c.author_id == tables.USER.c.id
-            ).where(tables.USER.c.username == filter.author)
-        if filter.favorite_of is not None:
-            stmt = (
-                stmt.join_from(
-                    tables.ARTICLE,
-                    tables.FAVORITE_ARTICLE,
-                    onclause=tables.ARTICLE.c.id == tables.FAVORITE_ARTICLE.c.article_id,
-                )
-                .join_from(
-                    tables.FAVORITE_ARTICLE,
-                    tables.USER,
-                    onclause=tables.FAVORITE_ARTICLE.c.user_id == tables.USER.c.id,
-                )
-                .where(tables.USER.c.username == filter.favorite_of)
+
+def make_slug(title: str) -> ArticleSlug:
+    slug = slugify(title, max_length=32, lowercase=False)
+    token = token_urlsafe(8)
+    return ArticleSlug(f"{slug}-{token}")
+
+
+class _FilterKey(t.NamedTuple):
+    """Shape of an `ArticleFilter`: which of its fields are set."""
+
+    tag: bool
+    author: bool
+    favorite_of: bool
+    feed_of: bool
+    query: bool
+
+
+_FAVORITE_OF_USER = tables.USER.alias("favorite_of_user")
+# Same text search configuration as `article.search_vector`, so that words are stemmed alike.
+_QUERY = sa.func.websearch_to_tsquery(sa.literal_column("'english'"), sa.bindparam("query", type_=sa.Text))
+_RANK = sa.func.ts_rank(tables.ARTICLE.c.search_vector, _QUERY, type_=sa.Float)
+
+
+def _filter_key(filter: ArticleFilter) -> _FilterKey:
+    return _FilterKey(
+        tag=filter.tag is not None,
+        author=filter.author is not None,
+        favorite_of=filter.favorite_of is not None,
+        feed_of=filter.feed_of is not None,
+        query=filter.query is not None,
+    )
+
+
+def _filter_params(filter: ArticleFilter) -> dict[str, t.Any]:
+    params: dict[str, t.Any] = {}
+    if filter.tag is not None:
+        params["tag"] = str(filter.tag)
+    if filter.author is not None:
+        params["author"] = filter.author
+    if filter.favorite_of is not None:
+        params["favorite_of"] = filter.favorite_of
+    if filter.feed_of is not None:
+        params["feed_of"] = filter.feed_of
+    if filter.query is not None:
+        params["query"] = filter.query
+    return params
+
+
+def _search_cursor_params(after: ArticleSearchCursor | None) -> dict[str, t.Any]:
+    # Ranks are finite, so the first page starts "after" an infinite rank.
+    if after is None:
+        return {"after_rank": float("inf"), "after_id": 0}
+    return {"after_rank": after.rank, "after_id": after.id}
+
+
+def _apply_filter(stmt: sa.Select[t.Any], key: _FilterKey) -> sa.Select[t.Any]:
+    if key.tag:
+        stmt = (
+            stmt.join_from(
+                tables.ARTICLE, tables.ARTICLE_TAG, onclause=tables.ARTICLE.c.id == tables.ARTICLE_TAG.c.article_id
             )
-        if filter.feed_of is not None:
-            stmt = stmt.join_from(
+            .join_from(tables.ARTICLE_TAG, tables.TAG, onclause=tables.ARTICLE_TAG.c.tag_id == tables.TAG.c.id)
+            .where(tables.TAG.c.tag == sa.bindparam("tag"))
+        )
+    if key.author:
+        stmt = stmt.join_from(
+            tables.ARTICLE, tables.USER, onclause=tables.ARTICLE.c.author_id == tables.USER.c.id
+        ).where(tables.USER.c.username == sa.bindparam("author"))
+    if key.favorite_of:
+        stmt = (
+            stmt.join_from(
                 tables.ARTICLE,
-                tables.FOLLOWER,
-                onclause=tables.ARTICLE.c.author_id == tables.FOLLOWER.c.followed_id,
-            ).where(tables.FOLLOWER.c.follower_id == filter.feed_of)
-        return stmt
+                tables.FAVORITE_ARTICLE,
+                onclause=tables.ARTICLE.c.id == tables.FAVORITE_ARTICLE.c.article_id,
+            )
+            .join_from(
+                tables.FAVORITE_ARTICLE,
+                _FAVORITE_OF_USER,
+                onclause=tables.FAVORITE_ARTICLE.c.user_id == _FAVORITE_OF_USER.c.id,
+            )
+            .where(_FAVORITE_OF_USER.c.username == sa.bindparam("favorite_of"))
+        )
+    if key.feed_of:
+        stmt = stmt.join_from(
+            tables.ARTICLE,
+            tables.FOLLOWER,
+            onclause=tables.ARTICLE.c.author_id == tables.FOLLOWER.c.followed_id,
+        ).where(tables.FOLLOWER.c.follower_id == sa.bindparam("feed_of"))
+    if key.query:
+        stmt = stmt.where(tables.ARTICLE.c.search_vector.bool_op("@@")(_QUERY))
+    return stmt
+
+
+# Statements are built once at import time: SQLAlchemy memoizes the cache key of a statement object,
+# so executing the same object with different parameters skips both construction and cache key generation.
+_FILTER_KEYS: t.Final = [
+    _FilterKey(*flags) for flags in itertools.product((False, True), repeat=len(_FilterKey._fields))
+]
+_SELECT_MANY_STMTS: t.Final = {
+    key: _apply_filter(sa.select(*tables.ARTICLE_COLUMNS), key)
+    .order_by(tables.ARTICLE.c.created_at.desc(), tables.ARTICLE.c.id.desc())
+    .limit(sa.bindparam("limit"))
+    .offset(sa.bindparam("offset"))
+    for key in _FILTER_KEYS
+}
+_COUNT_STMTS: t.Final = {key: _apply_filter(sa.select(sa.func.count(tables.ARTICLE.c.id)), key) for key in _FILTER_KEYS}
+# Keyset pagination over `(rank, id)`: the next page starts right after the last row of the previous one.
+_SEARCH_STMTS: t.Final = {
+    key: _apply_filter(sa.select(*tables.ARTICLE_COLUMNS, _RANK.label("rank")), key)
+    .where(
+        sa.tuple_(_RANK, tables.ARTICLE.c.id)
+        < sa.tuple_(sa.bindparam("after_rank", type_=sa.Float), sa.bindparam("after_id", type_=sa.BigInteger))
+    )
+    .order_by(_RANK.desc(), tables.ARTICLE.c.id.desc())
+    .limit(sa.bindparam("limit"))
+    for key in _FILTER_KEYS
+    if key.query
+}
+_SELECT_BY_SLUG_STMT: t.Final = sa.select(*tables.ARTICLE_COLUMNS).where(tables.ARTICLE.c.slug == sa.bindparam("slug"))
+_INSERT_STMT: t.Final = sa.insert(tables.ARTICLE).returning(*tables.ARTICLE_COLUMNS)
+# The tags are unlinked explicitly, rather than by the cascade, to uncount the article from them.
+_UNTAGGED: t.Final = (
+    sa.delete(tables.ARTICLE_TAG)
+    .where(tables.ARTICLE_TAG.c.article_id == sa.bindparam("article_id"))
+    .returning(tables.ARTICLE_TAG.c.tag_id)
+    .cte("untagged")
+)
+_UNCOUNTED: t.Final = (
+    sa.insert(tables.TAG_ARTICLE_COUNT_DELTA)
+    .from_select(["tag_id", "delta"], sa.select(_UNTAGGED.c.tag_id, sa.literal(-1, sa.BigInteger)))
+    .cte("uncounted")
+)
+_DELETE_STMT: t.Final = (
+    sa.delete(tables.ARTICLE)
+    .add_cte(_UNTAGGED, _UNCOUNTED)
+    .where(tables.ARTICLE.c.id == sa.bindparam("article_id"))
+    .returning(tables.ARTICLE.c.id)
+)
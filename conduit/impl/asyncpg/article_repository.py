@@ -0,0 +1,228 @@
+__all__ = [
+    "AsyncpgArticleRepository",
+]
+
+import datetime as dt
+import itertools
+import typing as t
+
+import asyncpg
+
+from conduit.core.entities.article import (
+    Article,
+    ArticleFilter,
+    ArticleId,
+    ArticleRepository,
+    ArticleSearchCursor,
+    ArticleSlug,
+    CreateArticleInput,
+    UpdateArticleInput,
+)
+from conduit.core.entities.common import NotSet
+from conduit.impl.article_repository import make_slug
+
+_COLUMNS: t.Final = (
+    "article.id, article.author_id, article.slug, article.title, article.description, article.body, "
+    "article.created_at, article.updated_at"
+)
+
+# Same text search configuration as `article.search_vector`, so that words are stemmed alike.
+_QUERY_TEMPLATE: t.Final = "websearch_to_tsquery('english', ${})"
+
+
+class AsyncpgArticleRepository(ArticleRepository):
+    def __init__(self, connection: asyncpg.Connection, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow) -> None:
+        self._connection = connection
+        self._now = now
+
+    async def create(self, input: CreateArticleInput) -> Article:
+        record = await self._connection.fetchrow(
+            _INSERT_SQL,
+            input.author_id,
+            make_slug(input.title),
+            input.title,
+            input.description,
+            input.body,
+            self._now(),
+        )
+        return self._decode_article(record)
+
+    async def get_many(self, filter: ArticleFilter, *, limit: int, offset: int) -> list[Article]:
+        args = _filter_args(filter)
+        records = await self._connection.fetch(_SELECT_MANY_SQL[_filter_key(filter)], *args, limit, offset)
+        return [self._decode_article(record) for record in records]
+
+    async def count(self, filter: ArticleFilter) -> int:
+        count = await self._connection.fetchval(_COUNT_SQL[_filter_key(filter)], *_filter_args(filter))
+        assert isinstance(count, int)
+        return count
+
+    async def search(
+        self,
+        filter: ArticleFilter,
+        *,
+        limit: int,
+        after: ArticleSearchCursor | None,
+    ) -> list[tuple[Article, float]]:
+        assert filter.query is not None
+        # Ranks are finite, so the first page starts "after" an infinite rank.
+        after_rank, after_id = (after.rank, after.id) if after is not None else (float("inf"), 0)
+        records = await self._connection.fetch(
+            _SEARCH_SQL[_filter_key(filter)], *_filter_args(filter), after_rank, after_id, limit
+        )
+        return [(self._decode_article(record), record["rank"]) for record in records]
+
+    async def get_by_slug(self, slug: ArticleSlug) -> Article | None:
+        record = await self._connection.fetchrow(_SELECT_BY_SLUG_SQL, slug)
+        if record is None:
+            return None
+        return self._decode_article(record)
+
+    async def update(self, id: ArticleId, input: UpdateArticleInput) -> Article | None:
+        columns = ["updated_at"]
+        args: list[t.Any] = [self._now()]
+        if input.title is not NotSet.NOT_SET:
+            columns.extend(["title", "slug"])
+            args.extend([input.title, make_slug(input.title)])
+        if input.description is not NotSet.NOT_SET:
+            columns.append("description")
+            args.append(input.description)
+        if input.body is not NotSet.NOT_SET:
+            columns.append("body")
+            args.append(input.body)
+        assignments = ", ".join(f"{column} = ${n}" for n, column in enumerate(columns, start=2))
+        sql = f"UPDATE article SET {assignments} WHERE id = $1 RETURNING {_COLUMNS}"
+        record = await self._connection.fetchrow(sql, id, *args)
+        if record is None:
+            return None
+        return self._decode_article(record)
+
+    async def delete(self, id: ArticleId) -> ArticleId | None:
+        article_id = await self._connection.fetchval(_DELETE_SQL, id)
+        if article_id is None:
+            return None
+        return ArticleId(article_id)
+
+    def _decode_article(self, record: asyncpg.Record) -> Article:
+        return Article(
+            id=record["id"],
+            author_id=record["author_id"],
+            slug=record["slug"],
+            title=record["title"],
+            description=record["description"],
+            body=record["body"],
+            created_at=record["created_at"],
+            updated_at=record["updated_at"],
+        )
+
+
+class _FilterKey(t.NamedTuple):
+    """Shape of an `ArticleFilter`: which of its fields are set."""
+
+    tag: bool
+    author: bool
+    favorite_of: bool
+    feed_of: bool
+    query: bool
+
+
+def _filter_key(filter: ArticleFilter) -> _FilterKey:
+    return _FilterKey(
+        tag=filter.tag is not None,
+        author=filter.author is not None,
+        favorite_of=filter.favorite_of is not None,
+        feed_of=filter.feed_of is not None,
+        query=filter.query is not None,
+    )
+
+
+def _filter_args(filter: ArticleFilter) -> list[t.Any]:
+    """Positional arguments in the order `_filter_sql` numbers their placeholders."""
+    args: list[t.Any] = []
+    if filter.tag is not None:
+        args.append(str(filter.tag))
+    if filter.author is not None:
+        args.append(filter.author)
+    if filter.favorite_of is not None:
+        args.append(filter.favorite_of)
+    if filter.feed_of is not None:
+        args.append(filter.feed_of)
+    if filter.query is not None:
+        args.append(filter.query)
+    return args
+
+
+def _filter_sql(key: _FilterKey) -> tuple[str, int]:
+    """Renders the joins and the WHERE clause for `key`.
+
+    Returns:
+        SQL fragment and the number of placeholders it uses.
+    """
+    joins: list[str] = []
+    conditions: list[str] = []
+    if key.tag:
+        joins.append("JOIN article_tag ON article_tag.article_id = article.id JOIN tag ON tag.id = article_tag.tag_id")
+        conditions.append(f"tag.tag = ${len(conditions) + 1}")
+    if key.author:
+        joins.append('JOIN "user" AS author ON author.id = article.author_id')
+        conditions.append(f"author.username = ${len(conditions) + 1}")
+    if key.favorite_of:
+        joins.append(
+            "JOIN favorite_article ON favorite_article.article_id = article.id "
+            'JOIN "user" AS favorite_of_user ON favorite_of_user.id = favorite_article.user_id'
+        )
+        conditions.append(f"favorite_of_user.username = ${len(conditions) + 1}")
+    if key.feed_of:
+        joins.append("JOIN follower ON follower.followed_id = article.author_id")
+        conditions.append(f"follower.follower_id = ${len(conditions) + 1}")
+    if key.query:
+        conditions.append(f"article.search_vector @@ {_QUERY_TEMPLATE.format(len(conditions) + 1)}")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"{' '.join(joins)}{where}", len(conditions)
+
+
+def _select_many_sql(key: _FilterKey) -> str:
+    fragment, n = _filter_sql(key)
+    return (
+        f"SELECT {_COLUMNS} FROM article {fragment} "
+        f"ORDER BY article.created_at DESC, article.id DESC LIMIT ${n + 1} OFFSET ${n + 2}"
+    )
+
+
+def _search_sql(key: _FilterKey) -> str:
+    # The query is the last condition, its placeholder is `$n`.
+    fragment, n = _filter_sql(key)
+    rank = f"ts_rank(article.search_vector, {_QUERY_TEMPLATE.format(n)})"
+    return (
+        f"SELECT {_COLUMNS}, {rank} AS rank FROM article {fragment} "
+        f"AND ({rank}, article.id) < (${n + 1}, ${n + 2}) "
+        f"ORDER BY rank DESC, article.id DESC LIMIT ${n + 3}"
+    )
+
+
+def _count_sql(key: _FilterKey) -> str:
+    fragment, _ = _filter_sql(key)
+    return f"SELECT count(article.id) FROM article {fragment}"
+
+
+_FILTER_KEYS: t.Final = [
+    _FilterKey(*flags) for flags in itertools.product((False, True), repeat=len(_FilterKey._fields))
+]
+_SELECT_MANY_SQL: t.Final = {key: _select_many_sql(key) for key in _FILTER_KEYS}
+_COUNT_SQL: t.Final = {key: _count_sql(key) for key in _FILTER_KEYS}
+_SEARCH_SQL: t.Final = {key: _search_sql(key) for key in _FILTER_KEYS if key.query}
+_SELECT_BY_SLUG_SQL: t.Final = f"SELECT {_COLUMNS} FROM article WHERE slug = $1"
+_INSERT_SQL: t.Final = f"""
+    INSERT INTO article (author_id, slug, title, description, body, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    RETURNING {_COLUMNS}
+"""
+# The tags are unlinked explicitly, rather than by the cascade, to uncount the article from them.
+_DELETE_SQL: t.Final = """
+    WITH untagged AS (
+        DELETE FROM article_tag WHERE article_id = $1 RETURNING tag_id
+    ), uncounted AS (
+        INSERT INTO tag_article_count_delta (tag_id, delta) SELECT tag_id, -1 FROM untagged
+    )
+    DELETE FROM article WHERE id = $1 RETURNING id
+"""
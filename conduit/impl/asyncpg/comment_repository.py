@@ -0,0 +1,84 @@
+__all__ = [
+    "AsyncpgCommentRepository",
+]
+
+import datetime as dt
+import typing as t
+
+import asyncpg
+
+from conduit.core.entities.comment import Comment, CommentFilter, CommentId, CommentRepository, CreateCommentInput
+
+_COLUMNS: t.Final = "id, author_id, article_id, body, created_at, updated_at"
+
+
+class AsyncpgCommentRepository(CommentRepository):
+    def __init__(self, connection: asyncpg.Connection, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow) -> None:
+        self._connection = connection
+        self._now = now
+
+    async def create(self, input: CreateCommentInput) -> Comment:
+        record = await self._connection.fetchrow(
+            _INSERT_SQL, input.author_id, input.article_id, input.body, self._now()
+        )
+        return self._decode_comment(record)
+
+    async def get_many(self, filter: CommentFilter, *, limit: int | None) -> list[Comment]:
+        if filter.article_id is not None:
+            records = await self._connection.fetch(_SELECT_FOR_ARTICLE_SQL, *_filter_args(filter), limit)
+        else:
+            records = await self._connection.fetch(_SELECT_ALL_SQL, *_filter_args(filter), limit)
+        return [self._decode_comment(record) for record in records]
+
+    async def count(self, filter: CommentFilter) -> int:
+        sql = _COUNT_FOR_ARTICLE_SQL if filter.article_id is not None else _COUNT_ALL_SQL
+        count = await self._connection.fetchval(sql, *_filter_args(filter))
+        assert isinstance(count, int)
+        return count
+
+    async def get_by_id(self, id: CommentId) -> Comment | None:
+        record = await self._connection.fetchrow(_SELECT_BY_ID_SQL, id)
+        if record is None:
+            return None
+        return self._decode_comment(record)
+
+    async def delete(self, id: CommentId) -> CommentId | None:
+        comment_id = await self._connection.fetchval(_DELETE_SQL, id)
+        if comment_id is None:
+            return None
+        assert isinstance(comment_id, int)
+        return CommentId(comment_id)
+
+    def _decode_comment(self, record: asyncpg.Record) -> Comment:
+        return Comment(
+            id=record["id"],
+            author_id=record["author_id"],
+            article_id=record["article_id"],
+            body=record["body"],
+            created_at=record["created_at"],
+            updated_at=record["updated_at"],
+        )
+
+
+def _filter_args(filter: CommentFilter) -> list[t.Any]:
+    """Positional arguments: the cursor, then the article if the filter has one."""
+    # Comment ids start at 1, so `0` means "from the first comment".
+    args: list[t.Any] = [filter.after if filter.after is not None else 0]
+    if filter.article_id is not None:
+        args.append(filter.article_id)
+    return args
+
+
+_INSERT_SQL: t.Final = f"""
+    INSERT INTO comment (author_id, article_id, body, created_at)
+    VALUES ($1, $2, $3, $4)
+    RETURNING {_COLUMNS}
+"""
+_SELECT_ALL_SQL: t.Final = f"SELECT {_COLUMNS} FROM comment WHERE id > $1 ORDER BY id LIMIT $2"
+_SELECT_FOR_ARTICLE_SQL: t.Final = (
+    f"SELECT {_COLUMNS} FROM comment WHERE id > $1 AND article_id = $2 ORDER BY id LIMIT $3"
+)
+_COUNT_ALL_SQL: t.Final = "SELECT count(id) FROM comment WHERE id > $1"
+_COUNT_FOR_ARTICLE_SQL: t.Final = "SELECT count(id) FROM comment WHERE id > $1 AND article_id = $2"
+_SELECT_BY_ID_SQL: t.Final = f"SELECT {_COLUMNS} FROM comment WHERE id = $1"
+_DELETE_SQL: t.Final = "DELETE FROM comment WHERE id = $1 RETURNING id"
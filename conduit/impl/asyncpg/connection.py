@@ -0,0 +1,87 @@
+__all__ = [
+    "InstrumentedConnection",
+]
+
+import time
+import typing as t
+
+import asyncpg
+
+from conduit.core.entities.unit_of_work import QUERY_STATS_VAR
+from conduit.impl.unit_of_work import add_statement_timeout
+from conduit.slow_queries import Explain, SlowQueryLog
+from conduit.tracing import SPAN_VAR, record_span
+
+
+class InstrumentedConnection(asyncpg.Connection):  # type: ignore[misc]
+    """Connection accounting its statements in `QUERY_STATS_VAR`, tracing them and recording the slow ones.
+
+    Transactions run `BEGIN` and `COMMIT` through `execute`, so they are accounted too. The
+    reset of a connection released to the pool is not, like with SQLAlchemy. `BEGIN` also sets
+    the time left until the deadline of the request as `statement_timeout`.
+
+    Attributes:
+        slow_queries: Where the slow statements are recorded, set by the `init` of the pool.
+        explain: Captures the plan of a slow statement on another connection of the pool.
+    """
+
+    slow_queries: SlowQueryLog | None = None
+    explain: Explain | None = None
+
+    async def reset(self, *, timeout: float | None = None) -> None:
+        token = QUERY_STATS_VAR.set(None)
+        span_token = SPAN_VAR.set(None)
+        try:
+            await super().reset(timeout=timeout)
+        finally:
+            SPAN_VAR.reset(span_token)
+            QUERY_STATS_VAR.reset(token)
+
+    async def execute(self, query: str, *args: t.Any, timeout: float | None = None) -> str:
+        if not args:
+            query = add_statement_timeout(query)
+        started = time.perf_counter()
+        status: str = await super().execute(query, *args, timeout=timeout)
+        self._record(query, args, started, _affected_rows(status))
+        return status
+
+    async def fetch(
+        self, query: str, *args: t.Any, timeout: float | None = None, record_class: t.Any = None
+    ) -> list[t.Any]:
+        started = time.perf_counter()
+        records: list[t.Any] = await super().fetch(query, *args, timeout=timeout, record_class=record_class)
+        self._record(query, args, started, len(records))
+        return records
+
+    async def fetchrow(
+        self, query: str, *args: t.Any, timeout: float | None = None, record_class: t.Any = None
+    ) -> t.Any:
+        started = time.perf_counter()
+        record = await super().fetchrow(query, *args, timeout=timeout, record_class=record_class)
+        self._record(query, args, started, 0 if record is None else 1)
+        return record
+
+    async def fetchval(self, query: str, *args: t.Any, column: int = 0, timeout: float | None = None) -> t.Any:
+        started = time.perf_counter()
+        value = await super().fetchval(query, *args, column=column, timeout=timeout)
+        # A `NULL` value can not be told apart from no row at all.
+        self._record(query, args, started, 0 if value is None else 1)
+        return value
+
+    def _record(self, query: str, args: tuple[t.Any, ...], started: float, rows: int) -> None:
+        duration = time.perf_counter() - started
+        record_span("sql", duration, statement=query)
+        if self.slow_queries is not None and self.explain is not None and duration >= self.slow_queries.threshold:
+            self.slow_queries.record(query, args, duration, self.explain)
+        stats = QUERY_STATS_VAR.get()
+        if stats is None:
+            return
+        stats.statements += 1
+        stats.duration += duration
+        stats.rows += rows
+
+
+def _affected_rows(status: str) -> int:
+    # The row count ends the command tag, e.g. `INSERT 0 1` or `DELETE 3`, `BEGIN` has none.
+    count = status.rpartition(" ")[2]
+    return int(count) if count.isdigit() else 0
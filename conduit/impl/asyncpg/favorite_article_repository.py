@@ -0,0 +1,131 @@
+__all__ = [
+    "AsyncpgFavoriteArticleRepository",
+]
+
+import datetime as dt
+import typing as t
+
+import asyncpg
+from yarl import URL
+
+from conduit.core.entities.article import Article, ArticleId, ArticleSlug, ArticleWithExtra, FavoriteRepository, Tag
+from conduit.core.entities.user import User, UserId
+
+
+class AsyncpgFavoriteArticleRepository(FavoriteRepository):
+    def __init__(self, connection: asyncpg.Connection, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow) -> None:
+        self._connection = connection
+        self._now = now
+
+    async def add_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        record = await self._connection.fetchrow(_ADD_BY_SLUG_SQL, slug, user_id, self._now())
+        if record is None:
+            return None
+        return self._decode_article_with_extra(record, is_article_favorite=True)
+
+    async def remove_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        record = await self._connection.fetchrow(_REMOVE_BY_SLUG_SQL, slug, user_id)
+        if record is None:
+            return None
+        return self._decode_article_with_extra(record, is_article_favorite=False)
+
+    async def is_favorite(self, article_id: ArticleId, of: UserId) -> bool:
+        found = await self._connection.fetchval(_IS_FAVORITE_SQL, article_id, of)
+        return found is not None
+
+    async def are_favorite(self, article_ids: t.Collection[ArticleId], of: UserId) -> dict[ArticleId, bool]:
+        if not article_ids:
+            return {}
+        records = await self._connection.fetch(_ARE_FAVORITE_SQL, list(article_ids), of)
+        return {record[0]: True for record in records}
+
+    async def count(self, article_id: ArticleId) -> int:
+        count = await self._connection.fetchval(_COUNT_SQL, article_id)
+        assert isinstance(count, int)
+        return count
+
+    async def count_many(self, article_ids: t.Collection[ArticleId]) -> dict[ArticleId, int]:
+        if not article_ids:
+            return {}
+        records = await self._connection.fetch(_COUNT_MANY_SQL, list(article_ids))
+        return {record[0]: record[1] for record in records}
+
+    def _decode_article_with_extra(self, record: asyncpg.Record, is_article_favorite: bool) -> ArticleWithExtra:
+        image_url = record["author_image_url"]
+        return ArticleWithExtra(
+            v=Article(
+                id=record["id"],
+                author_id=record["author_id"],
+                slug=record["slug"],
+                title=record["title"],
+                description=record["description"],
+                body=record["body"],
+                created_at=record["created_at"],
+                updated_at=record["updated_at"],
+            ),
+            author=User(
+                id=record["author_id"],
+                username=record["author_username"],
+                email=record["author_email"],
+                password=record["author_password_hash"],
+                bio=record["author_bio"],
+                image=URL(image_url) if image_url is not None else None,
+            ),
+            tags=[Tag(tag) for tag in record["tags"] or []],
+            is_author_followed=record["is_author_followed"],
+            is_article_favorite=is_article_favorite,
+            favorite_of_user_count=record["favorite_of_user_count"],
+        )
+
+
+# The final SELECT sees the snapshot taken before the change, hence the adjusted count.
+_ARTICLE_WITH_EXTRA_TEMPLATE: t.Final = """
+    SELECT
+        target_article.*,
+        author.username AS author_username,
+        author.email AS author_email,
+        author.password_hash AS author_password_hash,
+        author.bio AS author_bio,
+        author.image_url AS author_image_url,
+        (
+            SELECT array_agg(tag.tag ORDER BY tag.tag)
+            FROM article_tag JOIN tag ON tag.id = article_tag.tag_id
+            WHERE article_tag.article_id = target_article.id
+        ) AS tags,
+        EXISTS (
+            SELECT 1 FROM follower WHERE follower_id = $2 AND followed_id = target_article.author_id
+        ) AS is_author_followed,
+        (SELECT count(user_id) FROM favorite_article WHERE article_id = target_article.id)
+            {sign} (SELECT count(*) FROM changed) AS favorite_of_user_count
+    FROM target_article JOIN "user" AS author ON author.id = target_article.author_id
+"""
+_ADD_BY_SLUG_SQL: t.Final = """
+    WITH target_article AS (
+        SELECT id, author_id, slug, title, description, body, created_at, updated_at FROM article WHERE slug = $1
+    ), changed AS (
+        INSERT INTO favorite_article (article_id, user_id, created_at)
+        SELECT id, $2, $3 FROM target_article
+        ON CONFLICT DO NOTHING
+        RETURNING article_id
+    )
+""" + _ARTICLE_WITH_EXTRA_TEMPLATE.format(sign="+")
+_REMOVE_BY_SLUG_SQL: t.Final = """
+    WITH target_article AS (
+        SELECT id, author_id, slug, title, description, body, created_at, updated_at FROM article WHERE slug = $1
+    ), changed AS (
+        DELETE FROM favorite_article
+        WHERE article_id IN (SELECT id FROM target_article) AND user_id = $2
+        RETURNING article_id
+    )
+""" + _ARTICLE_WITH_EXTRA_TEMPLATE.format(sign="-")
+_IS_FAVORITE_SQL: t.Final = "SELECT article_id FROM favorite_article WHERE article_id = $1 AND user_id = $2"
+_ARE_FAVORITE_SQL: t.Final = (
+    "SELECT article_id FROM favorite_article WHERE article_id = ANY($1::bigint[]) AND user_id = $2"
+)
+_COUNT_SQL: t.Final = "SELECT count(user_id) FROM favorite_article WHERE article_id = $1"
+_COUNT_MANY_SQL: t.Final = """
+    SELECT article_id, count(user_id)
+    FROM favorite_article
+    WHERE article_id = ANY($1::bigint[])
+    GROUP BY article_id
+"""
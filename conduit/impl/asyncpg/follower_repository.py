@@ -0,0 +1,49 @@
+__all__ = [
+    "AsyncpgFollowerRepository",
+]
+
+import datetime as dt
+import typing as t
+
+import asyncpg
+
+from conduit.core.entities.user import FollowerRepository, UserId
+
+
+class AsyncpgFollowerRepository(FollowerRepository):
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        now: t.Callable[[], dt.datetime] = dt.datetime.utcnow,
+    ) -> None:
+        self._connection = connection
+        self._now = now
+
+    async def follow(self, *, follower_id: UserId, followed_id: UserId) -> None:
+        await self._connection.execute(_INSERT_SQL, follower_id, followed_id, self._now())
+
+    async def unfollow(self, *, follower_id: UserId, followed_id: UserId) -> None:
+        await self._connection.execute(_DELETE_SQL, follower_id, followed_id)
+
+    async def is_followed(self, id: UserId, *, by: UserId) -> bool:
+        followed_id = await self._connection.fetchval(_IS_FOLLOWED_SQL, by, id)
+        return followed_id is not None
+
+    async def are_followed(self, ids: t.Collection[UserId], by: UserId) -> dict[UserId, bool]:
+        if not ids:
+            return {}
+        records = await self._connection.fetch(_ARE_FOLLOWED_SQL, by, list(ids))
+        followed_ids = {record[0] for record in records}
+        return {id: id in followed_ids for id in ids}
+
+
+_INSERT_SQL: t.Final = """
+    INSERT INTO follower (follower_id, followed_id, created_at)
+    VALUES ($1, $2, $3)
+    ON CONFLICT DO NOTHING
+"""
+_DELETE_SQL: t.Final = "DELETE FROM follower WHERE follower_id = $1 AND followed_id = $2"
+_IS_FOLLOWED_SQL: t.Final = "SELECT followed_id FROM follower WHERE follower_id = $1 AND followed_id = $2"
+_ARE_FOLLOWED_SQL: t.Final = (
+    "SELECT followed_id FROM follower WHERE follower_id = $1 AND followed_id = ANY($2::bigint[])"
+)
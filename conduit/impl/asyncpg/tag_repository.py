@@ -0,0 +1,127 @@
+__all__ = [
+    "AsyncpgTagRepository",
+]
+
+import datetime as dt
+import typing as t
+
+import asyncpg
+
+from conduit.core.entities.article import ArticleId, Tag, TagRepository
+
+
+class AsyncpgTagRepository(TagRepository):
+    def __init__(self, connection: asyncpg.Connection, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow) -> None:
+        self._connection = connection
+        self._now = now
+        # Number of tags that did not exist before, committed along with the transaction.
+        self.created_tags = 0
+
+    async def create(self, article_id: ArticleId, tags: t.Collection[Tag]) -> None:
+        await self.create_many({article_id: tags})
+
+    async def create_many(self, tags: t.Mapping[ArticleId, t.Collection[Tag]]) -> None:
+        article_ids = [article_id for article_id, article_tags in tags.items() for _ in article_tags]
+        if not article_ids:
+            return None
+        raw_tags = [str(tag) for article_tags in tags.values() for tag in article_tags]
+        now = self._now()
+        created, missing = await self._connection.fetchrow(_TAG_ARTICLES_SQL, article_ids, raw_tags, now)
+        if missing:
+            # Tags committed concurrently after the statement started are not visible to it,
+            # they are to the same statement run again.
+            created, missing = await self._connection.fetchrow(_TAG_ARTICLES_SQL, article_ids, raw_tags, now)
+            assert not missing
+        self.created_tags += created
+
+    async def get_many(self, *, after: Tag | None, limit: int) -> list[Tag]:
+        # Every tag sorts after the empty string.
+        after_tag = "" if after is None else str(after)
+        records = await self._connection.fetch(_SELECT_MANY_SQL, after_tag, limit)
+        return [Tag(record[0]) for record in records]
+
+    async def get_popular(self, *, limit: int) -> list[Tag]:
+        records = await self._connection.fetch(_SELECT_POPULAR_SQL, limit)
+        return [Tag(record[0]) for record in records]
+
+    async def count_articles(self) -> int:
+        count: int = await self._connection.fetchval(_COUNT_ARTICLES_SQL)
+        return count
+
+    async def get_for_article(self, article_id: ArticleId) -> list[Tag]:
+        records = await self._connection.fetch(_SELECT_FOR_ARTICLE_SQL, article_id)
+        return [Tag(record[0]) for record in records]
+
+    async def get_for_articles(self, article_ids: t.Collection[ArticleId]) -> dict[ArticleId, list[Tag]]:
+        records = await self._connection.fetch(_SELECT_FOR_ARTICLES_SQL, list(article_ids))
+        tags: dict[ArticleId, list[Tag]] = {}
+        for article_id, tag in records:
+            tags.setdefault(article_id, [])
+            tags[article_id].append(Tag(tag))
+        return tags
+
+
+# Tags are looked up before they are inserted, and inserted with `DO NOTHING`: unlike `DO UPDATE`
+# it does not lock the existing row, which every article with a popular tag would wait for. The
+# count of tags in neither returns the ones that `DO NOTHING` skipped. Only the pairs that `linked`
+# inserts count towards the articles of a tag. Postgres runs a data-modifying CTE even if nothing
+# refers to it.
+_TAG_ARTICLES_SQL: t.Final = """
+    WITH pairs AS (
+        SELECT DISTINCT * FROM unnest($1::bigint[], $2::text[]) AS pairs(article_id, tag)
+    ), existing_tag AS (
+        SELECT id, tag FROM tag WHERE tag = ANY($2::text[])
+    ), inserted_tag AS (
+        INSERT INTO tag (tag, created_at)
+        SELECT DISTINCT tag, $3::timestamp FROM pairs WHERE tag NOT IN (SELECT tag FROM existing_tag)
+        ON CONFLICT (tag) DO NOTHING
+        RETURNING id, tag
+    ), found_tag AS (
+        SELECT id, tag FROM existing_tag UNION ALL SELECT id, tag FROM inserted_tag
+    ), linked AS (
+        INSERT INTO article_tag (article_id, tag_id, created_at)
+        SELECT pairs.article_id, found_tag.id, $3::timestamp
+        FROM pairs JOIN found_tag ON found_tag.tag = pairs.tag
+        ON CONFLICT DO NOTHING
+        RETURNING tag_id
+    ), counted AS (
+        INSERT INTO tag_article_count_delta (tag_id, delta)
+        SELECT tag_id, count(*) FROM linked GROUP BY tag_id
+    )
+    SELECT
+        (SELECT count(*) FROM inserted_tag) AS created,
+        (SELECT count(DISTINCT tag) FROM pairs) - (SELECT count(*) FROM found_tag) AS missing
+"""
+# Folded deltas are deleted in the same statement: concurrent folds skip the rows deleted by each other.
+_COUNT_ARTICLES_SQL: t.Final = """
+    WITH folded AS (
+        DELETE FROM tag_article_count_delta RETURNING tag_id, delta
+    ), summed AS (
+        SELECT tag_id, sum(delta) AS delta FROM folded GROUP BY tag_id
+    ), counted AS (
+        UPDATE tag SET article_count = tag.article_count + summed.delta
+        FROM summed WHERE tag.id = summed.tag_id
+        RETURNING tag.id
+    )
+    SELECT count(*) FROM counted
+"""
+_SELECT_MANY_SQL: t.Final = "SELECT tag FROM tag WHERE tag > $1 ORDER BY tag LIMIT $2"
+# Tags of deleted articles stay around, without articles they are not popular.
+_SELECT_POPULAR_SQL: t.Final = """
+    SELECT tag FROM tag
+    WHERE article_count > 0
+    ORDER BY article_count DESC, id DESC
+    LIMIT $1
+"""
+_SELECT_FOR_ARTICLE_SQL: t.Final = """
+    SELECT tag.tag
+    FROM tag JOIN article_tag ON tag.id = article_tag.tag_id
+    WHERE article_tag.article_id = $1
+    ORDER BY tag.tag
+"""
+_SELECT_FOR_ARTICLES_SQL: t.Final = """
+    SELECT article_tag.article_id, tag.tag
+    FROM tag JOIN article_tag ON tag.id = article_tag.tag_id
+    WHERE article_tag.article_id = ANY($1::bigint[])
+    ORDER BY tag.tag
+"""
@@ -0,0 +1,183 @@
+__all__ = [
+    "AsyncpgUnitOfWork",
+    "AsyncpgUnitOfWorkContext",
+]
+
+import asyncio
+import functools
+import time
+import typing as t
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import asyncpg
+
+from conduit.core.entities.errors import DeadlineExceededError
+from conduit.core.entities.unit_of_work import DEADLINE_VAR, UnitOfWork, remaining_time
+from conduit.core.use_cases.data_loader import clear_loaders
+from conduit.impl.asyncpg.article_repository import AsyncpgArticleRepository
+from conduit.impl.asyncpg.comment_repository import AsyncpgCommentRepository
+from conduit.impl.asyncpg.connection import InstrumentedConnection
+from conduit.impl.asyncpg.favorite_article_repository import AsyncpgFavoriteArticleRepository
+from conduit.impl.asyncpg.follower_repository import AsyncpgFollowerRepository
+from conduit.impl.asyncpg.tag_repository import AsyncpgTagRepository
+from conduit.impl.asyncpg.user_repository import AsyncpgUserRepository
+from conduit.impl.read_your_writes import ReadYourWrites
+from conduit.impl.unit_of_work import PoolStats, record_pool_wait, record_transaction, statement_timeout
+from conduit.slow_queries import SlowQueryLog
+
+
+@dataclass(frozen=True)
+class AsyncpgUnitOfWorkContext:
+    users: AsyncpgUserRepository
+    followers: AsyncpgFollowerRepository
+    articles: AsyncpgArticleRepository
+    tags: AsyncpgTagRepository
+    favorites: AsyncpgFavoriteArticleRepository
+    comments: AsyncpgCommentRepository
+
+
+class AsyncpgUnitOfWork(UnitOfWork):
+    """Unit of work running repositories directly on an asyncpg connection pool.
+
+    Pools are created lazily on the first `begin()`, so the instance can be constructed
+    outside of the event loop that is going to use it.
+
+    Args:
+        dsn: DSN of the primary database.
+        replica_dsn: DSN of a read replica serving read-only units of work. Without it
+            everything goes to the primary.
+        read_your_writes: Sends reads of a user who has just written something to the primary.
+        on_tags_created: Called once a unit of work that has created new tags is committed.
+        min_size: Minimum number of connections of each pool.
+        max_size: Maximum number of connections of each pool.
+        slow_queries: Records the slow statements.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        replica_dsn: str | None = None,
+        read_your_writes: ReadYourWrites | None = None,
+        on_tags_created: t.Callable[[], None] | None = None,
+        min_size: int = 10,
+        max_size: int = 10,
+        slow_queries: SlowQueryLog | None = None,
+    ) -> None:
+        self._dsn = dsn
+        self._replica_dsn = replica_dsn
+        self._read_your_writes = read_your_writes if read_your_writes is not None else ReadYourWrites(window=0)
+        self._on_tags_created = on_tags_created
+        self._min_size = min_size
+        self._max_size = max_size
+        self._slow_queries = slow_queries
+        self._pools: dict[str, asyncpg.Pool] = {}
+        self._pool_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def begin(
+        self, *, read_only: bool = False, autocommit: bool = False
+    ) -> t.AsyncIterator[AsyncpgUnitOfWorkContext]:
+        assert read_only or not autocommit, "only reads can run outside of a transaction"
+        statement_timeout()
+        pool = await self._get_pool(self._choose_dsn(read_only))
+        try:
+            if autocommit:
+                # Without a transaction there is no `SET LOCAL`, the deadline is enforced by
+                # cancelling the task, which makes asyncpg cancel the running statement.
+                deadline = asyncio.timeout(remaining_time())
+                try:
+                    async with deadline, _acquire(pool) as connection:
+                        yield self._context(connection)
+                except TimeoutError as error:
+                    if deadline.expired():
+                        raise DeadlineExceededError() from error
+                    raise
+            else:
+                async with (
+                    _acquire(pool, timeout=remaining_time()) as connection,
+                    # `BEGIN` sets the remaining budget as `statement_timeout`, see `InstrumentedConnection`.
+                    connection.transaction(readonly=read_only),
+                ):
+                    record_transaction()
+                    context = self._context(connection)
+                    yield context
+                if context.tags.created_tags and self._on_tags_created is not None:
+                    self._on_tags_created()
+        except asyncpg.QueryCanceledError as error:
+            if DEADLINE_VAR.get() is not None:
+                raise DeadlineExceededError() from error
+            raise
+        if not read_only:
+            self._read_your_writes.record_write()
+            clear_loaders()
+
+    async def close(self) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.close()
+
+    def pool_stats(self) -> list[PoolStats]:
+        return [
+            PoolStats(
+                "primary" if dsn == self._dsn else "replica",
+                pool.get_size() - pool.get_idle_size(),
+                pool.get_idle_size(),
+            )
+            for dsn, pool in self._pools.items()
+        ]
+
+    def _context(self, connection: asyncpg.Connection) -> AsyncpgUnitOfWorkContext:
+        return AsyncpgUnitOfWorkContext(
+            users=AsyncpgUserRepository(connection),
+            followers=AsyncpgFollowerRepository(connection),
+            articles=AsyncpgArticleRepository(connection),
+            tags=AsyncpgTagRepository(connection),
+            favorites=AsyncpgFavoriteArticleRepository(connection),
+            comments=AsyncpgCommentRepository(connection),
+        )
+
+    def _choose_dsn(self, read_only: bool) -> str:
+        if read_only and self._replica_dsn is not None and not self._read_your_writes.must_read_from_primary():
+            return self._replica_dsn
+        return self._dsn
+
+    async def _get_pool(self, dsn: str) -> asyncpg.Pool:
+        pool = self._pools.get(dsn)
+        if pool is not None:
+            return pool
+        async with self._pool_lock:
+            if dsn not in self._pools:
+                self._pools[dsn] = await asyncpg.create_pool(
+                    dsn,
+                    min_size=self._min_size,
+                    max_size=self._max_size,
+                    connection_class=InstrumentedConnection,
+                    init=functools.partial(self._init_connection, dsn) if self._slow_queries is not None else None,
+                )
+        return self._pools[dsn]
+
+    async def _init_connection(self, dsn: str, connection: InstrumentedConnection) -> None:
+        connection.slow_queries = self._slow_queries
+        connection.explain = functools.partial(self._explain, dsn)
+
+    async def _explain(self, dsn: str, query: str, args: t.Sequence[t.Any]) -> t.Any:
+        async with self._pools[dsn].acquire() as connection:
+            return await connection.fetchval(query, *args)
+
+
+@asynccontextmanager
+async def _acquire(pool: asyncpg.Pool, timeout: float | None = None) -> t.AsyncIterator[asyncpg.Connection]:
+    """Connection of `pool`, waiting for it `timeout` seconds at most, the time left until the deadline."""
+    started = time.perf_counter()
+    try:
+        connection = await pool.acquire(timeout=timeout)
+    except TimeoutError as error:
+        if timeout is None:
+            raise
+        raise DeadlineExceededError() from error
+    try:
+        record_pool_wait(started)
+        yield connection
+    finally:
+        await pool.release(connection)
@@ -0,0 +1,128 @@
+__all__ = [
+    "AsyncpgUserRepository",
+]
+
+import datetime as dt
+import typing as t
+
+import asyncpg
+from yarl import URL
+
+from conduit.core.entities.common import NotSet
+from conduit.core.entities.errors import EmailAlreadyExistsError, UsernameAlreadyExistsError
+from conduit.core.entities.user import (
+    CreateUserInput,
+    Email,
+    UpdateUserInput,
+    User,
+    UserId,
+    Username,
+    UserRepository,
+)
+
+_COLUMNS: t.Final = "id, username, email, password_hash, bio, image_url"
+
+
+class AsyncpgUserRepository(UserRepository):
+    USERNAME_UNIQUE_CONSTRAINT: t.Final = "user_username_key"
+    EMAIL_UNIQUE_CONSTRAINT: t.Final = "user_email_key"
+
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        now: t.Callable[[], dt.datetime] = dt.datetime.utcnow,
+    ) -> None:
+        self._connection = connection
+        self._now = now
+
+    async def create(self, input: CreateUserInput) -> User:
+        try:
+            record = await self._connection.fetchrow(
+                _INSERT_SQL, input.username, input.email, input.password, self._now()
+            )
+        except asyncpg.UniqueViolationError as e:
+            self._handle_unique_violation(e)
+        return self._decode_user(record)
+
+    async def get_by_email(self, email: Email) -> User | None:
+        record = await self._connection.fetchrow(_SELECT_BY_EMAIL_SQL, email)
+        if record is None:
+            return None
+        return self._decode_user(record)
+
+    async def get_by_username(self, username: Username) -> User | None:
+        record = await self._connection.fetchrow(_SELECT_BY_USERNAME_SQL, username)
+        if record is None:
+            return None
+        return self._decode_user(record)
+
+    async def get_by_id(self, id: UserId) -> User | None:
+        record = await self._connection.fetchrow(_SELECT_BY_ID_SQL, id)
+        if record is None:
+            return None
+        return self._decode_user(record)
+
+    async def get_by_ids(self, ids: t.Collection[UserId]) -> dict[UserId, User]:
+        records = await self._connection.fetch(_SELECT_BY_IDS_SQL, list(ids))
+        users = {}
+        for record in records:
+            user = self._decode_user(record)
+            users[user.id] = user
+        return users
+
+    async def update(self, id: UserId, input: UpdateUserInput) -> User | None:
+        columns = ["updated_at"]
+        args: list[t.Any] = [self._now()]
+        if input.username is not NotSet.NOT_SET:
+            columns.append("username")
+            args.append(input.username)
+        if input.email is not NotSet.NOT_SET:
+            columns.append("email")
+            args.append(input.email)
+        if input.password is not NotSet.NOT_SET:
+            columns.append("password_hash")
+            args.append(input.password)
+        if input.bio is not NotSet.NOT_SET:
+            columns.append("bio")
+            args.append(input.bio)
+        if input.image is not NotSet.NOT_SET:
+            columns.append("image_url")
+            args.append(str(input.image) if input.image is not None else None)
+        assignments = ", ".join(f"{column} = ${n}" for n, column in enumerate(columns, start=2))
+        sql = f'UPDATE "user" SET {assignments} WHERE id = $1 RETURNING {_COLUMNS}'
+        try:
+            record = await self._connection.fetchrow(sql, id, *args)
+        except asyncpg.UniqueViolationError as e:
+            self._handle_unique_violation(e)
+        if record is None:
+            return None
+        return self._decode_user(record)
+
+    def _decode_user(self, record: asyncpg.Record) -> User:
+        image_url = record["image_url"]
+        return User(
+            id=record["id"],
+            username=record["username"],
+            email=record["email"],
+            password=record["password_hash"],
+            bio=record["bio"],
+            image=URL(image_url) if image_url is not None else None,
+        )
+
+    def _handle_unique_violation(self, error: asyncpg.UniqueViolationError) -> t.NoReturn:
+        if error.constraint_name == self.USERNAME_UNIQUE_CONSTRAINT:
+            raise UsernameAlreadyExistsError() from error
+        if error.constraint_name == self.EMAIL_UNIQUE_CONSTRAINT:
+            raise EmailAlreadyExistsError() from error
+        raise error
+
+
+_INSERT_SQL: t.Final = f"""
+    INSERT INTO "user" (username, email, password_hash, bio, created_at)
+    VALUES ($1, $2, $3, '', $4)
+    RETURNING {_COLUMNS}
+"""
+_SELECT_BY_EMAIL_SQL: t.Final = f'SELECT {_COLUMNS} FROM "user" WHERE email = $1'
+_SELECT_BY_USERNAME_SQL: t.Final = f'SELECT {_COLUMNS} FROM "user" WHERE username = $1'
+_SELECT_BY_ID_SQL: t.Final = f'SELECT {_COLUMNS} FROM "user" WHERE id = $1'
+_SELECT_BY_IDS_SQL: t.Final = f'SELECT {_COLUMNS} FROM "user" WHERE id = ANY($1::bigint[])'
@@ -20,35 +20,43 @@ class PostgresqlCommentRepository(CommentRepository):
         self._now = now
 
     async def create(self, input: CreateCommentInput) -> Comment:
-        stmt = (
-            sa.insert(tables.COMMENT)
-            .values(author_id=input.author_id, article_id=input.article_id, body=input.body, created_at=self._now())
-            .returning(tables.COMMENT)
+        result = await self._connection.execute(
+            _INSERT_STMT,
+            {
+                "author_id": input.author_id,
+                "article_id": input.article_id,
+                "body": input.body,
+                "created_at": self._now(),
+            },
         )
-        result = await self._connection.execute(stmt)
         row = result.one()
         return self._decode_comment(row)
 
-    async def get_many(self, filter: CommentFilter) -> list[Comment]:
-        stmt = sa.select(tables.COMMENT)
+    async def get_many(self, filter: CommentFilter, *, limit: int | None) -> list[Comment]:
+        params = {**_filter_params(filter), "limit": limit}
         if filter.article_id is not None:
-            stmt = stmt.where(tables.COMMENT.c.article_id == filter.article_id)
-        stmt = stmt.order_by(tables.COMMENT.c.id)
-        result = await self._connection.execute(stmt)
+            result = await self._connection.execute(_SELECT_FOR_ARTICLE_STMT, params)
+        else:
+            result = await self._connection.execute(_SELECT_ALL_STMT, params)
         rows = result.all()
         return [self._decode_comment(row) for row in rows]
 
+    async def count(self, filter: CommentFilter) -> int:
+        stmt = _COUNT_FOR_ARTICLE_STMT if filter.article_id is not None else _COUNT_ALL_STMT
+        result = await self._connection.execute(stmt, _filter_params(filter))
+        count = result.scalar_one()
+        assert isinstance(count, int)
+        return count
+
     async def get_by_id(self, id: CommentId) -> Comment | None:
-        stmt = sa.select(tables.COMMENT).where(tables.COMMENT.c.id == id)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_BY_ID_STMT, {"comment_id": id})
         row = result.one_or_none()
         if row is None:
             return None
         return self._decode_comment(row)
 
     async def delete(self, id: CommentId) -> CommentId | None:
-        stmt = sa.delete(tables.COMMENT).where(tables.COMMENT.c.id == id).returning(tables.COMMENT.c.id)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_DELETE_STMT, {"comment_id": id})
         comment_id = result.scalar_one_or_none()
         if comment_id is None:
             return None
@@ -64,3 +72,28 @@ class PostgresqlCommentRepository(CommentRepository):
             created_at=db_row.created_at,
             updated_at=db_row.updated_at,
         )
+
+
+def _filter_params(filter: CommentFilter) -> dict[str, t.Any]:
+    # Comment ids start at 1, so `0` means "from the first comment".
+    params: dict[str, t.Any] = {"after": filter.after if filter.after is not None else 0}
+    if filter.article_id is not None:
+        params["article_id"] = filter.article_id
+    return params
+
+
+_AFTER: t.Final = tables.COMMENT.c.id > sa.bindparam("after")
+_FOR_ARTICLE: t.Final = tables.COMMENT.c.article_id == sa.bindparam("article_id")
+
+_INSERT_STMT: t.Final = sa.insert(tables.COMMENT).returning(tables.COMMENT)
+_SELECT_ALL_STMT: t.Final = (
+    sa.select(tables.COMMENT).where(_AFTER).order_by(tables.COMMENT.c.id).limit(sa.bindparam("limit"))
+)
+# Served by the `(article_id, id)` index: the scan starts right after the cursor.
+_SELECT_FOR_ARTICLE_STMT: t.Final = _SELECT_ALL_STMT.where(_FOR_ARTICLE)
+_COUNT_ALL_STMT: t.Final = sa.select(sa.func.count(tables.COMMENT.c.id)).where(_AFTER)
+_COUNT_FOR_ARTICLE_STMT: t.Final = _COUNT_ALL_STMT.where(_FOR_ARTICLE)
+_SELECT_BY_ID_STMT: t.Final = sa.select(tables.COMMENT).where(tables.COMMENT.c.id == sa.bindparam("comment_id"))
+_DELETE_STMT: t.Final = (
+    sa.delete(tables.COMMENT).where(tables.COMMENT.c.id == sa.bindparam("comment_id")).returning(tables.COMMENT.c.id)
+)
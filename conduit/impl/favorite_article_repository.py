@@ -5,11 +5,12 @@ import datetime as dt
 import typing as t
 
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncConnection
+from yarl import URL
 
-from conduit.core.entities.article import ArticleId, FavoriteRepository
-from conduit.core.entities.user import UserId
+from conduit.core.entities.article import Article, ArticleId, ArticleSlug, ArticleWithExtra, FavoriteRepository, Tag
+from conduit.core.entities.user import Email, PasswordHash, User, UserId, Username
 from conduit.db import tables
 
 
@@ -18,55 +19,34 @@ class PostgresqlFavoriteArticleRepository(FavoriteRepository):
         self._connection = connection
         self._now = now
 
-    async def add(self, user_id: UserId, article_id: ArticleId) -> int:
-        insert_stmt = (
-            insert(tables.FAVORITE_ARTICLE)
-            .on_conflict_do_nothing()
-            .values(user_id=user_id, article_id=article_id, created_at=self._now())
+    async def add_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        result = await self._connection.execute(
+            _ADD_BY_SLUG_STMT, {"user_id": user_id, "slug": slug, "created_at": self._now()}
         )
-        await self._connection.execute(insert_stmt)
-        count_stmt = self._count_stmt(article_id)
-        result = await self._connection.execute(count_stmt)
-        count = result.scalar_one()
-        assert isinstance(count, int)
-        return count
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return self._decode_article_with_extra(row, is_article_favorite=True)
 
-    async def remove(self, user_id: UserId, article_id: ArticleId) -> int:
-        delete_stmt = (
-            sa.delete(tables.FAVORITE_ARTICLE)
-            .where(tables.FAVORITE_ARTICLE.c.user_id == user_id)
-            .where(tables.FAVORITE_ARTICLE.c.article_id == article_id)
-        )
-        await self._connection.execute(delete_stmt)
-        count_stmt = self._count_stmt(article_id)
-        result = await self._connection.execute(count_stmt)
-        count = result.scalar_one()
-        assert isinstance(count, int)
-        return count
+    async def remove_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        result = await self._connection.execute(_REMOVE_BY_SLUG_STMT, {"user_id": user_id, "slug": slug})
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return self._decode_article_with_extra(row, is_article_favorite=False)
 
     async def is_favorite(self, article_id: ArticleId, of: UserId) -> bool:
-        stmt = (
-            sa.select(tables.FAVORITE_ARTICLE.c.article_id)
-            .where(tables.FAVORITE_ARTICLE.c.user_id == of)
-            .where(tables.FAVORITE_ARTICLE.c.article_id == article_id)
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_IS_FAVORITE_STMT, {"user_id": of, "article_id": article_id})
         return result.scalar_one_or_none() is not None
 
     async def are_favorite(self, article_ids: t.Collection[ArticleId], of: UserId) -> dict[ArticleId, bool]:
         if not article_ids:
             return {}
-        stmt = (
-            sa.select(tables.FAVORITE_ARTICLE.c.article_id)
-            .where(tables.FAVORITE_ARTICLE.c.user_id == of)
-            .where(tables.FAVORITE_ARTICLE.c.article_id.in_(article_ids))
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_ARE_FAVORITE_STMT, {"user_id": of, "article_ids": list(article_ids)})
         return {article_id: True for article_id in result.scalars()}
 
     async def count(self, article_id: ArticleId) -> int:
-        stmt = self._count_stmt(article_id)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_COUNT_STMT, {"article_id": article_id})
         count = result.scalar_one()
         assert isinstance(count, int)
         return count
@@ -74,18 +54,119 @@ class PostgresqlFavoriteArticleRepository(FavoriteRepository):
     async def count_many(self, article_ids: t.Collection[ArticleId]) -> dict[ArticleId, int]:
         if not article_ids:
             return {}
-        stmt = (
-            sa.select(
-                tables.FAVORITE_ARTICLE.c.article_id,
-                sa.func.count(tables.FAVORITE_ARTICLE.c.user_id).label("count_"),
-            )
-            .where(tables.FAVORITE_ARTICLE.c.article_id.in_(article_ids))
-            .group_by(tables.FAVORITE_ARTICLE.c.article_id)
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_COUNT_MANY_STMT, {"article_ids": list(article_ids)})
         return {row.article_id: row.count_ for row in result.all()}
 
-    def _count_stmt(self, article_id: ArticleId) -> sa.Select[t.Any]:
-        return sa.select(sa.func.count(tables.FAVORITE_ARTICLE.c.user_id)).where(
-            tables.FAVORITE_ARTICLE.c.article_id == article_id
+    def _decode_article_with_extra(self, db_row: t.Any, is_article_favorite: bool) -> ArticleWithExtra:
+        return ArticleWithExtra(
+            v=Article(
+                id=ArticleId(db_row.id),
+                author_id=UserId(db_row.author_id),
+                slug=ArticleSlug(db_row.slug),
+                title=db_row.title,
+                description=db_row.description,
+                body=db_row.body,
+                created_at=db_row.created_at,
+                updated_at=db_row.updated_at,
+            ),
+            author=User(
+                id=UserId(db_row.author_id),
+                username=Username(db_row.author_username),
+                email=Email(db_row.author_email),
+                password=PasswordHash(db_row.author_password_hash),
+                bio=db_row.author_bio,
+                image=URL(db_row.author_image_url) if db_row.author_image_url is not None else None,
+            ),
+            tags=[Tag(tag) for tag in db_row.tags or []],
+            is_author_followed=db_row.is_author_followed,
+            is_article_favorite=is_article_favorite,
+            favorite_of_user_count=db_row.favorite_of_user_count,
         )
+
+
+_TARGET_ARTICLE: t.Final = (
+    sa.select(*tables.ARTICLE_COLUMNS).where(tables.ARTICLE.c.slug == sa.bindparam("slug")).cte("target_article")
+)
+_ADDED: t.Final = (
+    insert(tables.FAVORITE_ARTICLE)
+    .from_select(
+        ["article_id", "user_id", "created_at"],
+        sa.select(
+            _TARGET_ARTICLE.c.id,
+            sa.bindparam("user_id", type_=sa.BigInteger),
+            sa.bindparam("created_at", type_=sa.DateTime),
+        ),
+    )
+    .on_conflict_do_nothing()
+    .returning(tables.FAVORITE_ARTICLE.c.article_id)
+    .cte("added")
+)
+_REMOVED: t.Final = (
+    sa.delete(tables.FAVORITE_ARTICLE)
+    .where(
+        tables.FAVORITE_ARTICLE.c.article_id.in_(sa.select(_TARGET_ARTICLE.c.id)),
+        tables.FAVORITE_ARTICLE.c.user_id == sa.bindparam("user_id"),
+    )
+    .returning(tables.FAVORITE_ARTICLE.c.article_id)
+    .cte("removed")
+)
+
+
+def _article_with_extra_stmt(change: sa.CTE, *, added: bool) -> sa.Select[t.Any]:
+    """Reads the target article back together with everything `ArticleWithExtra` needs.
+
+    The statement sees the snapshot taken before `change` is applied, so the rows `change`
+    affected are added to or subtracted from the favorite count.
+    """
+    article = _TARGET_ARTICLE
+    tags = (
+        sa.select(sa.func.array_agg(aggregate_order_by(tables.TAG.c.tag, tables.TAG.c.tag)))
+        .join_from(tables.ARTICLE_TAG, tables.TAG, tables.ARTICLE_TAG.c.tag_id == tables.TAG.c.id)
+        .where(tables.ARTICLE_TAG.c.article_id == article.c.id)
+        .scalar_subquery()
+    )
+    is_author_followed = sa.exists().where(
+        tables.FOLLOWER.c.follower_id == sa.bindparam("user_id"),
+        tables.FOLLOWER.c.followed_id == article.c.author_id,
+    )
+    count_before = (
+        sa.select(sa.func.count(tables.FAVORITE_ARTICLE.c.user_id))
+        .where(tables.FAVORITE_ARTICLE.c.article_id == article.c.id)
+        .scalar_subquery()
+    )
+    changed = sa.select(sa.func.count()).select_from(change).scalar_subquery()
+    favorite_of_user_count = count_before + changed if added else count_before - changed
+    return sa.select(
+        article,
+        tables.USER.c.username.label("author_username"),
+        tables.USER.c.email.label("author_email"),
+        tables.USER.c.password_hash.label("author_password_hash"),
+        tables.USER.c.bio.label("author_bio"),
+        tables.USER.c.image_url.label("author_image_url"),
+        tags.label("tags"),
+        is_author_followed.label("is_author_followed"),
+        favorite_of_user_count.label("favorite_of_user_count"),
+    ).join_from(article, tables.USER, tables.USER.c.id == article.c.author_id)
+
+
+_ADD_BY_SLUG_STMT: t.Final = _article_with_extra_stmt(_ADDED, added=True)
+_REMOVE_BY_SLUG_STMT: t.Final = _article_with_extra_stmt(_REMOVED, added=False)
+_IS_FAVORITE_STMT: t.Final = sa.select(tables.FAVORITE_ARTICLE.c.article_id).where(
+    tables.FAVORITE_ARTICLE.c.user_id == sa.bindparam("user_id"),
+    tables.FAVORITE_ARTICLE.c.article_id == sa.bindparam("article_id"),
+)
+_ARE_FAVORITE_STMT: t.Final = sa.select(tables.FAVORITE_ARTICLE.c.article_id).where(
+    tables.FAVORITE_ARTICLE.c.user_id == sa.bindparam("user_id"),
+    tables.FAVORITE_ARTICLE.c.article_id.in_(sa.bindparam("article_ids", expanding=True)),
+)
+_COUNT_STMT: t.Final = sa.select(sa.func.count(tables.FAVORITE_ARTICLE.c.user_id)).where(
+    tables.FAVORITE_ARTICLE.c.article_id == sa.bindparam("article_id")
+)
+_COUNT_MANY_STMT: t.Final = (
+    sa.select(
+        tables.FAVORITE_ARTICLE.c.article_id,
+        sa.func.count(tables.FAVORITE_ARTICLE.c.user_id).label("count_"),
+    )
+    .where(tables.FAVORITE_ARTICLE.c.article_id.in_(sa.bindparam("article_ids", expanding=True)))
+    .group_by(tables.FAVORITE_ARTICLE.c.article_id)
+)
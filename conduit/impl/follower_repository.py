@@ -23,33 +23,37 @@ class PostgresqlFollowerRepository(FollowerRepository):
         self._now = now
 
     async def follow(self, *, follower_id: UserId, followed_id: UserId) -> None:
-        stmt = (
-            insert(tables.FOLLOWER)
-            .values(follower_id=follower_id, followed_id=followed_id, created_at=self._now())
-            .on_conflict_do_nothing()
+        await self._connection.execute(
+            _INSERT_STMT,
+            {"follower_id": follower_id, "followed_id": followed_id, "created_at": self._now()},
         )
-        await self._connection.execute(stmt)
 
     async def unfollow(self, *, follower_id: UserId, followed_id: UserId) -> None:
-        stmt = sa.delete(tables.FOLLOWER).where(
-            tables.FOLLOWER.c.follower_id == follower_id, tables.FOLLOWER.c.followed_id == followed_id
-        )
-        await self._connection.execute(stmt)
+        await self._connection.execute(_DELETE_STMT, {"follower_id": follower_id, "followed_id": followed_id})
 
     async def is_followed(self, id: UserId, *, by: UserId) -> bool:
-        stmt = sa.select(tables.FOLLOWER.c.followed_id).where(
-            tables.FOLLOWER.c.follower_id == by, tables.FOLLOWER.c.followed_id == id
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_IS_FOLLOWED_STMT, {"follower_id": by, "followed_id": id})
         followed_id = result.scalar_one_or_none()
         return followed_id is not None
 
     async def are_followed(self, ids: t.Collection[UserId], by: UserId) -> dict[UserId, bool]:
         if not ids:
             return {}
-        stmt = sa.select(tables.FOLLOWER.c.followed_id).where(
-            tables.FOLLOWER.c.follower_id == by, tables.FOLLOWER.c.followed_id.in_(ids)
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_ARE_FOLLOWED_STMT, {"follower_id": by, "followed_ids": list(ids)})
         followed_ids = set(result.scalars())
         return {id: id in followed_ids for id in ids}
+
+
+_INSERT_STMT: t.Final = insert(tables.FOLLOWER).on_conflict_do_nothing()
+_DELETE_STMT: t.Final = sa.delete(tables.FOLLOWER).where(
+    tables.FOLLOWER.c.follower_id == sa.bindparam("follower_id"),
+    tables.FOLLOWER.c.followed_id == sa.bindparam("followed_id"),
+)
+_IS_FOLLOWED_STMT: t.Final = sa.select(tables.FOLLOWER.c.followed_id).where(
+    tables.FOLLOWER.c.follower_id == sa.bindparam("follower_id"),
+    tables.FOLLOWER.c.followed_id == sa.bindparam("followed_id"),
+)
+_ARE_FOLLOWED_STMT: t.Final = sa.select(tables.FOLLOWER.c.followed_id).where(
+    tables.FOLLOWER.c.follower_id == sa.bindparam("follower_id"),
+    tables.FOLLOWER.c.followed_id.in_(sa.bindparam("followed_ids", expanding=True)),
+)
@@ -0,0 +1,197 @@
+__all__ = [
+    "MemoryArticleRepository",
+]
+
+import datetime as dt
+import heapq
+import itertools
+import re
+import typing as t
+from dataclasses import replace
+
+from conduit.core.entities.article import (
+    Article,
+    ArticleFilter,
+    ArticleId,
+    ArticleRepository,
+    ArticleSearchCursor,
+    ArticleSlug,
+    CreateArticleInput,
+    UpdateArticleInput,
+)
+from conduit.core.entities.common import NotSet
+from conduit.impl.article_repository import make_slug
+from conduit.impl.memory.store import Journal, MemoryStore, words
+
+
+class MemoryArticleRepository(ArticleRepository):
+    def __init__(
+        self, store: MemoryStore, journal: Journal, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow
+    ) -> None:
+        self._store = store
+        self._journal = journal
+        self._now = now
+
+    async def create(self, input: CreateArticleInput) -> Article:
+        article = Article(
+            id=ArticleId(self._store.next_id("article")),
+            author_id=input.author_id,
+            slug=make_slug(input.title),
+            title=input.title,
+            description=input.description,
+            body=input.body,
+            created_at=self._now(),
+            updated_at=None,
+        )
+        self._store.add_article(article, self._journal)
+        return article
+
+    async def get_many(self, filter: ArticleFilter, *, limit: int, offset: int) -> list[Article]:
+        articles = self._store.articles
+        candidates = self._candidates(filter)
+        if candidates is None:
+            # Unfiltered listing: walk the ordering index from the newest article.
+            order = self._store.article_order
+            stop = max(len(order) - offset, 0)
+            start = max(stop - limit, 0)
+            return [articles[id] for _, id in reversed(order[start:stop])]
+        newest = heapq.nlargest(offset + limit, ((articles[id].created_at, id) for id in candidates))
+        return [articles[id] for _, id in newest[offset:]]
+
+    async def count(self, filter: ArticleFilter) -> int:
+        candidates = self._candidates(filter)
+        return len(self._store.articles) if candidates is None else len(candidates)
+
+    async def search(
+        self,
+        filter: ArticleFilter,
+        *,
+        limit: int,
+        after: ArticleSearchCursor | None,
+    ) -> list[tuple[Article, float]]:
+        assert filter.query is not None
+        query = _parse_query(filter.query)
+        candidates = self._candidates(filter)
+        ids = self._store.articles.keys() if candidates is None else candidates
+        hits: t.Iterable[tuple[float, ArticleId]] = ((self._rank(id, query), id) for id in ids)
+        if after is not None:
+            hits = (hit for hit in hits if hit < (after.rank, after.id))
+        return [(self._store.articles[id], rank) for rank, id in heapq.nlargest(limit, hits)]
+
+    async def get_by_slug(self, slug: ArticleSlug) -> Article | None:
+        id = self._store.articles_by_slug.get(slug)
+        return self._store.articles[id] if id is not None else None
+
+    async def update(self, id: ArticleId, input: UpdateArticleInput) -> Article | None:
+        article = self._store.articles.get(id)
+        if article is None:
+            return None
+        changes: dict[str, t.Any] = {"updated_at": self._now()}
+        if input.title is not NotSet.NOT_SET:
+            changes.update(title=input.title, slug=make_slug(input.title))
+        if input.description is not NotSet.NOT_SET:
+            changes.update(description=input.description)
+        if input.body is not NotSet.NOT_SET:
+            changes.update(body=input.body)
+        updated = replace(article, **changes)
+        self._store.replace_article(article, updated, self._journal)
+        return updated
+
+    async def delete(self, id: ArticleId) -> ArticleId | None:
+        article = self._store.articles.get(id)
+        if article is None:
+            return None
+        # Tags, favorites and comments go with it, like the cascades in Postgres.
+        self._store.remove_article(article, self._journal)
+        return id
+
+    def _candidates(self, filter: ArticleFilter) -> set[ArticleId] | None:
+        """Ids of the articles matching the filter, `None` when it matches every article."""
+        store = self._store
+        sets: list[t.AbstractSet[ArticleId]] = []
+        if filter.tag is not None:
+            sets.append(store.tag_articles.get(str(filter.tag), set()))
+        if filter.author is not None:
+            author_id = store.users_by_username.get(filter.author)
+            sets.append(store.articles_by_author.get(author_id, set()) if author_id is not None else set())
+        if filter.favorite_of is not None:
+            user_id = store.users_by_username.get(filter.favorite_of)
+            sets.append(store.favorites_by_user.get(user_id, set()) if user_id is not None else set())
+        if filter.feed_of is not None:
+            followed = store.following.get(filter.feed_of, ())
+            sets.append(set().union(*(store.articles_by_author.get(id, ()) for id in followed)))
+        query = None
+        if filter.query is not None:
+            query = _parse_query(filter.query)
+            sets.extend(self._query_candidates(query))
+        if not sets:
+            return None if query is None else set()
+        sets.sort(key=len)
+        candidates = set(sets[0]).intersection(*sets[1:])
+        if query is not None:
+            candidates = {id for id in candidates if _matches(store.article_words[id], query)}
+        return candidates
+
+    def _query_candidates(self, query: "_Query") -> t.Iterator[set[ArticleId]]:
+        """Articles containing the words of each group without negated terms, a superset of the matches."""
+        index = self._store.articles_by_word
+        if not query:
+            yield set()
+        for group in query:
+            if any(term.negated for term in group):
+                continue
+            yield set().union(*(set.intersection(*(index.get(word, set()) for word in term.words)) for term in group))
+
+    def _rank(self, id: ArticleId, query: "_Query") -> float:
+        """Weighted number of occurrences of the query words, a rough equivalent of `ts_rank`."""
+        query_words = {word for group in query for term in group if not term.negated for word in term.words}
+        return sum(
+            weight * sum(1 for word in field_words if word in query_words)
+            for field_words, weight in zip(self._store.article_words[id], _WEIGHTS)
+        )
+
+
+class _Term(t.NamedTuple):
+    words: tuple[str, ...]
+    negated: bool
+
+
+# A query is a conjunction of alternatives, like `websearch_to_tsquery`: `a "b c" or -d`
+# is `a & (b <-> c | !d)`.
+_Query = list[list[_Term]]
+
+_TOKEN_RE: t.Final = re.compile(r'(-?)(?:"([^"]*)"|(\S+))')
+# Weights of `ts_rank` for the title (A), description (B) and body (C).
+_WEIGHTS: t.Final = (1.0, 0.4, 0.2)
+
+
+def _parse_query(query: str) -> _Query:
+    """Parses web search syntax. Words are not stemmed, unlike with the `english` configuration."""
+    groups: _Query = []
+    join_next = False
+    for negated, phrase, word in _TOKEN_RE.findall(query):
+        if not negated and word.lower() == "or" and groups:
+            join_next = True
+            continue
+        term_words = tuple(words(phrase or word))
+        if not term_words:
+            continue
+        term = _Term(term_words, bool(negated))
+        if join_next:
+            groups[-1].append(term)
+        else:
+            groups.append([term])
+        join_next = False
+    return groups
+
+
+def _contains(words: list[str], phrase: tuple[str, ...]) -> bool:
+    size = len(phrase)
+    return any(tuple(words[i : i + size]) == phrase for i in range(len(words) - size + 1))
+
+
+def _matches(article_words: tuple[list[str], list[str], list[str]], query: _Query) -> bool:
+    all_words = list(itertools.chain(*article_words))
+    return bool(query) and all(
+        any(_contains(all_words, term.words) != term.negated for term in group) for group in query
+    )
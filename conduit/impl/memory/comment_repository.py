@@ -0,0 +1,59 @@
+__all__ = [
+    "MemoryCommentRepository",
+]
+
+import bisect
+import datetime as dt
+import heapq
+import typing as t
+
+from conduit.core.entities.comment import Comment, CommentFilter, CommentId, CommentRepository, CreateCommentInput
+from conduit.impl.memory.store import Journal, MemoryStore
+
+
+class MemoryCommentRepository(CommentRepository):
+    def __init__(
+        self, store: MemoryStore, journal: Journal, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow
+    ) -> None:
+        self._store = store
+        self._journal = journal
+        self._now = now
+
+    async def create(self, input: CreateCommentInput) -> Comment:
+        comment = Comment(
+            id=CommentId(self._store.next_id("comment")),
+            author_id=input.author_id,
+            article_id=input.article_id,
+            created_at=self._now(),
+            updated_at=None,
+            body=input.body,
+        )
+        self._store.add_comment(comment, self._journal)
+        return comment
+
+    async def get_many(self, filter: CommentFilter, *, limit: int | None) -> list[Comment]:
+        comments = self._store.comments
+        after = filter.after if filter.after is not None else 0
+        if filter.article_id is None:
+            newer = (id for id in comments if id > after)
+            return [comments[id] for id in (sorted(newer) if limit is None else heapq.nsmallest(limit, newer))]
+        ids = self._store.comments_by_article.get(filter.article_id, [])
+        start = bisect.bisect_right(ids, after)
+        return [comments[id] for id in ids[start : start + limit if limit is not None else None]]
+
+    async def count(self, filter: CommentFilter) -> int:
+        after = filter.after if filter.after is not None else 0
+        if filter.article_id is None:
+            return sum(1 for id in self._store.comments if id > after)
+        ids = self._store.comments_by_article.get(filter.article_id, [])
+        return len(ids) - bisect.bisect_right(ids, after)
+
+    async def get_by_id(self, id: CommentId) -> Comment | None:
+        return self._store.comments.get(id)
+
+    async def delete(self, id: CommentId) -> CommentId | None:
+        comment = self._store.comments.get(id)
+        if comment is None:
+            return None
+        self._store.remove_comment(comment, self._journal)
+        return id
@@ -0,0 +1,64 @@
+__all__ = [
+    "MemoryFavoriteArticleRepository",
+]
+
+import typing as t
+
+from conduit.core.entities.article import (
+    Article,
+    ArticleId,
+    ArticleSlug,
+    ArticleWithExtra,
+    FavoriteRepository,
+    Tag,
+)
+from conduit.core.entities.user import UserId
+from conduit.impl.memory.store import Journal, MemoryStore
+
+
+class MemoryFavoriteArticleRepository(FavoriteRepository):
+    def __init__(self, store: MemoryStore, journal: Journal) -> None:
+        self._store = store
+        self._journal = journal
+
+    async def add_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        article = self._get_by_slug(slug)
+        if article is None:
+            return None
+        self._store.add_favorite(article.id, user_id, self._journal)
+        return self._article_with_extra(article, user_id, is_article_favorite=True)
+
+    async def remove_by_slug(self, user_id: UserId, slug: ArticleSlug) -> ArticleWithExtra | None:
+        article = self._get_by_slug(slug)
+        if article is None:
+            return None
+        self._store.remove_favorite(article.id, user_id, self._journal)
+        return self._article_with_extra(article, user_id, is_article_favorite=False)
+
+    async def is_favorite(self, article_id: ArticleId, of: UserId) -> bool:
+        return article_id in self._store.favorites_by_user.get(of, ())
+
+    async def are_favorite(self, article_ids: t.Collection[ArticleId], of: UserId) -> dict[ArticleId, bool]:
+        favorites = self._store.favorites_by_user.get(of, set())
+        return {article_id: True for article_id in article_ids if article_id in favorites}
+
+    async def count(self, article_id: ArticleId) -> int:
+        return len(self._store.favorites_by_article.get(article_id, ()))
+
+    async def count_many(self, article_ids: t.Collection[ArticleId]) -> dict[ArticleId, int]:
+        favorites = self._store.favorites_by_article
+        return {article_id: len(users) for article_id in article_ids if (users := favorites.get(article_id))}
+
+    def _get_by_slug(self, slug: ArticleSlug) -> Article | None:
+        id = self._store.articles_by_slug.get(slug)
+        return self._store.articles[id] if id is not None else None
+
+    def _article_with_extra(self, article: Article, user_id: UserId, is_article_favorite: bool) -> ArticleWithExtra:
+        return ArticleWithExtra(
+            v=article,
+            author=self._store.users[article.author_id],
+            tags=[Tag(tag) for tag in sorted(self._store.article_tags.get(article.id, ()))],
+            is_author_followed=article.author_id in self._store.following.get(user_id, ()),
+            is_article_favorite=is_article_favorite,
+            favorite_of_user_count=len(self._store.favorites_by_article.get(article.id, ())),
+        )
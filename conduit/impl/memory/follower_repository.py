@@ -0,0 +1,27 @@
+__all__ = [
+    "MemoryFollowerRepository",
+]
+
+import typing as t
+
+from conduit.core.entities.user import FollowerRepository, UserId
+from conduit.impl.memory.store import Journal, MemoryStore
+
+
+class MemoryFollowerRepository(FollowerRepository):
+    def __init__(self, store: MemoryStore, journal: Journal) -> None:
+        self._store = store
+        self._journal = journal
+
+    async def follow(self, *, follower_id: UserId, followed_id: UserId) -> None:
+        self._store.add_follow(follower_id, followed_id, self._journal)
+
+    async def unfollow(self, *, follower_id: UserId, followed_id: UserId) -> None:
+        self._store.remove_follow(follower_id, followed_id, self._journal)
+
+    async def is_followed(self, id: UserId, *, by: UserId) -> bool:
+        return id in self._store.following.get(by, ())
+
+    async def are_followed(self, ids: t.Collection[UserId], by: UserId) -> dict[UserId, bool]:
+        followed = self._store.following.get(by, set())
+        return {id: id in followed for id in ids}
@@ -0,0 +1,227 @@
+__all__ = [
+    "Journal",
+    "MemoryStore",
+    "TagRow",
+    "words",
+]
+
+import bisect
+import datetime as dt
+import itertools
+import re
+import typing as t
+from dataclasses import dataclass
+
+from conduit.core.entities.article import Article, ArticleId, ArticleSlug
+from conduit.core.entities.comment import Comment, CommentId
+from conduit.core.entities.user import Email, User, UserId, Username
+
+# Undo actions of the writes of a unit of work, run in reverse order to roll it back.
+Journal = list[t.Callable[[], None]]
+
+_WORD_RE: t.Final = re.compile(r"\w+")
+
+
+def words(text: str) -> list[str]:
+    """Lowercase words of a text, the way articles and search queries are tokenized."""
+    return _WORD_RE.findall(text.lower())
+
+
+@dataclass
+class TagRow:
+    id: int
+    # Number of articles with the tag, like `tag.article_count`.
+    article_count: int = 0
+
+
+class MemoryStore:
+    """Tables of the in-memory backend and their indexes, shared by all of its units of work.
+
+    Tables are read directly. Writes go through the methods, which keep the indexes in sync
+    and record how to undo them in the journal of the unit of work.
+    """
+
+    def __init__(self) -> None:
+        self.users: dict[UserId, User] = {}
+        self.users_by_username: dict[Username, UserId] = {}
+        self.users_by_email: dict[Email, UserId] = {}
+        # Followed users by follower.
+        self.following: dict[UserId, set[UserId]] = {}
+        self.articles: dict[ArticleId, Article] = {}
+        self.articles_by_slug: dict[ArticleSlug, ArticleId] = {}
+        self.articles_by_author: dict[UserId, set[ArticleId]] = {}
+        # `(created_at, id)` of every article in ascending order, the reverse of the listing order.
+        self.article_order: list[tuple[dt.datetime, ArticleId]] = []
+        # Words of the title, the description and the body of every article.
+        self.article_words: dict[ArticleId, tuple[list[str], list[str], list[str]]] = {}
+        self.articles_by_word: dict[str, set[ArticleId]] = {}
+        self.tags: dict[str, TagRow] = {}
+        # Names of all tags in ascending order.
+        self.tag_names: list[str] = []
+        self.article_tags: dict[ArticleId, set[str]] = {}
+        self.tag_articles: dict[str, set[ArticleId]] = {}
+        self.favorites_by_user: dict[UserId, set[ArticleId]] = {}
+        self.favorites_by_article: dict[ArticleId, set[UserId]] = {}
+        self.comments: dict[CommentId, Comment] = {}
+        # Comment ids of every article in ascending order.
+        self.comments_by_article: dict[ArticleId, list[CommentId]] = {}
+        # Ids start at 1 and are not reused after a rollback, like Postgres sequences.
+        self._sequences = {table: itertools.count(1) for table in ("user", "article", "tag", "comment")}
+
+    def next_id(self, table: str) -> int:
+        return next(self._sequences[table])
+
+    # Users
+
+    def add_user(self, user: User, journal: Journal) -> None:
+        self._insert_user(user)
+        journal.append(lambda: self._delete_user(user))
+
+    def replace_user(self, old: User, new: User, journal: Journal) -> None:
+        self._delete_user(old)
+        self._insert_user(new)
+
+        def undo() -> None:
+            self._delete_user(new)
+            self._insert_user(old)
+
+        journal.append(undo)
+
+    def _insert_user(self, user: User) -> None:
+        self.users[user.id] = user
+        self.users_by_username[user.username] = user.id
+        self.users_by_email[user.email] = user.id
+
+    def _delete_user(self, user: User) -> None:
+        del self.users[user.id]
+        del self.users_by_username[user.username]
+        del self.users_by_email[user.email]
+
+    # Followers
+
+    def add_follow(self, follower_id: UserId, followed_id: UserId, journal: Journal) -> None:
+        followed = self.following.setdefault(follower_id, set())
+        if followed_id not in followed:
+            followed.add(followed_id)
+            journal.append(lambda: followed.discard(followed_id))
+
+    def remove_follow(self, follower_id: UserId, followed_id: UserId, journal: Journal) -> None:
+        followed = self.following.get(follower_id)
+        if followed is not None and followed_id in followed:
+            followed.remove(followed_id)
+            journal.append(lambda: followed.add(followed_id))
+
+    # Articles
+
+    def add_article(self, article: Article, journal: Journal) -> None:
+        self._insert_article(article)
+        journal.append(lambda: self._delete_article(article))
+
+    def replace_article(self, old: Article, new: Article, journal: Journal) -> None:
+        self._delete_article(old)
+        self._insert_article(new)
+
+        def undo() -> None:
+            self._delete_article(new)
+            self._insert_article(old)
+
+        journal.append(undo)
+
+    def remove_article(self, article: Article, journal: Journal) -> None:
+        """Removes the article with its tags, favorites and comments."""
+        for tag in list(self.article_tags.get(article.id, ())):
+            self.unlink_tag(article.id, tag, journal)
+        for user_id in list(self.favorites_by_article.get(article.id, ())):
+            self.remove_favorite(article.id, user_id, journal)
+        for comment_id in list(self.comments_by_article.get(article.id, ())):
+            self.remove_comment(self.comments[comment_id], journal)
+        self._delete_article(article)
+        journal.append(lambda: self._insert_article(article))
+
+    def _insert_article(self, article: Article) -> None:
+        self.articles[article.id] = article
+        self.articles_by_slug[article.slug] = article.id
+        self.articles_by_author.setdefault(article.author_id, set()).add(article.id)
+        bisect.insort(self.article_order, (article.created_at, article.id))
+        article_words = (words(article.title), words(article.description), words(article.body))
+        self.article_words[article.id] = article_words
+        for word in set(itertools.chain(*article_words)):
+            self.articles_by_word.setdefault(word, set()).add(article.id)
+
+    def _delete_article(self, article: Article) -> None:
+        del self.articles[article.id]
+        del self.articles_by_slug[article.slug]
+        self.articles_by_author[article.author_id].discard(article.id)
+        del self.article_order[bisect.bisect_left(self.article_order, (article.created_at, article.id))]
+        for word in set(itertools.chain(*self.article_words.pop(article.id))):
+            self.articles_by_word[word].discard(article.id)
+
+    # Tags
+
+    def add_tag(self, tag: str, journal: Journal) -> TagRow:
+        row = self.tags[tag] = TagRow(self.next_id("tag"))
+        bisect.insort(self.tag_names, tag)
+        journal.append(lambda: self._delete_tag(tag))
+        return row
+
+    def link_tag(self, article_id: ArticleId, tag: str, journal: Journal) -> None:
+        """Tags the article, the tag must exist and must not be linked to the article yet."""
+        self._link_tag(article_id, tag)
+        journal.append(lambda: self._unlink_tag(article_id, tag))
+
+    def unlink_tag(self, article_id: ArticleId, tag: str, journal: Journal) -> None:
+        self._unlink_tag(article_id, tag)
+        journal.append(lambda: self._link_tag(article_id, tag))
+
+    def _delete_tag(self, tag: str) -> None:
+        del self.tags[tag]
+        del self.tag_names[bisect.bisect_left(self.tag_names, tag)]
+
+    def _link_tag(self, article_id: ArticleId, tag: str) -> None:
+        self.article_tags.setdefault(article_id, set()).add(tag)
+        self.tag_articles.setdefault(tag, set()).add(article_id)
+        self.tags[tag].article_count += 1
+
+    def _unlink_tag(self, article_id: ArticleId, tag: str) -> None:
+        self.article_tags[article_id].remove(tag)
+        self.tag_articles[tag].remove(article_id)
+        self.tags[tag].article_count -= 1
+
+    # Favorites
+
+    def add_favorite(self, article_id: ArticleId, user_id: UserId, journal: Journal) -> None:
+        if user_id not in self.favorites_by_article.get(article_id, ()):
+            self._insert_favorite(article_id, user_id)
+            journal.append(lambda: self._delete_favorite(article_id, user_id))
+
+    def remove_favorite(self, article_id: ArticleId, user_id: UserId, journal: Journal) -> None:
+        if user_id in self.favorites_by_article.get(article_id, ()):
+            self._delete_favorite(article_id, user_id)
+            journal.append(lambda: self._insert_favorite(article_id, user_id))
+
+    def _insert_favorite(self, article_id: ArticleId, user_id: UserId) -> None:
+        self.favorites_by_article.setdefault(article_id, set()).add(user_id)
+        self.favorites_by_user.setdefault(user_id, set()).add(article_id)
+
+    def _delete_favorite(self, article_id: ArticleId, user_id: UserId) -> None:
+        self.favorites_by_article[article_id].remove(user_id)
+        self.favorites_by_user[user_id].remove(article_id)
+
+    # Comments
+
+    def add_comment(self, comment: Comment, journal: Journal) -> None:
+        self._insert_comment(comment)
+        journal.append(lambda: self._delete_comment(comment))
+
+    def remove_comment(self, comment: Comment, journal: Journal) -> None:
+        self._delete_comment(comment)
+        journal.append(lambda: self._insert_comment(comment))
+
+    def _insert_comment(self, comment: Comment) -> None:
+        self.comments[comment.id] = comment
+        bisect.insort(self.comments_by_article.setdefault(comment.article_id, []), comment.id)
+
+    def _delete_comment(self, comment: Comment) -> None:
+        del self.comments[comment.id]
+        comment_ids = self.comments_by_article[comment.article_id]
+        del comment_ids[bisect.bisect_left(comment_ids, comment.id)]
@@ -0,0 +1,58 @@
+__all__ = [
+    "MemoryTagRepository",
+]
+
+import bisect
+import heapq
+import typing as t
+
+from conduit.core.entities.article import ArticleId, Tag, TagRepository
+from conduit.impl.memory.store import Journal, MemoryStore
+
+
+class MemoryTagRepository(TagRepository):
+    def __init__(self, store: MemoryStore, journal: Journal) -> None:
+        self._store = store
+        self._journal = journal
+        # Number of tags that did not exist before, like `PostgresqlTagRepository.created_tags`.
+        self.created_tags = 0
+
+    async def create(self, article_id: ArticleId, tags: t.Collection[Tag]) -> None:
+        await self.create_many({article_id: tags})
+
+    async def create_many(self, tags: t.Mapping[ArticleId, t.Collection[Tag]]) -> None:
+        store = self._store
+        for article_id, article_tags in tags.items():
+            for tag in map(str, article_tags):
+                if tag in store.article_tags.get(article_id, ()):
+                    continue
+                if tag not in store.tags:
+                    store.add_tag(tag, self._journal)
+                    self.created_tags += 1
+                store.link_tag(article_id, tag, self._journal)
+
+    async def get_many(self, *, after: Tag | None, limit: int) -> list[Tag]:
+        names = self._store.tag_names
+        start = 0 if after is None else bisect.bisect_right(names, str(after))
+        return [Tag(tag) for tag in names[start : start + limit]]
+
+    async def get_popular(self, *, limit: int) -> list[Tag]:
+        popular = heapq.nlargest(
+            limit,
+            ((row.article_count, row.id, tag) for tag, row in self._store.tags.items() if row.article_count > 0),
+        )
+        return [Tag(tag) for _, _, tag in popular]
+
+    async def count_articles(self) -> int:
+        # The counts are updated as articles are tagged and deleted, nothing is left to fold.
+        return 0
+
+    async def get_for_article(self, article_id: ArticleId) -> list[Tag]:
+        return [Tag(tag) for tag in sorted(self._store.article_tags.get(article_id, ()))]
+
+    async def get_for_articles(self, article_ids: t.Collection[ArticleId]) -> dict[ArticleId, list[Tag]]:
+        return {
+            article_id: [Tag(tag) for tag in sorted(tags)]
+            for article_id in article_ids
+            if (tags := self._store.article_tags.get(article_id))
+        }
@@ -0,0 +1,78 @@
+__all__ = [
+    "MemoryUnitOfWork",
+    "MemoryUnitOfWorkContext",
+]
+
+import typing as t
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.core.use_cases.data_loader import clear_loaders
+from conduit.impl.memory.article_repository import MemoryArticleRepository
+from conduit.impl.memory.comment_repository import MemoryCommentRepository
+from conduit.impl.memory.favorite_article_repository import MemoryFavoriteArticleRepository
+from conduit.impl.memory.follower_repository import MemoryFollowerRepository
+from conduit.impl.memory.store import Journal, MemoryStore
+from conduit.impl.memory.tag_repository import MemoryTagRepository
+from conduit.impl.memory.user_repository import MemoryUserRepository
+from conduit.impl.unit_of_work import PoolStats, record_transaction, statement_timeout
+
+
+@dataclass(frozen=True)
+class MemoryUnitOfWorkContext:
+    users: MemoryUserRepository
+    followers: MemoryFollowerRepository
+    articles: MemoryArticleRepository
+    tags: MemoryTagRepository
+    favorites: MemoryFavoriteArticleRepository
+    comments: MemoryCommentRepository
+
+
+class MemoryUnitOfWork(UnitOfWork):
+    """Unit of work on indexed in-memory tables, to run the application without a database.
+
+    Repository methods do not await, so each of them runs atomically on the event loop.
+    Writes of a unit of work that fails are rolled back, but they are visible to other
+    units of work as soon as they are made: there is no isolation between interleaved ones.
+
+    Args:
+        store: Tables shared by the units of work, a new empty one by default.
+        on_tags_created: Called once a unit of work that has created new tags ends.
+    """
+
+    def __init__(self, store: MemoryStore | None = None, on_tags_created: t.Callable[[], None] | None = None) -> None:
+        self.store = store if store is not None else MemoryStore()
+        self._on_tags_created = on_tags_created
+
+    @asynccontextmanager
+    async def begin(
+        self, *, read_only: bool = False, autocommit: bool = False
+    ) -> t.AsyncIterator[MemoryUnitOfWorkContext]:
+        assert read_only or not autocommit, "only reads can run outside of a transaction"
+        # Nothing to cancel, but a unit of work must not start past the deadline.
+        statement_timeout()
+        if not autocommit:
+            record_transaction()
+        journal: Journal = []
+        context = MemoryUnitOfWorkContext(
+            users=MemoryUserRepository(self.store, journal),
+            followers=MemoryFollowerRepository(self.store, journal),
+            articles=MemoryArticleRepository(self.store, journal),
+            tags=MemoryTagRepository(self.store, journal),
+            favorites=MemoryFavoriteArticleRepository(self.store, journal),
+            comments=MemoryCommentRepository(self.store, journal),
+        )
+        try:
+            yield context
+        except BaseException:
+            for undo in reversed(journal):
+                undo()
+            raise
+        if context.tags.created_tags and self._on_tags_created is not None:
+            self._on_tags_created()
+        if not read_only:
+            clear_loaders()
+
+    def pool_stats(self) -> list[PoolStats]:
+        return []
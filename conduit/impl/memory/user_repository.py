@@ -0,0 +1,73 @@
+__all__ = [
+    "MemoryUserRepository",
+]
+
+import typing as t
+from dataclasses import replace
+
+from conduit.core.entities.common import NotSet
+from conduit.core.entities.errors import EmailAlreadyExistsError, UsernameAlreadyExistsError
+from conduit.core.entities.user import (
+    CreateUserInput,
+    Email,
+    UpdateUserInput,
+    User,
+    UserId,
+    Username,
+    UserRepository,
+)
+from conduit.impl.memory.store import Journal, MemoryStore
+
+
+class MemoryUserRepository(UserRepository):
+    def __init__(self, store: MemoryStore, journal: Journal) -> None:
+        self._store = store
+        self._journal = journal
+
+    async def create(self, input: CreateUserInput) -> User:
+        self._check_unique(input.username, input.email)
+        user = User(
+            id=UserId(self._store.next_id("user")),
+            username=input.username,
+            email=input.email,
+            password=input.password,
+            bio="",
+            image=None,
+        )
+        self._store.add_user(user, self._journal)
+        return user
+
+    async def get_by_email(self, email: Email) -> User | None:
+        id = self._store.users_by_email.get(email)
+        return self._store.users[id] if id is not None else None
+
+    async def get_by_id(self, id: UserId) -> User | None:
+        return self._store.users.get(id)
+
+    async def get_by_ids(self, ids: t.Collection[UserId]) -> dict[UserId, User]:
+        users = self._store.users
+        return {id: users[id] for id in ids if id in users}
+
+    async def get_by_username(self, username: Username) -> User | None:
+        id = self._store.users_by_username.get(username)
+        return self._store.users[id] if id is not None else None
+
+    async def update(self, id: UserId, input: UpdateUserInput) -> User | None:
+        user = self._store.users.get(id)
+        if user is None:
+            return None
+        changes: dict[str, t.Any] = {
+            name: value
+            for name in ("username", "email", "password", "bio", "image")
+            if (value := getattr(input, name)) is not NotSet.NOT_SET
+        }
+        updated = replace(user, **changes)
+        self._check_unique(updated.username, updated.email, id=id)
+        self._store.replace_user(user, updated, self._journal)
+        return updated
+
+    def _check_unique(self, username: Username, email: Email, id: UserId | None = None) -> None:
+        if self._store.users_by_username.get(username, id) != id:
+            raise UsernameAlreadyExistsError()
+        if self._store.users_by_email.get(email, id) != id:
+            raise EmailAlreadyExistsError()
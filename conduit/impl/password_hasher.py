@@ -3,6 +3,7 @@ __all__ = [
 ]
 
 import asyncio
+import typing as t
 
 import argon2
 import structlog
@@ -11,10 +12,15 @@ from conduit.core.entities.user import PasswordHash, PasswordHasher, RawPassword
 
 LOG = structlog.getLogger(__name__)
 
+T = t.TypeVar("T")
+
 
 class Argon2idPasswordHasher(PasswordHasher):
     """Argon2id password hashing.
 
+    Hashing runs in the default executor, `pending` counts the hashes and verifications
+    submitted to it and not finished yet.
+
     See Also:
         https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html
     """
@@ -26,17 +32,24 @@ class Argon2idPasswordHasher(PasswordHasher):
         parallelism: int = 1,
     ) -> None:
         self._hasher = argon2.PasswordHasher(memory_cost=memory_cost, time_cost=time_cost, parallelism=parallelism)
+        self.pending = 0
 
     async def hash_password(self, password: RawPassword) -> PasswordHash:
-        loop = asyncio.get_running_loop()
-        hash = await loop.run_in_executor(None, self._hasher.hash, password)
+        hash = await self._run(self._hasher.hash, password)
         return PasswordHash(hash)
 
     async def verify(self, password: RawPassword, hash: PasswordHash) -> bool:
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self._hasher.verify, hash, password)
+            await self._run(self._hasher.verify, hash, password)
         except argon2.exceptions.VerificationError as err:
             LOG.info("invalid password", error=err)
             return False
         return True
+
+    async def _run(self, function: t.Callable[..., T], *args: t.Any) -> T:
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            return await loop.run_in_executor(None, function, *args)
+        finally:
+            self.pending -= 1
@@ -0,0 +1,55 @@
+__all__ = [
+    "ReadYourWrites",
+]
+
+import time
+import typing as t
+from collections import OrderedDict
+
+from conduit.core.entities.user import UserId
+from conduit.core.use_cases.auth import AUTHENTICATED_USER_ID_VAR
+
+
+class ReadYourWrites:
+    """Keeps reads of a user on the primary for a while after that user's own write.
+
+    A replica lags behind the primary, so without this a user could not see the article
+    they have just published. The state is kept per process: with several workers behind
+    a load balancer the guarantee only holds for requests landing on the same worker.
+
+    Args:
+        window: For how many seconds after a write the user's reads go to the primary.
+            `0` disables stickiness.
+        clock: Monotonic clock, in seconds.
+    """
+
+    def __init__(self, window: float, clock: t.Callable[[], float] = time.monotonic) -> None:
+        self._window = window
+        self._clock = clock
+        # Ordered by deadline, as every write moves its user to the end.
+        self._deadlines: OrderedDict[UserId, float] = OrderedDict()
+
+    def record_write(self) -> None:
+        """Remembers that the current user has just written something."""
+        user_id = AUTHENTICATED_USER_ID_VAR.get()
+        if self._window <= 0 or user_id is None:
+            return
+        now = self._clock()
+        self._deadlines[user_id] = now + self._window
+        self._deadlines.move_to_end(user_id)
+        self._evict_expired(now)
+
+    def must_read_from_primary(self) -> bool:
+        """Whether reads of the current user must be served by the primary."""
+        user_id = AUTHENTICATED_USER_ID_VAR.get()
+        if user_id is None:
+            return False
+        deadline = self._deadlines.get(user_id)
+        return deadline is not None and deadline > self._clock()
+
+    def _evict_expired(self, now: float) -> None:
+        while self._deadlines:
+            user_id, deadline = next(iter(self._deadlines.items()))
+            if deadline > now:
+                break
+            del self._deadlines[user_id]
@@ -6,7 +6,7 @@ import datetime as dt
 import typing as t
 
 import sqlalchemy as sa
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from conduit.core.entities.article import ArticleId, Tag, TagRepository
@@ -17,50 +17,53 @@ class PostgresqlTagRepository(TagRepository):
     def __init__(self, connection: AsyncConnection, now: t.Callable[[], dt.datetime] = dt.datetime.utcnow) -> None:
         self._connection = connection
         self._now = now
+        # Number of tags that did not exist before, committed along with the transaction.
+        self.created_tags = 0
 
     async def create(self, article_id: ArticleId, tags: t.Collection[Tag]) -> None:
-        if not tags:
+        await self.create_many({article_id: tags})
+
+    async def create_many(self, tags: t.Mapping[ArticleId, t.Collection[Tag]]) -> None:
+        article_ids = [article_id for article_id, article_tags in tags.items() for _ in article_tags]
+        if not article_ids:
             return None
-        now = self._now()
-        stmt = (
-            insert(tables.TAG).on_conflict_do_nothing().values([{"created_at": now, "tag": str(tag)} for tag in tags])
-        )
-        await self._connection.execute(stmt)
-        select_tags_stmt = sa.select(tables.TAG.c.id).where(tables.TAG.c.tag.in_(map(str, tags)))
-        result = await self._connection.execute(select_tags_stmt)
-        tag_ids = result.scalars()
-        stmt = (
-            insert(tables.ARTICLE_TAG)
-            .on_conflict_do_nothing()
-            .values([{"article_id": article_id, "tag_id": tag_id, "created_at": now} for tag_id in tag_ids])
-        )
-        await self._connection.execute(stmt)
+        params = {
+            "article_ids": article_ids,
+            "tags": [str(tag) for article_tags in tags.values() for tag in article_tags],
+            "created_at": self._now(),
+        }
+        result = (await self._connection.execute(_TAG_ARTICLES_STMT, params)).one()
+        if result.missing:
+            # Tags committed concurrently after the statement started are not visible to it,
+            # they are to the same statement run again.
+            result = (await self._connection.execute(_TAG_ARTICLES_STMT, params)).one()
+            assert not result.missing
+        self.created_tags += result.created
+
+    async def get_many(self, *, after: Tag | None, limit: int) -> list[Tag]:
+        # Every tag sorts after the empty string.
+        after_tag = "" if after is None else str(after)
+        result = await self._connection.execute(_SELECT_MANY_STMT, {"after": after_tag, "limit": limit})
+        rows = result.all()
+        return [Tag(row.tag) for row in rows]
 
-    async def get_all(self) -> list[Tag]:
-        stmt = sa.select(tables.TAG).order_by(tables.TAG.c.id)
-        result = await self._connection.execute(stmt)
+    async def get_popular(self, *, limit: int) -> list[Tag]:
+        result = await self._connection.execute(_SELECT_POPULAR_STMT, {"limit": limit})
         rows = result.all()
         return [Tag(row.tag) for row in rows]
 
+    async def count_articles(self) -> int:
+        result = await self._connection.execute(_COUNT_ARTICLES_STMT)
+        count: int = result.scalar_one()
+        return count
+
     async def get_for_article(self, article_id: ArticleId) -> list[Tag]:
-        stmt = (
-            sa.select(tables.TAG)
-            .join_from(tables.TAG, tables.ARTICLE_TAG, onclause=tables.TAG.c.id == tables.ARTICLE_TAG.c.tag_id)
-            .where(tables.ARTICLE_TAG.c.article_id == article_id)
-            .order_by(tables.TAG.c.tag)
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_FOR_ARTICLE_STMT, {"article_id": article_id})
         rows = result.all()
         return [Tag(row.tag) for row in rows]
 
     async def get_for_articles(self, article_ids: t.Collection[ArticleId]) -> dict[ArticleId, list[Tag]]:
-        stmt = (
-            sa.select(tables.TAG, tables.ARTICLE_TAG.c.article_id)
-            .join_from(tables.TAG, tables.ARTICLE_TAG, onclause=tables.TAG.c.id == tables.ARTICLE_TAG.c.tag_id)
-            .where(tables.ARTICLE_TAG.c.article_id.in_(article_ids))
-            .order_by(tables.TAG.c.tag)
-        )
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_FOR_ARTICLES_STMT, {"article_ids": list(article_ids)})
         rows = result.all()
         tags: dict[ArticleId, list[Tag]] = {}
         for row in rows:
@@ -69,3 +72,112 @@ class PostgresqlTagRepository(TagRepository):
             tags.setdefault(article_id, [])
             tags[article_id].append(tag)
         return tags
+
+
+_ARTICLE_TAG_PAIRS: t.Final = (
+    sa.func.unnest(
+        sa.bindparam("article_ids", type_=ARRAY(sa.BigInteger)),
+        sa.bindparam("tags", type_=ARRAY(sa.Text)),
+    )
+    .table_valued("article_id", "tag")
+    .render_derived(with_types=False)
+    .alias("pairs")
+)
+_PAIRS: t.Final = sa.select(_ARTICLE_TAG_PAIRS.c.article_id, _ARTICLE_TAG_PAIRS.c.tag).distinct().cte("pair")
+# Tags are looked up before they are inserted, and inserted with `DO NOTHING`: unlike `DO UPDATE`
+# it does not lock the existing row, which every article with a popular tag would wait for. The
+# count of tags in neither returns the ones that `DO NOTHING` skipped.
+_EXISTING_TAGS: t.Final = (
+    sa.select(tables.TAG.c.id, tables.TAG.c.tag)
+    .where(tables.TAG.c.tag == sa.any_(sa.bindparam("tags", type_=ARRAY(sa.Text))))
+    .cte("existing_tag")
+)
+_INSERTED_TAGS: t.Final = (
+    insert(tables.TAG)
+    .from_select(
+        ["tag", "created_at"],
+        sa.select(_PAIRS.c.tag, sa.bindparam("created_at", type_=sa.DateTime))
+        .distinct()
+        .where(_PAIRS.c.tag.not_in(sa.select(_EXISTING_TAGS.c.tag))),
+    )
+    .on_conflict_do_nothing(index_elements=[tables.TAG.c.tag])
+    .returning(tables.TAG.c.id, tables.TAG.c.tag)
+    .cte("inserted_tag")
+)
+_FOUND_TAGS: t.Final = sa.union_all(
+    sa.select(_EXISTING_TAGS.c.id, _EXISTING_TAGS.c.tag),
+    sa.select(_INSERTED_TAGS.c.id, _INSERTED_TAGS.c.tag),
+).cte("found_tag")
+# Only the pairs inserted here count towards the articles of a tag.
+_LINK_TAGS: t.Final = (
+    insert(tables.ARTICLE_TAG)
+    .from_select(
+        ["article_id", "tag_id", "created_at"],
+        sa.select(
+            _PAIRS.c.article_id,
+            _FOUND_TAGS.c.id,
+            sa.bindparam("created_at", type_=sa.DateTime),
+        ).join_from(_PAIRS, _FOUND_TAGS, _PAIRS.c.tag == _FOUND_TAGS.c.tag),
+    )
+    .on_conflict_do_nothing()
+    .returning(tables.ARTICLE_TAG.c.tag_id)
+    .cte("linked")
+)
+_COUNT_LINKS: t.Final = (
+    sa.insert(tables.TAG_ARTICLE_COUNT_DELTA)
+    .from_select(
+        ["tag_id", "delta"],
+        sa.select(_LINK_TAGS.c.tag_id, sa.func.count()).group_by(_LINK_TAGS.c.tag_id),
+    )
+    .cte("counted")
+)
+# Postgres runs a data-modifying CTE even if nothing refers to it.
+_TAG_ARTICLES_STMT: t.Final = sa.select(
+    sa.select(sa.func.count()).select_from(_INSERTED_TAGS).scalar_subquery().label("created"),
+    (
+        sa.select(sa.func.count(_PAIRS.c.tag.distinct())).scalar_subquery()
+        - sa.select(sa.func.count()).select_from(_FOUND_TAGS).scalar_subquery()
+    ).label("missing"),
+).add_cte(_COUNT_LINKS)
+# Folded deltas are deleted in the same statement: concurrent folds skip the rows deleted by each other.
+_FOLDED: t.Final = (
+    sa.delete(tables.TAG_ARTICLE_COUNT_DELTA)
+    .returning(tables.TAG_ARTICLE_COUNT_DELTA.c.tag_id, tables.TAG_ARTICLE_COUNT_DELTA.c.delta)
+    .cte("folded")
+)
+_SUMMED: t.Final = (
+    sa.select(_FOLDED.c.tag_id, sa.func.sum(_FOLDED.c.delta).label("delta")).group_by(_FOLDED.c.tag_id).cte("summed")
+)
+_COUNTED: t.Final = (
+    sa.update(tables.TAG)
+    .where(tables.TAG.c.id == _SUMMED.c.tag_id)
+    .values(article_count=tables.TAG.c.article_count + _SUMMED.c.delta)
+    .returning(tables.TAG.c.id)
+    .cte("counted")
+)
+_COUNT_ARTICLES_STMT: t.Final = sa.select(sa.func.count()).select_from(_COUNTED)
+_SELECT_MANY_STMT: t.Final = (
+    sa.select(tables.TAG.c.tag)
+    .where(tables.TAG.c.tag > sa.bindparam("after", type_=sa.Text))
+    .order_by(tables.TAG.c.tag)
+    .limit(sa.bindparam("limit"))
+)
+# Tags of deleted articles stay around, without articles they are not popular.
+_SELECT_POPULAR_STMT: t.Final = (
+    sa.select(tables.TAG.c.tag)
+    .where(tables.TAG.c.article_count > 0)
+    .order_by(tables.TAG.c.article_count.desc(), tables.TAG.c.id.desc())
+    .limit(sa.bindparam("limit"))
+)
+_SELECT_FOR_ARTICLE_STMT: t.Final = (
+    sa.select(tables.TAG)
+    .join_from(tables.TAG, tables.ARTICLE_TAG, onclause=tables.TAG.c.id == tables.ARTICLE_TAG.c.tag_id)
+    .where(tables.ARTICLE_TAG.c.article_id == sa.bindparam("article_id"))
+    .order_by(tables.TAG.c.tag)
+)
+_SELECT_FOR_ARTICLES_STMT: t.Final = (
+    sa.select(tables.TAG, tables.ARTICLE_TAG.c.article_id)
+    .join_from(tables.TAG, tables.ARTICLE_TAG, onclause=tables.TAG.c.id == tables.ARTICLE_TAG.c.tag_id)
+    .where(tables.ARTICLE_TAG.c.article_id.in_(sa.bindparam("article_ids", expanding=True)))
+    .order_by(tables.TAG.c.tag)
+)
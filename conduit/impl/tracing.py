@@ -0,0 +1,60 @@
+__all__ = [
+    "TracedUnitOfWork",
+]
+
+import typing as t
+from contextlib import asynccontextmanager
+
+from conduit.core.entities.unit_of_work import UnitOfWork, UnitOfWorkContext
+from conduit.tracing import Tracer
+
+
+class TracedUnitOfWork(UnitOfWork):
+    """Traces every unit of work, and every repository call inside it.
+
+    Other attributes, like `pool_stats`, are the ones of the wrapped unit of work.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWork, tracer: Tracer) -> None:
+        self._unit_of_work = unit_of_work
+        self._tracer = tracer
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._unit_of_work, name)
+
+    @asynccontextmanager
+    async def begin(self, *, read_only: bool = False, autocommit: bool = False) -> t.AsyncIterator[UnitOfWorkContext]:
+        with self._tracer.span("unit_of_work", read_only=read_only, autocommit=autocommit):
+            async with self._unit_of_work.begin(read_only=read_only, autocommit=autocommit) as uow:
+                yield t.cast(UnitOfWorkContext, _TracedContext(uow, self._tracer))
+
+
+class _TracedContext:
+    def __init__(self, context: UnitOfWorkContext, tracer: Tracer) -> None:
+        self._context = context
+        self._tracer = tracer
+
+    def __getattr__(self, name: str) -> "_TracedRepository":
+        repository = _TracedRepository(getattr(self._context, name), self._tracer, name)
+        # Wrapped once per unit of work.
+        setattr(self, name, repository)
+        return repository
+
+
+class _TracedRepository:
+    def __init__(self, repository: t.Any, tracer: Tracer, name: str) -> None:
+        self._repository = repository
+        self._tracer = tracer
+        self._name = name
+
+    def __getattr__(self, name: str) -> t.Any:
+        method = getattr(self._repository, name)
+        if not callable(method):
+            return method
+        span_name = f"{self._name}.{name}"
+
+        async def traced(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            with self._tracer.span(span_name):
+                return await method(*args, **kwargs)
+
+        return traced
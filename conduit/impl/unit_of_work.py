@@ -1,16 +1,155 @@
+import asyncio
+import math
+import time
 import typing as t
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
-from sqlalchemy.ext.asyncio import AsyncEngine
+import asyncpg
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
-from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.core.entities.errors import DeadlineExceededError
+from conduit.core.entities.unit_of_work import DEADLINE_VAR, QUERY_STATS_VAR, UnitOfWork, remaining_time
+from conduit.core.use_cases.data_loader import clear_loaders
 from conduit.impl.article_repository import PostgresqlArticleRepository
 from conduit.impl.comment_repository import PostgresqlCommentRepository
 from conduit.impl.favorite_article_repository import PostgresqlFavoriteArticleRepository
 from conduit.impl.follower_repository import PostgresqlFollowerRepository
+from conduit.impl.read_your_writes import ReadYourWrites
 from conduit.impl.tag_repository import PostgresqlTagRepository
 from conduit.impl.user_repository import PostgresqlUserRepository
+from conduit.slow_queries import Explain, SlowQueryLog
+from conduit.tracing import record_span
+
+# SQLSTATE of a statement cancelled by `statement_timeout`.
+QUERY_CANCELED: t.Final = "57014"
+
+
+class PoolStats(t.NamedTuple):
+    """Connections of a pool.
+
+    Attributes:
+        pool: `primary` or `replica`.
+        in_use: Connections lent to units of work.
+        idle: Open connections waiting in the pool.
+    """
+
+    pool: str
+    in_use: int
+    idle: int
+
+
+def statement_timeout() -> str | None:
+    """`statement_timeout` matching the time left until the deadline of the current request.
+
+    Returns:
+        Timeout in milliseconds, `None` if the request has no deadline.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return None
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    # `0` would disable the timeout.
+    return str(max(math.ceil(remaining * 1000), 1))
+
+
+def add_statement_timeout(query: str) -> str:
+    """Appends `SET LOCAL statement_timeout` for the time left until the deadline to a `BEGIN`.
+
+    asyncpg runs a query without arguments as a simple query, which may hold several statements, so setting the
+    timeout costs no round trip of its own. Other queries, and all queries outside of a request with a deadline,
+    are returned as they are.
+    """
+    if DEADLINE_VAR.get() is None or not query.startswith("BEGIN"):
+        return query
+    try:
+        timeout = statement_timeout()
+    except DeadlineExceededError:
+        # Cancels the first statement of the transaction.
+        timeout = "1"
+    return f"{query.rstrip().rstrip(';')}; SET LOCAL statement_timeout = {timeout}"
+
+
+class DeadlineConnection(asyncpg.Connection):  # type: ignore[misc]
+    """asyncpg connection of SQLAlchemy engines, setting `statement_timeout` when a transaction begins."""
+
+    async def execute(self, query: str, *args: t.Any, timeout: float | None = None) -> str:
+        if not args:
+            query = add_statement_timeout(query)
+        status: str = await super().execute(query, *args, timeout=timeout)
+        return status
+
+
+def record_pool_wait(started: float) -> None:
+    """Accounts the wait for a connection that started at `time.perf_counter()` `started`."""
+    stats = QUERY_STATS_VAR.get()
+    if stats is not None:
+        stats.pool_wait += time.perf_counter() - started
+
+
+def record_transaction(control_statements: int = 0) -> None:
+    stats = QUERY_STATS_VAR.get()
+    if stats is not None:
+        stats.transactions += 1
+        stats.statements += control_statements
+
+
+def instrument(engine: AsyncEngine, slow_queries: SlowQueryLog | None = None) -> None:
+    """Accounts the statements run by `engine` in `QUERY_STATS_VAR`, and traces them.
+
+    Args:
+        engine: Instrumented engine.
+        slow_queries: Where statements slower than its threshold are recorded, with their plans
+            captured on another connection of `engine`.
+    """
+    sync_engine = engine.sync_engine
+    if sa.event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    sa.event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    sa.event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    if slow_queries is None:
+        return
+    explain = _explainer(engine)
+
+    def record_slow_statement(
+        connection: sa.Connection, cursor: t.Any, statement: str, parameters: t.Any, context: t.Any, executemany: bool
+    ) -> None:
+        duration = time.perf_counter() - connection.info["statement_started"]
+        if duration >= slow_queries.threshold:
+            # The plan of the first set of parameters stands for the others of an `executemany`.
+            slow_queries.record(statement, parameters[0] if executemany else parameters, duration, explain)
+
+    sa.event.listen(sync_engine, "after_cursor_execute", record_slow_statement)
+
+
+def _explainer(engine: AsyncEngine) -> Explain:
+    async def explain(statement: str, parameters: t.Sequence[t.Any]) -> t.Any:
+        async with engine.connect() as connection:
+            return (await connection.exec_driver_sql(statement, tuple(parameters))).scalar_one()
+
+    return explain
+
+
+def _before_cursor_execute(connection: sa.Connection, *_: t.Any) -> None:
+    connection.info["statement_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(connection: sa.Connection, cursor: t.Any, statement: str, *_: t.Any) -> None:
+    duration = time.perf_counter() - connection.info["statement_started"]
+    record_span("sql", duration, statement=statement)
+    stats = QUERY_STATS_VAR.get()
+    if stats is None:
+        return
+    stats.statements += 1
+    stats.duration += duration
+    # Rows returned or affected, `-1` when the driver does not know.
+    stats.rows += max(cursor.rowcount, 0)
 
 
 @dataclass(frozen=True)
@@ -24,17 +163,118 @@ class PostgresqlUnitOfWorkContext:
 
 
 class PostgresqlUnitOfWork(UnitOfWork):
-    def __init__(self, engine: AsyncEngine) -> None:
+    """Unit of work on a SQLAlchemy engine.
+
+    Args:
+        engine: Engine of the primary database.
+        replica_engine: Engine of a read replica serving read-only units of work. Without it
+            everything goes to the primary.
+        read_your_writes: Sends reads of a user who has just written something to the primary.
+        on_tags_created: Called once a unit of work that has created new tags is committed.
+        slow_queries: Records the slow statements.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        replica_engine: AsyncEngine | None = None,
+        read_your_writes: ReadYourWrites | None = None,
+        on_tags_created: t.Callable[[], None] | None = None,
+        slow_queries: SlowQueryLog | None = None,
+    ) -> None:
         self._engine = engine
+        self._replica_engine = (
+            replica_engine.execution_options(postgresql_readonly=True) if replica_engine is not None else None
+        )
+        # Share the pools of the engines above, connections switch to autocommit on checkout.
+        self._autocommit_engines = {
+            engine: engine.execution_options(isolation_level="AUTOCOMMIT")
+            for engine in (self._engine, self._replica_engine)
+            if engine is not None
+        }
+        self._read_your_writes = read_your_writes if read_your_writes is not None else ReadYourWrites(window=0)
+        self._on_tags_created = on_tags_created
+        for instrumented_engine in self._autocommit_engines:
+            instrument(instrumented_engine, slow_queries)
+            if not sa.event.contains(instrumented_engine.sync_engine, "do_connect", _use_deadline_connection):
+                sa.event.listen(instrumented_engine.sync_engine, "do_connect", _use_deadline_connection)
 
     @asynccontextmanager
-    async def begin(self) -> t.AsyncIterator[PostgresqlUnitOfWorkContext]:
-        async with self._engine.begin() as connection:
-            yield PostgresqlUnitOfWorkContext(
-                users=PostgresqlUserRepository(connection),
-                followers=PostgresqlFollowerRepository(connection),
-                articles=PostgresqlArticleRepository(connection),
-                tags=PostgresqlTagRepository(connection),
-                favorites=PostgresqlFavoriteArticleRepository(connection),
-                comments=PostgresqlCommentRepository(connection),
-            )
+    async def begin(
+        self, *, read_only: bool = False, autocommit: bool = False
+    ) -> t.AsyncIterator[PostgresqlUnitOfWorkContext]:
+        assert read_only or not autocommit, "only reads can run outside of a transaction"
+        statement_timeout()
+        engine = self._choose_engine(read_only)
+        try:
+            if autocommit:
+                # Without a transaction there is no `SET LOCAL`, the deadline is enforced by
+                # cancelling the task, which makes asyncpg cancel the running statement.
+                deadline = asyncio.timeout(remaining_time())
+                try:
+                    async with deadline, _connect(self._autocommit_engines[engine]) as connection:
+                        yield self._context(connection)
+                except TimeoutError as error:
+                    if deadline.expired():
+                        raise DeadlineExceededError() from error
+                    raise
+            else:
+                # `BEGIN` sets the remaining budget as `statement_timeout`, see `DeadlineConnection`.
+                async with _connect(engine) as connection, connection.begin():
+                    # `BEGIN` and `COMMIT` are not cursor executions, they are accounted here.
+                    record_transaction(control_statements=2)
+                    context = self._context(connection)
+                    yield context
+                if context.tags.created_tags and self._on_tags_created is not None:
+                    self._on_tags_created()
+        except DBAPIError as error:
+            if getattr(error.orig, "sqlstate", None) == QUERY_CANCELED and DEADLINE_VAR.get() is not None:
+                raise DeadlineExceededError() from error
+            raise
+        if not read_only:
+            self._read_your_writes.record_write()
+            clear_loaders()
+
+    def pool_stats(self) -> list[PoolStats]:
+        stats = []
+        for name, engine in (("primary", self._engine), ("replica", self._replica_engine)):
+            pool = engine.sync_engine.pool if engine is not None else None
+            if isinstance(pool, sa.QueuePool):
+                stats.append(PoolStats(name, pool.checkedout(), pool.checkedin()))
+        return stats
+
+    def _context(self, connection: AsyncConnection) -> PostgresqlUnitOfWorkContext:
+        return PostgresqlUnitOfWorkContext(
+            users=PostgresqlUserRepository(connection),
+            followers=PostgresqlFollowerRepository(connection),
+            articles=PostgresqlArticleRepository(connection),
+            tags=PostgresqlTagRepository(connection),
+            favorites=PostgresqlFavoriteArticleRepository(connection),
+            comments=PostgresqlCommentRepository(connection),
+        )
+
+    def _choose_engine(self, read_only: bool) -> AsyncEngine:
+        if read_only and self._replica_engine is not None and not self._read_your_writes.must_read_from_primary():
+            return self._replica_engine
+        return self._engine
+
+
+@asynccontextmanager
+async def _connect(engine: AsyncEngine) -> t.AsyncIterator[AsyncConnection]:
+    """Connection of `engine`, waiting for the pool until the deadline of the current request at most."""
+    started = time.perf_counter()
+    connection = engine.connect()
+    try:
+        async with asyncio.timeout(remaining_time()):
+            await connection.start()
+    except TimeoutError as error:
+        raise DeadlineExceededError() from error
+    try:
+        record_pool_wait(started)
+        yield connection
+    finally:
+        await connection.close()
+
+
+def _use_deadline_connection(dialect: t.Any, record: t.Any, args: t.Any, params: dict[str, t.Any]) -> None:
+    params.setdefault("connection_class", DeadlineConnection)
@@ -39,51 +39,45 @@ class PostgresqlUserRepository(UserRepository):
         self._now = now
 
     async def create(self, input: CreateUserInput) -> User:
-        stmt = (
-            sa.insert(tables.USER)
-            .values(
-                username=input.username,
-                email=input.email,
-                password_hash=input.password,
-                bio="",
-                created_at=self._now(),
-            )
-            .returning(tables.USER)
-        )
         try:
-            result = await self._connection.execute(stmt)
+            result = await self._connection.execute(
+                _INSERT_STMT,
+                {
+                    "username": input.username,
+                    "email": input.email,
+                    "password_hash": input.password,
+                    "bio": "",
+                    "created_at": self._now(),
+                },
+            )
         except IntegrityError as e:
             self._handle_integrity_error(e)
         row = result.one()
         return self._decode_user(row)
 
     async def get_by_email(self, email: Email) -> User | None:
-        stmt = sa.select(tables.USER).where(tables.USER.c.email == email)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_BY_EMAIL_STMT, {"email": email})
         row = result.one_or_none()
         if row is None:
             return None
         return self._decode_user(row)
 
     async def get_by_username(self, username: Username) -> User | None:
-        stmt = sa.select(tables.USER).where(tables.USER.c.username == username)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_BY_USERNAME_STMT, {"username": username})
         row = result.one_or_none()
         if row is None:
             return None
         return self._decode_user(row)
 
     async def get_by_id(self, id: UserId) -> User | None:
-        stmt = sa.select(tables.USER).where(tables.USER.c.id == id)
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_BY_ID_STMT, {"user_id": id})
         row = result.one_or_none()
         if row is None:
             return None
         return self._decode_user(row)
 
     async def get_by_ids(self, ids: t.Collection[UserId]) -> dict[UserId, User]:
-        stmt = sa.select(tables.USER).where(tables.USER.c.id.in_(ids))
-        result = await self._connection.execute(stmt)
+        result = await self._connection.execute(_SELECT_BY_IDS_STMT, {"user_ids": list(ids)})
         rows = result.all()
         users = {}
         for row in rows:
@@ -131,3 +125,12 @@ class PostgresqlUserRepository(UserRepository):
             if self.EMAIL_UNIQUE_VIOLATION_RE.search(error.orig.args[0]):
                 raise EmailAlreadyExistsError() from error
         raise
+
+
+_INSERT_STMT: t.Final = sa.insert(tables.USER).returning(tables.USER)
+_SELECT_BY_EMAIL_STMT: t.Final = sa.select(tables.USER).where(tables.USER.c.email == sa.bindparam("email"))
+_SELECT_BY_USERNAME_STMT: t.Final = sa.select(tables.USER).where(tables.USER.c.username == sa.bindparam("username"))
+_SELECT_BY_ID_STMT: t.Final = sa.select(tables.USER).where(tables.USER.c.id == sa.bindparam("user_id"))
+_SELECT_BY_IDS_STMT: t.Final = sa.select(tables.USER).where(
+    tables.USER.c.id.in_(sa.bindparam("user_ids", expanding=True))
+)
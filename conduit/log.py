@@ -0,0 +1,148 @@
+__all__ = [
+    "QueueWriter",
+    "add_request_context",
+    "configure_logging",
+]
+
+import logging
+import queue
+import sys
+import threading
+import typing as t
+
+import orjson
+import structlog
+from structlog.typing import EventDict, Processor
+
+from conduit.core.entities.unit_of_work import DEBUG_SAMPLED_VAR, REQUEST_ID_VAR, ROUTE_VAR
+
+# Lines drained by the writer thread and written at once.
+_BATCH: t.Final = 1024
+
+
+def add_request_context(_: t.Any, __: str, event_dict: EventDict) -> EventDict:
+    request_id = REQUEST_ID_VAR.get(None)
+    if request_id is not None:
+        event_dict["request_id"] = request_id
+        event_dict["route"] = ROUTE_VAR.get(None)
+    return event_dict
+
+
+def _sample_debug(_: t.Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Drops debug lines, except in the requests sampled by `debug_sampling_middleware`."""
+    if method_name == "debug" and not DEBUG_SAMPLED_VAR.get(False):
+        raise structlog.DropEvent
+    return event_dict
+
+
+def _render_json(_: t.Any, __: str, event_dict: EventDict) -> bytes:
+    # Dataclasses are rendered with their repr, which masks secrets like auth tokens.
+    return orjson.dumps(event_dict, default=repr, option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS)
+
+
+class QueueWriter:
+    """Writes lines from a background thread, so that logging never waits for the output.
+
+    Lines are dropped, and counted in `dropped`, while the queue is full.
+    """
+
+    def __init__(self, file: t.BinaryIO, max_lines: int = 100_000) -> None:
+        self._file = file
+        self._queue: queue.Queue[bytes | None] = queue.Queue(max_lines)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, line: bytes) -> None:
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Writes the queued lines and stops the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            lines = [self._queue.get()]
+            while len(lines) < _BATCH and not self._queue.empty():
+                lines.append(self._queue.get_nowait())
+            stop = None in lines
+            self._file.write(b"".join(line + b"\n" for line in lines if line is not None))
+            self._file.flush()
+            if stop:
+                return
+
+
+class _QueueLogger:
+    """Logger of the `fast` mode, every level is written the same way like with `structlog.BytesLogger`."""
+
+    def __init__(self, writer: QueueWriter) -> None:
+        self._writer = writer
+
+    def msg(self, message: bytes) -> None:
+        self._writer.write(message)
+
+    log = debug = info = warn = warning = error = err = critical = exception = fatal = failure = msg
+
+
+def configure_logging(
+    mode: str, level: str, debug_sampling: bool = False, output: t.TextIO = sys.stdout
+) -> QueueWriter | None:
+    """Configures structlog for the server.
+
+    Both modes drop lines below `level` before any processor runs.
+
+    Args:
+        mode: `verbose` renders with the standard library `json` and adds the call site of
+            every line, synchronously. `fast` renders with orjson and writes from a background
+            thread.
+        level: Name of the lowest level logged.
+        debug_sampling: Debug lines are also logged in requests sampled by
+            `debug_sampling_middleware`, whatever the level.
+        output: Where lines are written.
+
+    Returns:
+        The writer of the `fast` mode, to be closed on shutdown.
+    """
+    min_level = logging.getLevelNamesMapping()[level.upper()]
+    processors: list[Processor] = [add_request_context]
+    if debug_sampling and min_level > logging.DEBUG:
+        processors.append(_sample_debug)
+        min_level = logging.DEBUG
+    processors += [
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.dict_tracebacks,
+    ]
+    writer = None
+    logger_factory: t.Callable[..., t.Any]
+    if mode == "fast":
+        writer = QueueWriter(output.buffer)
+        processors.append(_render_json)
+        logger = _QueueLogger(writer)
+
+        def logger_factory(*_: t.Any) -> _QueueLogger:
+            return logger
+
+    else:
+        processors += [
+            structlog.processors.CallsiteParameterAdder(
+                {
+                    structlog.processors.CallsiteParameter.FILENAME,
+                    structlog.processors.CallsiteParameter.FUNC_NAME,
+                    structlog.processors.CallsiteParameter.LINENO,
+                }
+            ),
+            structlog.processors.JSONRenderer(),
+        ]
+        logger_factory = structlog.PrintLoggerFactory(output)
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(min_level),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
+    return writer
@@ -0,0 +1,192 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+Recording a value is a dict lookup of the labelled series and an increment. Callers on a
+hot path keep the series returned by `labels` rather than looking it up every time.
+Values owned by other objects, such as pool sizes, are read by callbacks when scraped.
+"""
+
+__all__ = [
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "Family",
+    "Gauge",
+    "Histogram",
+    "Registry",
+]
+
+import bisect
+import math
+import typing as t
+
+# Buckets of durations in seconds, from a few milliseconds to the request deadline.
+DEFAULT_BUCKETS: t.Final = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MetricType = t.Literal["counter", "gauge", "histogram"]
+# Label values and value of every series of a metric read by a callback.
+Samples = t.Iterable[tuple[tuple[object, ...], float]]
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    __slots__ = ("_bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # Observations per bucket, not cumulative. The last bucket is `+Inf`.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # Bucket bounds are inclusive.
+        self.counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.sum += value
+
+
+M = t.TypeVar("M", Counter, Gauge, Histogram)
+
+
+class Family(t.Generic[M]):
+    """Series of a metric, one per combination of label values."""
+
+    def __init__(self, factory: t.Callable[[], M], label_names: tuple[str, ...]) -> None:
+        self._factory: t.Callable[[], M] = factory
+        self.label_names = label_names
+        self.series: dict[tuple[object, ...], M] = {}
+
+    def labels(self, *values: object) -> M:
+        """Series of the label values, which are converted to strings only when scraped."""
+        series = self.series.get(values)
+        if series is None:
+            assert len(values) == len(self.label_names), "a value is required for every label"
+            series = self.series[values] = self._factory()
+        return series
+
+
+class _Metric(t.NamedTuple):
+    name: str
+    help: str
+    type: MetricType
+    label_names: tuple[str, ...]
+    family: Family[t.Any] | None
+    callback: t.Callable[[], Samples] | None
+    buckets: tuple[float, ...]
+
+
+class Registry:
+    """Metrics of the process, rendered by `render` for a scrape."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, help: str, label_names: tuple[str, ...] = ()) -> Family[Counter]:
+        family = Family(Counter, label_names)
+        self._register(_Metric(name, help, "counter", label_names, family, None, ()))
+        return family
+
+    def gauge(self, name: str, help: str, label_names: tuple[str, ...] = ()) -> Family[Gauge]:
+        family = Family(Gauge, label_names)
+        self._register(_Metric(name, help, "gauge", label_names, family, None, ()))
+        return family
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Family[Histogram]:
+        buckets = tuple(sorted(buckets))
+        family = Family(lambda: Histogram(buckets), label_names)
+        self._register(_Metric(name, help, "histogram", label_names, family, None, buckets))
+        return family
+
+    def callback(
+        self,
+        name: str,
+        help: str,
+        type: t.Literal["counter", "gauge"],
+        collect: t.Callable[[], Samples],
+        label_names: tuple[str, ...] = (),
+    ) -> None:
+        """Registers a metric whose values `collect` reads when scraped."""
+        self._register(_Metric(name, help, type, label_names, None, collect, ()))
+
+    def render(self) -> str:
+        """Metrics in the Prometheus text exposition format, version 0.0.4."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            if metric.callback is not None:
+                for values, value in metric.callback():
+                    lines.append(f"{metric.name}{_labels(metric.label_names, values)} {_format(value)}")
+                continue
+            assert metric.family is not None
+            # Copied, a request may add a series while the text is being built.
+            for values, series in list(metric.family.series.items()):
+                if isinstance(series, Histogram):
+                    lines.extend(_histogram_lines(metric, values, series))
+                else:
+                    lines.append(f"{metric.name}{_labels(metric.label_names, values)} {_format(series.value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def _register(self, metric: _Metric) -> None:
+        assert metric.name not in self._metrics, f"metric {metric.name} is already registered"
+        self._metrics[metric.name] = metric
+
+
+def _histogram_lines(metric: _Metric, values: tuple[object, ...], histogram: Histogram) -> t.Iterator[str]:
+    cumulative = 0
+    counts = list(histogram.counts)
+    for bound, count in zip((*metric.buckets, math.inf), counts):
+        cumulative += count
+        labels = _labels((*metric.label_names, "le"), (*values, _format(bound)))
+        yield f"{metric.name}_bucket{labels} {cumulative}"
+    labels = _labels(metric.label_names, values)
+    yield f"{metric.name}_sum{labels} {_format(histogram.sum)}"
+    yield f"{metric.name}_count{labels} {cumulative}"
+
+
+def _labels(names: tuple[str, ...], values: tuple[object, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
@@ -0,0 +1,194 @@
+"""Log of slow database statements, with their query plans captured in the background."""
+
+__all__ = [
+    "Explain",
+    "SlowQuery",
+    "SlowQueryLog",
+    "fingerprint",
+]
+
+import asyncio
+import collections
+import contextvars
+import hashlib
+import json
+import re
+import time
+import typing as t
+from dataclasses import dataclass
+
+import structlog
+
+from conduit.core.entities.unit_of_work import REQUEST_ID_VAR, ROUTE_VAR
+
+LOG = structlog.get_logger(__name__)
+
+# Runs a statement with its parameters on another connection, returns the value of its single row.
+Explain = t.Callable[[str, t.Sequence[t.Any]], t.Awaitable[t.Any]]
+
+_EXPLAIN_PREFIX: t.Final = "EXPLAIN (FORMAT JSON) "
+
+# Statements whose plan can be explained without running them.
+_EXPLAINABLE: t.Final = frozenset({"SELECT", "WITH", "INSERT", "UPDATE", "DELETE"})
+# Longest parameter logged, in characters of its repr.
+_MAX_PARAMETER_LENGTH: t.Final = 200
+# Time allowed to `EXPLAIN`, in seconds.
+_EXPLAIN_TIMEOUT: t.Final = 5.0
+
+_SPACE_RE: t.Final = re.compile(r"\s+")
+# Bind parameters, with the casts added by SQLAlchemy, and literals.
+_VALUE_RE: t.Final = re.compile(r"\$\d+(?:::[\w\[\]]+)?|'(?:[^']|'')*'|\b\d+\b")
+# Lists of values, e.g. `IN ($1, $2, $3)`, whose length changes with the parameters.
+_VALUE_LIST_RE: t.Final = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def fingerprint(statement: str) -> str:
+    """Id shared by the statements that differ only by their values and the lengths of their lists of values."""
+    normalized = _VALUE_RE.sub("?", _SPACE_RE.sub(" ", statement).strip())
+    return hashlib.sha1(_VALUE_LIST_RE.sub("?", normalized).encode()).hexdigest()[:16]
+
+
+@dataclass(eq=False, slots=True)
+class SlowQuery:
+    """Slow statements sharing a fingerprint.
+
+    Attributes:
+        statement: Latest of the statements.
+        count: Times a statement has been slow.
+        max_duration: Longest duration, in seconds.
+        last_seen: Unix time of the latest statement.
+        route: Route of the request that ran the latest statement.
+        request_id: Id of the request that ran the latest statement.
+        plan: `EXPLAIN (FORMAT JSON)` output, `None` until captured.
+        plan_error: Why the plan could not be captured.
+    """
+
+    fingerprint: str
+    statement: str
+    count: int = 0
+    max_duration: float = 0.0
+    last_seen: float = 0.0
+    route: str | None = None
+    request_id: str | None = None
+    plan: t.Any = None
+    plan_error: str | None = None
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "count": self.count,
+            "max_duration": self.max_duration,
+            "last_seen": self.last_seen,
+            "route": self.route,
+            "request_id": self.request_id,
+            "plan": self.plan,
+            "plan_error": self.plan_error,
+        }
+
+
+class SlowQueryLog:
+    """Logs statements slower than `threshold` and keeps their plans.
+
+    The plan of a statement is captured once per fingerprint, by a background task on
+    another connection, so the request that ran it does not wait. Only `capacity`
+    fingerprints are kept, the least recently seen ones are dropped first.
+
+    Args:
+        threshold: Duration from which a statement is slow, in seconds.
+        capacity: Fingerprints kept.
+        max_pending_explains: Plans captured at once, so that a burst of slow statements
+            can not take many connections of the pool.
+        log_parameters: Whether the values of parameters are logged. They may hold passwords, emails
+            and tokens, so only their types and lengths are logged by default.
+    """
+
+    def __init__(
+        self, threshold: float, capacity: int = 100, max_pending_explains: int = 2, log_parameters: bool = False
+    ) -> None:
+        self.threshold = threshold
+        self._capacity = capacity
+        self._log_parameters = log_parameters
+        self._max_pending_explains = max_pending_explains
+        self._queries: collections.OrderedDict[str, SlowQuery] = collections.OrderedDict()
+        self._explains: dict[str, asyncio.Task[None]] = {}
+        self.recorded = 0
+
+    def record(self, statement: str, parameters: t.Sequence[t.Any], duration: float, explain: Explain) -> None:
+        """Records a statement that has taken `duration` seconds, ignored below the threshold."""
+        if duration < self.threshold or statement.startswith(_EXPLAIN_PREFIX):
+            return
+        self.recorded += 1
+        key = fingerprint(statement)
+        query = self._queries.get(key)
+        if query is None:
+            query = self._queries[key] = SlowQuery(key, statement)
+            if len(self._queries) > self._capacity:
+                self._queries.popitem(last=False)
+        else:
+            self._queries.move_to_end(key)
+        query.statement = statement
+        query.count += 1
+        query.max_duration = max(query.max_duration, duration)
+        query.last_seen = time.time()
+        query.route = ROUTE_VAR.get(None)
+        query.request_id = REQUEST_ID_VAR.get(None)
+        LOG.warning(
+            "slow database statement",
+            statement=statement,
+            parameters=[
+                _truncate(repr(parameter)) if self._log_parameters else _describe(parameter) for parameter in parameters
+            ],
+            duration=round(duration, 3),
+            fingerprint=key,
+        )
+        if (
+            query.plan is None
+            and query.plan_error is None
+            and key not in self._explains
+            and len(self._explains) < self._max_pending_explains
+            and _is_explainable(statement)
+        ):
+            # A fresh context, so that the plan is not accounted or traced as a part of the request.
+            self._explains[key] = asyncio.get_running_loop().create_task(
+                self._explain(query, statement, parameters, explain), context=contextvars.Context()
+            )
+
+    def queries(self) -> list[SlowQuery]:
+        """Kept slow statements, the most recently seen first."""
+        return list(reversed(self._queries.values()))
+
+    async def close(self) -> None:
+        """Cancels the plans being captured."""
+        tasks = list(self._explains.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _explain(self, query: SlowQuery, statement: str, parameters: t.Sequence[t.Any], explain: Explain) -> None:
+        try:
+            async with asyncio.timeout(_EXPLAIN_TIMEOUT):
+                plan = await explain(_EXPLAIN_PREFIX + statement, parameters)
+            # Decoded by SQLAlchemy, but not by asyncpg.
+            query.plan = json.loads(plan) if isinstance(plan, str) else plan
+        except Exception as error:
+            query.plan_error = f"{type(error).__name__}: {error}"
+            LOG.warning("could not explain slow database statement", fingerprint=query.fingerprint, error=str(error))
+        finally:
+            del self._explains[query.fingerprint]
+
+
+def _is_explainable(statement: str) -> bool:
+    words = statement.split(None, 1)
+    # `EXPLAIN` takes a single statement.
+    return bool(words) and words[0].upper() in _EXPLAINABLE and ";" not in statement.rstrip().rstrip(";")
+
+
+def _describe(value: t.Any) -> str:
+    """Type of a parameter, with the length of strings, bytes and lists, e.g. `str[12]`."""
+    name = type(value).__name__
+    return f"{name}[{len(value)}]" if isinstance(value, str | bytes | list | tuple) else name
+
+
+def _truncate(value: str) -> str:
+    return value if len(value) <= _MAX_PARAMETER_LENGTH else value[:_MAX_PARAMETER_LENGTH] + "..."
@@ -0,0 +1,33 @@
+"""Prints a token profiling the requests that send it in the `X-Profile` header.
+
+The token is signed with `CONDUIT_PROFILE_SECRET` and also gives access to the captured
+profiles under `/debug/profiles`, e.g.:
+    curl -H "X-Profile: $(python -m conduit.tools.profile_token)" localhost:8080/api/v1/articles
+
+Usage:
+    python -m conduit.tools.profile_token [--minutes N]
+"""
+
+__all__ = [
+    "main",
+]
+
+import argparse
+import sys
+import time
+
+from conduit.api.profiling import sign_profile_token
+from conduit.config import settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=int, default=10, help="validity of the token")
+    args = parser.parse_args()
+    if not settings.PROFILE_SECRET:
+        sys.exit("CONDUIT_PROFILE_SECRET is not set")
+    print(sign_profile_token(settings.PROFILE_SECRET, int(time.time()) + args.minutes * 60))
+
+
+if __name__ == "__main__":
+    main()
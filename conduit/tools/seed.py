@@ -0,0 +1,294 @@
+"""Fills the application tables with a generated dataset, bulk-loaded with `COPY`.
+
+Generates users, a follower graph, articles, tags, favorites and comments. Popularity
+follows a power law: a few users are followed by many, a few tags and articles collect
+most of the links, and so do the authors of most articles. The same seed and sizes
+always produce the same rows, except for the password hash that is salted at random.
+
+Rows are streamed into the tables with binary `COPY`, in a single transaction, so the
+whole dataset is either loaded or not at all. Foreign keys and secondary indexes are
+dropped for the load and created again afterwards. The tables must be empty, `--truncate`
+empties them first. Every user can sign in as `user<N>@example.com` with `--password`.
+
+Usage:
+    python -m conduit.tools.seed [--users N] [--seed S] [--truncate]
+"""
+
+__all__ = [
+    "main",
+]
+
+import argparse
+import asyncio
+import datetime as dt
+import itertools
+import random
+import time
+import typing as t
+from contextlib import asynccontextmanager
+
+import asyncpg
+import sqlalchemy as sa
+
+from conduit.config import db_url
+from conduit.core.entities.user import RawPassword
+from conduit.db import tables
+from conduit.impl.password_hasher import Argon2idPasswordHasher
+
+# Timestamps are derived from the ids rather than the clock, to keep datasets reproducible.
+# Users sign up a second apart, well before the first article is published.
+USERS_EPOCH: t.Final = dt.datetime(2019, 1, 1)
+EPOCH: t.Final = dt.datetime(2020, 1, 1)
+WORDS: t.Final = (
+    "async python database query index cache latency throughput request response server client "
+    "postgres vacuum replica commit transaction lock deadline budget profile trace metric log "
+    "event loop task future coroutine socket buffer stream batch queue worker process thread "
+    "memory pointer allocation garbage collector compiler parser token syntax grammar module "
+    "package release version feature bug patch review test benchmark fixture mock coverage "
+    "design pattern layer domain entity repository service handler endpoint route schema "
+    "field column table row page cursor offset limit filter sort join scan plan cost estimate "
+    "network packet gateway proxy balancer cluster node shard partition backup restore snapshot "
+    "garden river mountain forest ocean desert city village road bridge tower castle harbor"
+).split()
+assert len(set(WORDS)) == len(WORDS), "tags are made of the words, they must be unique"
+
+# Exponent of the power laws: the n-th most popular item is drawn with a weight of 1 / n ** s.
+POPULARITY_EXPONENT: t.Final = 1.1
+# Shape of the Pareto distribution of the number of links per item, its mean is 3.
+PARETO_SHAPE: t.Final = 1.5
+
+
+class Sizes(t.NamedTuple):
+    users: int
+    follows_per_user: float
+    articles_per_user: float
+    tags: int
+    tags_per_article: float
+    favorites_per_article: float
+    comments_per_article: float
+
+    @property
+    def articles(self) -> int:
+        return round(self.users * self.articles_per_user)
+
+    @property
+    def comments(self) -> int:
+        return round(self.articles * self.comments_per_article)
+
+
+class PowerLaw:
+    """Draws ids out of `1..size` in a shuffled order of popularity."""
+
+    def __init__(self, rng: random.Random, size: int) -> None:
+        self._rng = rng
+        self._ids = list(range(1, size + 1))
+        rng.shuffle(self._ids)
+        self._cum_weights = list(itertools.accumulate(1 / n**POPULARITY_EXPONENT for n in range(1, size + 1)))
+
+    def one(self) -> int:
+        return self._rng.choices(self._ids, cum_weights=self._cum_weights)[0]
+
+    def distinct(self, k: int, exclude: int | None = None) -> set[int]:
+        # At most half of the population, so that collisions with popular ids stay rare.
+        k = min(k, (len(self._ids) - 1) // 2)
+        ids: set[int] = set()
+        while len(ids) < k:
+            ids.update(self._rng.choices(self._ids, cum_weights=self._cum_weights, k=k - len(ids)))
+            if exclude is not None:
+                ids.discard(exclude)
+        return ids
+
+
+def heavy_tailed_count(rng: random.Random, mean: float) -> int:
+    """Number of links of an item, `0` for most items and large for a few."""
+    return int((rng.paretovariate(PARETO_SHAPE) - 1) * mean / 2)
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def user_created_at(user_id: int) -> dt.datetime:
+    return USERS_EPOCH + dt.timedelta(seconds=user_id)
+
+
+def article_created_at(article_id: int) -> dt.datetime:
+    return EPOCH + dt.timedelta(minutes=article_id)
+
+
+def generate_users(sizes: Sizes, password_hash: str) -> t.Iterator[tuple[t.Any, ...]]:
+    for id in range(1, sizes.users + 1):
+        yield id, f"user{id}", f"user{id}@example.com", password_hash, "", None, user_created_at(id), None
+
+
+def generate_followers(rng: random.Random, sizes: Sizes) -> t.Iterator[tuple[t.Any, ...]]:
+    followed = PowerLaw(rng, sizes.users)
+    for follower_id in range(1, sizes.users + 1):
+        count = heavy_tailed_count(rng, sizes.follows_per_user)
+        for followed_id in sorted(followed.distinct(count, exclude=follower_id)):
+            created_at = max(user_created_at(follower_id), user_created_at(followed_id))
+            yield follower_id, followed_id, created_at + dt.timedelta(hours=rng.randrange(1, 24 * 30))
+
+
+def generate_articles(rng: random.Random, sizes: Sizes) -> t.Iterator[tuple[t.Any, ...]]:
+    authors = PowerLaw(rng, sizes.users)
+    for id in range(1, sizes.articles + 1):
+        title = sentence(rng, rng.randint(3, 8)).capitalize()
+        slug = f"{title.lower().replace(' ', '-')[:32]}-{id}"
+        description = sentence(rng, rng.randint(8, 16))
+        body = "\n\n".join(sentence(rng, rng.randint(20, 60)) for _ in range(rng.randint(1, 5)))
+        created_at = article_created_at(id)
+        updated_at = created_at + dt.timedelta(hours=rng.randrange(1, 72)) if rng.random() < 0.1 else None
+        yield id, authors.one(), slug, title, description, body, created_at, updated_at
+
+
+def generate_tags(sizes: Sizes) -> t.Iterator[tuple[t.Any, ...]]:
+    for id in range(1, sizes.tags + 1):
+        # Plain words first, then numbered ones once they run out.
+        word = WORDS[(id - 1) % len(WORDS)]
+        tag = word if id <= len(WORDS) else f"{word}{(id - 1) // len(WORDS)}"
+        # `article_count` is filled in from `article_tag` once it is loaded.
+        yield id, tag, EPOCH, 0
+
+
+def generate_article_tags(rng: random.Random, sizes: Sizes) -> t.Iterator[tuple[t.Any, ...]]:
+    tags = PowerLaw(rng, sizes.tags)
+    for article_id in range(1, sizes.articles + 1):
+        count = heavy_tailed_count(rng, sizes.tags_per_article)
+        for tag_id in sorted(tags.distinct(count)):
+            yield article_id, tag_id, article_created_at(article_id)
+
+
+def generate_favorites(rng: random.Random, sizes: Sizes) -> t.Iterator[tuple[t.Any, ...]]:
+    users = PowerLaw(rng, sizes.users)
+    for article_id in range(1, sizes.articles + 1):
+        count = heavy_tailed_count(rng, sizes.favorites_per_article)
+        for user_id in sorted(users.distinct(count)):
+            created_at = max(article_created_at(article_id), user_created_at(user_id))
+            yield article_id, user_id, created_at + dt.timedelta(hours=rng.randrange(1, 24 * 30))
+
+
+def generate_comments(rng: random.Random, sizes: Sizes) -> t.Iterator[tuple[t.Any, ...]]:
+    authors = PowerLaw(rng, sizes.users)
+    articles = PowerLaw(rng, sizes.articles)
+    for id in range(1, sizes.comments + 1):
+        article_id = articles.one()
+        created_at = article_created_at(article_id) + dt.timedelta(minutes=rng.randrange(1, 60 * 24 * 7))
+        yield id, authors.one(), article_id, created_at, None, sentence(rng, rng.randint(5, 40))
+
+
+async def load(connection: asyncpg.Connection, table: sa.Table, records: t.Iterable[tuple[t.Any, ...]]) -> None:
+    """Copies `records`, tuples in the order of the columns of `table`, into `table`."""
+    t0 = time.perf_counter()
+    columns = [column.name for column in table.c if column.computed is None]
+    status = await connection.copy_records_to_table(table.name, records=records, columns=columns)
+    print(f"{table.name:<18}{status.removeprefix('COPY '):>12} rows{time.perf_counter() - t0:>9.1f} s")
+
+
+@asynccontextmanager
+async def deferred_constraints(connection: asyncpg.Connection, table_names: list[str]) -> t.AsyncIterator[None]:
+    """Drops foreign keys and secondary indexes of the tables, and creates them again on exit.
+
+    Checking a foreign key row by row and maintaining an index row by row, the GIN index
+    of the article text above all, take most of the time of a bulk load. Building them
+    once the data is in is much faster. Primary keys and unique constraints stay.
+    """
+    foreign_keys = await connection.fetch(_FOREIGN_KEYS_SQL, table_names)
+    indexes = await connection.fetch(_SECONDARY_INDEXES_SQL, table_names)
+    for table, name, _ in foreign_keys:
+        await connection.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+    for name, _ in indexes:
+        await connection.execute(f"DROP INDEX {name}")
+    yield
+    t0 = time.perf_counter()
+    for _, definition in indexes:
+        await connection.execute(definition)
+    for table, name, definition in foreign_keys:
+        await connection.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+    print(f"{'constraints':<35}{time.perf_counter() - t0:>9.1f} s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10_000, help="number of users")
+    parser.add_argument("--follows-per-user", type=float, default=20, help="mean number of followed users")
+    parser.add_argument("--articles-per-user", type=float, default=5, help="mean number of articles")
+    parser.add_argument("--tags", type=int, help="number of tags, a tenth of the users by default")
+    parser.add_argument("--tags-per-article", type=float, default=3, help="mean number of tags")
+    parser.add_argument("--favorites-per-article", type=float, default=4, help="mean number of favorites")
+    parser.add_argument("--comments-per-article", type=float, default=3, help="mean number of comments")
+    parser.add_argument("--seed", default="conduit", help="seed of the generated data")
+    parser.add_argument("--password", default="password", help="password of every user")
+    parser.add_argument("--truncate", action="store_true", help="empty the tables first")
+    args = parser.parse_args()
+    if args.users < 3:
+        parser.error("--users must be at least 3")
+
+    sizes = Sizes(
+        users=args.users,
+        follows_per_user=args.follows_per_user,
+        articles_per_user=args.articles_per_user,
+        tags=args.tags if args.tags is not None else max(args.users // 10, 3),
+        tags_per_article=args.tags_per_article,
+        favorites_per_article=args.favorites_per_article,
+        comments_per_article=args.comments_per_article,
+    )
+    # Hashing is deliberately slow, every user shares the one hash.
+    password_hash = await Argon2idPasswordHasher().hash_password(RawPassword(args.password))
+
+    def rng(table: sa.Table) -> random.Random:
+        # One generator per table: the rows of a table do not depend on the sizes of the others.
+        return random.Random(f"{args.seed}:{table.name}")
+
+    connection = await asyncpg.connect(db_url(driver="postgresql").render_as_string(hide_password=False))
+    try:
+        table_names = [f'"{table.name}"' for table in tables.METADATA.sorted_tables]
+        async with connection.transaction():
+            if args.truncate:
+                await connection.execute(f"TRUNCATE {', '.join(table_names)} RESTART IDENTITY")
+            elif await connection.fetchval(f'SELECT EXISTS (SELECT FROM "{tables.USER.name}")'):
+                raise SystemExit("the database is not empty, pass --truncate to replace its data")
+
+            t0 = time.perf_counter()
+            async with deferred_constraints(connection, table_names):
+                await load(connection, tables.USER, generate_users(sizes, password_hash))
+                await load(connection, tables.FOLLOWER, generate_followers(rng(tables.FOLLOWER), sizes))
+                await load(connection, tables.ARTICLE, generate_articles(rng(tables.ARTICLE), sizes))
+                await load(connection, tables.TAG, generate_tags(sizes))
+                await load(connection, tables.ARTICLE_TAG, generate_article_tags(rng(tables.ARTICLE_TAG), sizes))
+                await load(connection, tables.FAVORITE_ARTICLE, generate_favorites(rng(tables.FAVORITE_ARTICLE), sizes))
+                await load(connection, tables.COMMENT, generate_comments(rng(tables.COMMENT), sizes))
+                await connection.execute(_COUNT_TAG_ARTICLES_SQL)
+            # Rows were copied with explicit ids, the sequences must continue after them.
+            for table in (tables.USER, tables.ARTICLE, tables.TAG, tables.COMMENT):
+                await connection.execute(
+                    f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', 'id'), max(id)) FROM \"{table.name}\""
+                )
+        # Planner statistics of the new rows, outside of the transaction as autovacuum would.
+        await connection.execute(f"ANALYZE {', '.join(table_names)}")
+        print(f"{'total':<35}{time.perf_counter() - t0:>9.1f} s")
+    finally:
+        await connection.close()
+
+
+_FOREIGN_KEYS_SQL: t.Final = """
+    SELECT conrelid::regclass::text, quote_ident(conname), pg_get_constraintdef(oid)
+    FROM pg_constraint
+    WHERE contype = 'f' AND conrelid = ANY($1::text[]::regclass[])
+"""
+# Indexes that do not back a primary key or a unique constraint.
+_SECONDARY_INDEXES_SQL: t.Final = """
+    SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+    FROM pg_index
+    WHERE indrelid = ANY($1::text[]::regclass[])
+      AND NOT EXISTS (SELECT FROM pg_constraint WHERE conindid = pg_index.indexrelid)
+"""
+_COUNT_TAG_ARTICLES_SQL: t.Final = """
+    UPDATE tag SET article_count = counted.article_count
+    FROM (SELECT tag_id, count(*) AS article_count FROM article_tag GROUP BY tag_id) AS counted
+    WHERE tag.id = counted.tag_id
+"""
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,255 @@
+"""Tracing spans, exported as JSON lines to a file or to an OpenTelemetry collector over OTLP/HTTP."""
+
+__all__ = [
+    "SPAN_VAR",
+    "FileExporter",
+    "OtlpExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+    "record_span",
+]
+
+import abc
+import contextvars
+import json
+import os
+import queue
+import threading
+import time
+import typing as t
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import structlog
+
+from conduit.log import QueueWriter
+
+LOG = structlog.get_logger(__name__)
+
+
+@dataclass(eq=False, slots=True)
+class Span:
+    """Timed operation of a trace.
+
+    Attributes:
+        trace_id: 32 hex digits, shared by all the spans of a trace.
+        span_id: 16 hex digits.
+        parent_id: Id of the enclosing span, `None` for the root of a trace.
+        start_ns: Start as nanoseconds since the epoch.
+        end_ns: End as nanoseconds since the epoch, `0` while the span is open.
+        error: Exception that ended the span.
+    """
+
+    tracer: "Tracer"
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    attributes: dict[str, t.Any]
+    end_ns: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": (self.end_ns - self.start_ns) / 1e6,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+# Innermost open span of the current task, `None` when the current request is not traced.
+SPAN_VAR: contextvars.ContextVar[Span | None] = contextvars.ContextVar("span", default=None)
+
+
+class SpanExporter(t.Protocol):
+    @abc.abstractmethod
+    def export(self, span: Span) -> None:
+        """Queues an ended span, must not block."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Sends the queued spans."""
+        raise NotImplementedError()
+
+
+class Tracer:
+    """Opens spans and hands them to an exporter once they end."""
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, *, trace_id: str | None = None, **attributes: t.Any) -> t.Iterator[Span]:
+        """Span of the block, a child of the current span, and the current span inside the block.
+
+        Args:
+            name: Name of the span.
+            trace_id: Trace of a root span, a new random one by default. Ignored for child spans.
+            attributes: Attributes of the span.
+        """
+        parent = SPAN_VAR.get()
+        span = Span(
+            tracer=self,
+            name=name,
+            trace_id=parent.trace_id if parent is not None else trace_id or os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = SPAN_VAR.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.error = type(error).__name__
+            raise
+        finally:
+            SPAN_VAR.reset(token)
+            span.end_ns = time.time_ns()
+            self.exporter.export(span)
+
+
+def record_span(name: str, duration: float, **attributes: t.Any) -> None:
+    """Records a child of the current span that has just ended after `duration` seconds.
+
+    Does nothing when the current request is not traced, so it is cheap to call from hot paths.
+    """
+    parent = SPAN_VAR.get()
+    if parent is None:
+        return
+    end_ns = time.time_ns()
+    parent.tracer.exporter.export(
+        Span(
+            tracer=parent.tracer,
+            name=name,
+            trace_id=parent.trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id,
+            start_ns=end_ns - int(duration * 1e9),
+            attributes=attributes,
+            end_ns=end_ns,
+        )
+    )
+
+
+class FileExporter(SpanExporter):
+    """Appends spans to a file, one JSON object per line, from a background thread."""
+
+    def __init__(self, path: str) -> None:
+        self._writer = QueueWriter(open(path, "ab"))
+
+    def export(self, span: Span) -> None:
+        self._writer.write(json.dumps(span.to_dict(), default=repr).encode())
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class OtlpExporter(SpanExporter):
+    """Sends spans in batches to an OpenTelemetry collector, with the JSON encoding of OTLP/HTTP.
+
+    Args:
+        endpoint: Base URL of the collector, e.g. `http://localhost:4318`.
+        service_name: `service.name` of the spans.
+        batch_size: Spans sent at most per request.
+        interval: Seconds waited for spans before sending an incomplete batch.
+    """
+
+    def __init__(
+        self, endpoint: str, service_name: str = "conduit", batch_size: int = 512, interval: float = 1.0
+    ) -> None:
+        self._url = endpoint.rstrip("/") + "/v1/traces"
+        self._resource = {"attributes": _attributes({"service.name": service_name})}
+        self._batch_size = batch_size
+        self._interval = interval
+        self._queue: queue.Queue[Span | None] = queue.Queue(batch_size * 100)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch: list[Span] = []
+            deadline = time.monotonic() + self._interval
+            while len(batch) < self._batch_size:
+                try:
+                    span = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stop = True
+                    break
+                batch.append(span)
+            if batch:
+                self._send(batch)
+
+    def _send(self, spans: list[Span]) -> None:
+        body = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [{"scope": {"name": "conduit"}, "spans": [_otlp_span(span) for span in spans]}],
+                }
+            ]
+        }
+        request = urllib.request.Request(
+            self._url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10):
+                pass
+        except OSError as error:
+            LOG.warning("could not export spans", url=self._url, spans=len(spans), error=str(error))
+
+
+def _otlp_span(span: Span) -> dict[str, t.Any]:
+    otlp: dict[str, t.Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        # SPAN_KIND_INTERNAL
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+    }
+    if span.parent_id is not None:
+        otlp["parentSpanId"] = span.parent_id
+    if span.error is not None:
+        # STATUS_CODE_ERROR
+        otlp["status"] = {"code": 2, "message": span.error}
+    return otlp
+
+
+def _attributes(attributes: t.Mapping[str, t.Any]) -> list[dict[str, t.Any]]:
+    return [{"key": key, "value": _value(value)} for key, value in attributes.items() if value is not None]
+
+
+def _value(value: t.Any) -> dict[str, t.Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -0,0 +1,58 @@
+"""add access path indexes.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 09:12:44.518930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# `CONCURRENTLY` can not run inside a transaction, hence the autocommit blocks. A failed
+# concurrent build leaves an invalid index behind, drop it before running the migration again.
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_article_created_at_id",
+            "article",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f("ix_follower_followed_id"),
+            "follower",
+            ["followed_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_comment_article_id_id",
+            "comment",
+            ["article_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(op.f("ix_comment_article_id"), table_name="comment", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_comment_article_id"),
+            "comment",
+            ["article_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_comment_article_id_id", table_name="comment", postgresql_concurrently=True)
+        op.drop_index(op.f("ix_follower_followed_id"), table_name="follower", postgresql_concurrently=True)
+        op.drop_index("ix_article_created_at_id", table_name="article", postgresql_concurrently=True)
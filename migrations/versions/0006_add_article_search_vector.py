@@ -0,0 +1,52 @@
+"""add article search vector.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 11:02:17.204118
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Adding a stored generated column rewrites the article table under an exclusive lock, run it
+# when writes can wait. The index is built afterwards without blocking writes.
+def upgrade() -> None:
+    op.add_column(
+        "article",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', title), 'A') || "
+                "setweight(to_tsvector('english', description), 'B') || "
+                "setweight(to_tsvector('english', body), 'C')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_article_search_vector",
+            "article",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_article_search_vector", table_name="article", postgresql_concurrently=True)
+    op.drop_column("article", "search_vector")
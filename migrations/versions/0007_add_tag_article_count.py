@@ -0,0 +1,44 @@
+"""add tag article count.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 13:41:05.712394
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# A constant default does not rewrite the table. The backfill locks every tag row until it
+# commits, so new articles wait for it; the index is built afterwards without blocking writes.
+def upgrade() -> None:
+    op.add_column("tag", sa.Column("article_count", sa.BigInteger(), server_default="0", nullable=False))
+    op.execute(
+        """
+        UPDATE tag SET article_count = counted.article_count
+        FROM (SELECT tag_id, count(*) AS article_count FROM article_tag GROUP BY tag_id) AS counted
+        WHERE tag.id = counted.tag_id
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tag_article_count_id",
+            "tag",
+            ["article_count", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_tag_article_count_id", table_name="tag", postgresql_concurrently=True)
+    op.drop_column("tag", "article_count")
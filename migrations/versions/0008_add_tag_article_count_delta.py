@@ -0,0 +1,31 @@
+"""add tag article count delta.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 15:02:37.184520
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Neither a primary key nor a foreign key: the rows are only appended, and deleted all at once
+# when they are folded into `tag.article_count`.
+def upgrade() -> None:
+    op.create_table(
+        "tag_article_count_delta",
+        sa.Column("tag_id", sa.BigInteger(), nullable=False),
+        sa.Column("delta", sa.BigInteger(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tag_article_count_delta")
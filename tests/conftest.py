@@ -0,0 +1,133 @@
+"""Fixtures of the tests running against Postgres.
+
+The database is the one configured for the application. The tests create their own schema in it, filled with
+generated data, and drop it once they are done.
+"""
+
+import asyncio
+import typing as t
+
+import asyncpg
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from conduit.config import db_url
+from conduit.core.entities.unit_of_work import UnitOfWork
+from conduit.db import tables
+from conduit.impl.asyncpg.unit_of_work import AsyncpgUnitOfWork
+from conduit.impl.unit_of_work import PostgresqlUnitOfWork
+
+SCHEMA: t.Final = "conduit_tests"
+# Users of the dataset. Each one writes 5 articles and follows 10 users, each article has 3 tags, 4 favorites
+# and 4 comments.
+USERS: t.Final = 10_000
+
+_DIALECT: t.Final = create_async_engine("postgresql+asyncpg://").dialect
+
+_SEED_SQL: t.Final = [
+    """
+    INSERT INTO "user" (username, email, password_hash, bio, created_at)
+    SELECT 'user' || i, 'user' || i || '@example.com', 'hash', '', now() - i * interval '1 hour'
+    FROM generate_series(1, $1::bigint) AS i
+    """,
+    """
+    INSERT INTO follower (follower_id, followed_id, created_at)
+    SELECT u, 1 + (u * 7919 + k * 104729) % $1::bigint, now()
+    FROM generate_series(1, $1::bigint) AS u, generate_series(1, 10) AS k
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO article (author_id, slug, title, description, body, created_at)
+    SELECT 1 + i % $1::bigint, 'article-' || i, 'Article ' || i, 'description', repeat('body ', 50),
+           now() - i * interval '1 minute'
+    FROM generate_series(1, $1::bigint * 5) AS i
+    """,
+    """
+    INSERT INTO tag (tag, created_at)
+    SELECT 'tag' || i, now() FROM generate_series(1, $1::bigint * 5) AS i
+    """,
+    """
+    INSERT INTO article_tag (article_id, tag_id, created_at)
+    SELECT a, 1 + (a * k * 31) % ($1::bigint * 5), now()
+    FROM generate_series(1, $1::bigint * 5) AS a, generate_series(1, 3) AS k
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    UPDATE tag SET article_count = counted.article_count
+    FROM (SELECT tag_id, count(*) AS article_count FROM article_tag GROUP BY tag_id) AS counted
+    WHERE tag.id = counted.tag_id
+    """,
+    """
+    INSERT INTO favorite_article (article_id, user_id, created_at)
+    SELECT a, 1 + (a * 13 + k * 7793) % $1::bigint, now()
+    FROM generate_series(1, $1::bigint * 5) AS a, generate_series(1, 4) AS k
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO comment (author_id, article_id, body, created_at)
+    SELECT 1 + (a * k) % $1::bigint, a, 'comment', now()
+    FROM generate_series(1, $1::bigint * 5) AS a, generate_series(1, 4) AS k
+    """,
+]
+
+
+@pytest.fixture(scope="session")
+def database() -> t.Iterator[str]:
+    """Schema with the tables of the application, filled with generated data and analyzed."""
+    asyncio.run(_create_schema())
+    yield SCHEMA
+    asyncio.run(_drop_schema())
+
+
+@pytest.fixture
+async def connection(database: str) -> t.AsyncIterator[asyncpg.Connection]:
+    """Plain asyncpg connection on the schema of `database`."""
+    connection = await _connect(database)
+    yield connection
+    await connection.close()
+
+
+@pytest.fixture(params=["sqlalchemy", "asyncpg"])
+async def unit_of_work(request: pytest.FixtureRequest, database: str) -> t.AsyncIterator[UnitOfWork]:
+    """Unit of work of each repository backend on the schema of `database`."""
+    if request.param == "sqlalchemy":
+        engine = create_async_engine(db_url(), connect_args={"server_settings": {"search_path": database}})
+        yield PostgresqlUnitOfWork(engine)
+        await engine.dispose()
+    else:
+        # asyncpg passes unknown DSN parameters as server settings.
+        dsn = db_url(driver="postgresql").update_query_dict({"search_path": database})
+        asyncpg_unit_of_work = AsyncpgUnitOfWork(dsn.render_as_string(hide_password=False), min_size=1, max_size=2)
+        yield asyncpg_unit_of_work
+        await asyncpg_unit_of_work.close()
+
+
+async def _connect(schema: str) -> asyncpg.Connection:
+    return await asyncpg.connect(
+        db_url(driver="postgresql").render_as_string(hide_password=False), server_settings={"search_path": schema}
+    )
+
+
+async def _create_schema() -> None:
+    connection = await _connect(SCHEMA)
+    try:
+        await connection.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await connection.execute(f"CREATE SCHEMA {SCHEMA}")
+        for table in tables.METADATA.sorted_tables:
+            await connection.execute(str(sa.schema.CreateTable(table).compile(dialect=_DIALECT)))
+            for index in table.indexes:
+                await connection.execute(str(sa.schema.CreateIndex(index).compile(dialect=_DIALECT)))
+        for sql in _SEED_SQL:
+            await connection.execute(sql, *([USERS] if "$1" in sql else []))
+        await connection.execute("ANALYZE")
+    finally:
+        await connection.close()
+
+
+async def _drop_schema() -> None:
+    connection = await _connect(SCHEMA)
+    try:
+        await connection.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    finally:
+        await connection.close()
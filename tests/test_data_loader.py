@@ -0,0 +1,81 @@
+"""Batching, deduplication, cancellation and clearing of data loaders."""
+
+import asyncio
+import typing as t
+
+import pytest
+
+from conduit.core.use_cases.data_loader import DataLoader, data_loader_scope, get_loader
+from conduit.impl.memory.unit_of_work import MemoryUnitOfWork
+
+
+class Batch:
+    """Batch function recording its calls, which wait for `release` when it is given."""
+
+    def __init__(self, release: asyncio.Event | None = None) -> None:
+        self.calls: list[list[int]] = []
+        self._release = release
+
+    async def __call__(self, keys: list[int]) -> t.Mapping[int, str]:
+        self.calls.append(keys)
+        if self._release is not None:
+            await self._release.wait()
+        return {key: str(key) for key in keys if key > 0}
+
+
+async def test_keys_requested_together_are_loaded_in_one_batch() -> None:
+    batch = Batch()
+    loader = DataLoader(batch, "")
+    one, many, two = await asyncio.gather(loader.load(1), loader.load_many([2, 1, -1]), loader.load(2))
+    assert (one, many, two) == ("1", {2: "2", 1: "1", -1: ""}, "2")
+    assert batch.calls == [[1, 2, -1]]
+
+
+async def test_loaded_keys_are_not_loaded_again() -> None:
+    batch = Batch()
+    loader = DataLoader(batch, "")
+    await loader.load(1)
+    assert await loader.load_many([1, 2]) == {1: "1", 2: "2"}
+    assert batch.calls == [[1], [2]]
+
+
+async def test_cancelling_a_waiter_does_not_fail_the_batch_for_the_others() -> None:
+    release = asyncio.Event()
+    batch = Batch(release)
+    loader = DataLoader(batch, "")
+    first = asyncio.create_task(loader.load(1))
+    second = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    release.set()
+    assert await second == "1"
+    assert first.cancelled()
+    assert batch.calls == [[1]]
+
+
+async def test_keys_of_a_failed_batch_are_loaded_again() -> None:
+    calls = 0
+
+    async def batch(keys: list[int]) -> t.Mapping[int, str]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("failed")
+        return {key: str(key) for key in keys}
+
+    loader = DataLoader(batch, "")
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+    assert await loader.load(1) == "1"
+
+
+async def test_writes_clear_the_loaders_of_the_scope() -> None:
+    unit_of_work = MemoryUnitOfWork()
+    with data_loader_scope():
+        loader = get_loader("key", Batch(), "")
+        async with unit_of_work.begin(read_only=True):
+            pass
+        assert get_loader("key", Batch(), "") is loader
+        async with unit_of_work.begin():
+            pass
+        assert get_loader("key", Batch(), "") is not loader
@@ -0,0 +1,100 @@
+"""Statements run by the read use cases of both backends.
+
+The counts are exact: a change adding a round trip to a use case has to update them. List use cases
+are run for a page of one item and a full page, a use case loading related data per item (N+1) needs
+more statements for the full page and fails.
+"""
+
+import typing as t
+
+import pytest
+
+from conduit.core.entities.article import ArticleSlug
+from conduit.core.entities.unit_of_work import UnitOfWork, collect_query_stats
+from conduit.core.entities.user import AuthToken, UserId, Username
+from conduit.core.use_cases.articles.feed import FeedArticlesInput, FeedArticlesUseCase
+from conduit.core.use_cases.articles.get import GetArticleInput, GetArticleUseCase
+from conduit.core.use_cases.articles.list import ListArticlesInput, ListArticlesUseCase
+from conduit.core.use_cases.articles.search import SearchArticlesInput, SearchArticlesUseCase
+from conduit.core.use_cases.comments.get_from_article import (
+    GetCommentsFromArticleInput,
+    GetCommentsFromArticleUseCase,
+)
+from conduit.core.use_cases.data_loader import data_loader_scope
+from conduit.core.use_cases.profiles.get import GetProfileInput, GetProfileUseCase
+from conduit.core.use_cases.tags.list import ListTagsInput, ListTagsUseCase
+from conduit.core.use_cases.tags.popular import ListPopularTagsInput, ListPopularTagsUseCase
+
+# Requests are made by user 1 about an article of theirs, so that the follow and favorite lookups run.
+TOKEN: t.Final = AuthToken("")
+USER_ID: t.Final = UserId(1)
+SLUG: t.Final = ArticleSlug("article-10000")
+
+# Runs a use case, list use cases for a page of the given size.
+Scenario = t.Callable[[UnitOfWork, int], t.Awaitable[object]]
+
+LIST_SCENARIOS: t.Final[dict[str, Scenario]] = {
+    "list_articles": lambda uow, limit: ListArticlesUseCase(uow).execute(
+        ListArticlesInput(token=TOKEN, user_id=USER_ID, limit=limit)
+    ),
+    "feed_articles": lambda uow, limit: FeedArticlesUseCase(uow).execute(
+        FeedArticlesInput(token=TOKEN, user_id=USER_ID, limit=limit)
+    ),
+    "search_articles": lambda uow, limit: SearchArticlesUseCase(uow).execute(
+        SearchArticlesInput(token=TOKEN, user_id=USER_ID, query="article", limit=limit)
+    ),
+    "get_comments_from_article": lambda uow, limit: GetCommentsFromArticleUseCase(uow).execute(
+        GetCommentsFromArticleInput(token=TOKEN, user_id=USER_ID, article_slug=SLUG, limit=limit)
+    ),
+    "list_tags": lambda uow, limit: ListTagsUseCase(uow).execute(ListTagsInput(limit=limit)),
+    "list_popular_tags": lambda uow, limit: ListPopularTagsUseCase(uow).execute(ListPopularTagsInput(limit=limit)),
+}
+SCENARIOS: t.Final[dict[str, Scenario]] = {
+    "get_article": lambda uow, _: GetArticleUseCase(uow).execute(
+        GetArticleInput(token=TOKEN, user_id=USER_ID, slug=SLUG)
+    ),
+    "get_profile": lambda uow, _: GetProfileUseCase(uow).execute(
+        GetProfileInput(token=TOKEN, user_id=USER_ID, username=Username("user2"))
+    ),
+}
+
+# Statements of a use case, on either backend and for any page size.
+STATEMENTS: t.Final = {
+    # Articles and their count, then authors, following, tags, favorites and favorite counts in a batch each.
+    "list_articles": 7,
+    # Like `list_articles` without following, the authors of a feed are followed by definition.
+    "feed_articles": 6,
+    # Like `list_articles`, the ranked articles are not counted.
+    "search_articles": 6,
+    # The article, the comments and their count in a transaction, then authors and following.
+    "get_comments_from_article": 7,
+    "list_tags": 1,
+    "list_popular_tags": 1,
+    "get_article": 6,
+    "get_profile": 2,
+}
+
+
+@pytest.mark.parametrize("limit", [1, 20])
+@pytest.mark.parametrize("name", sorted(LIST_SCENARIOS))
+async def test_list_statements(unit_of_work: UnitOfWork, name: str, limit: int) -> None:
+    assert await count_statements(unit_of_work, LIST_SCENARIOS[name], limit) == STATEMENTS[name]
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+async def test_statements(unit_of_work: UnitOfWork, name: str) -> None:
+    assert await count_statements(unit_of_work, SCENARIOS[name], 1) == STATEMENTS[name]
+
+
+def test_every_scenario_has_a_count() -> None:
+    assert STATEMENTS.keys() == LIST_SCENARIOS.keys() | SCENARIOS.keys()
+
+
+async def count_statements(unit_of_work: UnitOfWork, scenario: Scenario, limit: int) -> int:
+    # A warm-up run, so that one-off work such as loading type codecs is not counted.
+    with data_loader_scope():
+        await scenario(unit_of_work, limit)
+    # Like `data_loader_middleware` does for a request.
+    with data_loader_scope(), collect_query_stats() as stats:
+        await scenario(unit_of_work, limit)
+    return stats.statements
@@ -0,0 +1,161 @@
+"""Query plans of every prebuilt repository statement of both backends.
+
+A plan reading a large table sequentially fails, unless the statement reads the whole table on purpose. Plain
+`EXPLAIN` does not run the statement, so writes are checked too.
+"""
+
+import datetime as dt
+import importlib
+import json
+import typing as t
+
+import asyncpg
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
+
+from conduit.db import tables
+
+_DIALECT: t.Final = create_async_engine("postgresql+asyncpg://").dialect
+
+# Tables that grow with the number of users and articles.
+LARGE_TABLES: t.Final = frozenset(
+    table.name
+    for table in (
+        tables.USER,
+        tables.FOLLOWER,
+        tables.ARTICLE,
+        tables.TAG,
+        tables.ARTICLE_TAG,
+        tables.FAVORITE_ARTICLE,
+        tables.COMMENT,
+    )
+)
+
+# Statements that read a whole table on purpose.
+ALLOWED_SEQ_SCANS: t.Final = {
+    # `CommentFilter()` without an article pages through every comment.
+    "conduit.impl.comment_repository._SELECT_ALL_STMT",
+    "conduit.impl.comment_repository._COUNT_ALL_STMT",
+    "conduit.impl.asyncpg.comment_repository._SELECT_ALL_SQL",
+    "conduit.impl.asyncpg.comment_repository._COUNT_ALL_SQL",
+    # Counting all articles without a filter.
+    "conduit.impl.article_repository._COUNT_STMTS[-]",
+    "conduit.impl.asyncpg.article_repository._COUNT_SQL[-]",
+}
+
+SQLALCHEMY_MODULES: t.Final = [
+    "conduit.impl.article_repository",
+    "conduit.impl.comment_repository",
+    "conduit.impl.favorite_article_repository",
+    "conduit.impl.follower_repository",
+    "conduit.impl.tag_repository",
+    "conduit.impl.user_repository",
+]
+ASYNCPG_MODULES: t.Final = [
+    "conduit.impl.asyncpg.article_repository",
+    "conduit.impl.asyncpg.comment_repository",
+    "conduit.impl.asyncpg.favorite_article_repository",
+    "conduit.impl.asyncpg.follower_repository",
+    "conduit.impl.asyncpg.tag_repository",
+    "conduit.impl.asyncpg.user_repository",
+]
+
+
+def collect_statements() -> dict[str, str]:
+    """SQL of the statement constants of the repository modules, by qualified name."""
+    statements = {}
+    for module_name in SQLALCHEMY_MODULES:
+        for name, value in _module_constants(module_name, ("_STMT", "_STMTS")):
+            for suffix, stmt in _flatten(value):
+                statements[f"{module_name}.{name}{suffix}"] = _render(stmt)
+    for module_name in ASYNCPG_MODULES:
+        for name, value in _module_constants(module_name, ("_SQL",)):
+            for suffix, sql in _flatten(value):
+                statements[f"{module_name}.{name}{suffix}"] = sql
+    return statements
+
+
+def _module_constants(module_name: str, suffixes: tuple[str, ...]) -> t.Iterator[tuple[str, t.Any]]:
+    module = importlib.import_module(module_name)
+    for name, value in vars(module).items():
+        if name.startswith("_") and name.endswith(suffixes):
+            yield name, value
+
+
+def _flatten(value: t.Any) -> t.Iterator[tuple[str, t.Any]]:
+    """Yields statements of a constant, naming the filter variants of statement dicts."""
+    if not isinstance(value, dict):
+        yield "", value
+        return
+    for key, item in value.items():
+        fields = [field for field, is_set in key._asdict().items() if is_set]
+        yield f"[{'+'.join(fields) or '-'}]", item
+
+
+def _render(stmt: ClauseElement) -> str:
+    """Compiles a statement with 20-element lists in place of its expanding parameters."""
+    column_keys = None
+    if isinstance(stmt, sa.Insert):
+        # Without parameters an INSERT lists every column, generated ones can not be inserted.
+        column_keys = [column.key for column in stmt.table.c if column.computed is None]
+    compiled = stmt.compile(dialect=_DIALECT, column_keys=column_keys)
+    assert isinstance(compiled, SQLCompiler)
+    if not any(bind.expanding for bind in compiled.binds.values()):
+        return str(compiled)
+    values = {
+        name: [_sample_value("int8" if bind.type._type_affinity is sa.Integer else "text", i) for i in range(1, 21)]
+        if bind.expanding
+        else None
+        for name, bind in compiled.binds.items()
+    }
+    return str(stmt.params(values).compile(dialect=_DIALECT, compile_kwargs={"render_postcompile": True}))
+
+
+def _sample_value(type_name: str, n: int = 20) -> t.Any:
+    """Argument of a Postgres type, chosen to exist in the generated dataset."""
+    if type_name in ("int8", "int4"):
+        return n
+    if type_name == "timestamp":
+        return dt.datetime.utcnow()
+    if type_name == "bool":
+        return True
+    if type_name in ("float4", "float8"):
+        return float("inf")
+    return f"tag{n}"
+
+
+STATEMENTS: t.Final = collect_statements()
+
+
+@pytest.mark.parametrize("name", sorted(STATEMENTS.keys() - ALLOWED_SEQ_SCANS))
+async def test_no_seq_scan_of_large_tables(connection: asyncpg.Connection, name: str) -> None:
+    plan = await explain(connection, STATEMENTS[name])
+    relations = sorted(set(find_seq_scans(plan)))
+    assert not relations, f"sequential scan of {', '.join(relations)}:\n{json.dumps(plan, indent=2)}"
+
+
+def test_allowed_seq_scans_exist() -> None:
+    assert ALLOWED_SEQ_SCANS <= STATEMENTS.keys()
+
+
+async def explain(connection: asyncpg.Connection, sql: str) -> dict[str, t.Any]:
+    prepared = await connection.prepare(sql)
+    args = [
+        [_sample_value(parameter.name.removesuffix("[]"), i) for i in range(1, 21)]
+        if parameter.kind == "array"
+        else _sample_value(parameter.name)
+        for parameter in prepared.get_parameters()
+    ]
+    result = await connection.fetchval(f"EXPLAIN (FORMAT JSON) {sql}", *args)
+    plan: dict[str, t.Any] = json.loads(result)[0]["Plan"]
+    return plan
+
+
+def find_seq_scans(plan: dict[str, t.Any]) -> t.Iterator[str]:
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in LARGE_TABLES:
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from find_seq_scans(child)